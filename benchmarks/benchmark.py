@@ -0,0 +1,269 @@
+"""Measures the cost of PlotLearningCurve and KerasLearningCurve.
+
+The plots are driven through a fake display function, that records the
+size of each update instead of rendering it. The results are saved as JSON,
+such the results from different versions can be compared.
+
+Example:
+    python benchmarks/benchmark.py --output before.json
+    # ... change lrcurve
+    python benchmarks/benchmark.py --output after.json --compare before.json
+"""
+import sys
+import json
+import time
+import math
+import argparse
+import platform
+import itertools
+import subprocess
+import tracemalloc
+import contextlib
+import os.path as path
+from unittest import mock
+from datetime import datetime, timezone
+
+sys.path.insert(0, path.dirname(path.dirname(path.realpath(__file__))))
+from lrcurve import PlotLearningCurve
+
+class DisplayHandle:
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    def update(self, obj):
+        self.recorder.record(obj)
+
+class DisplayRecorder:
+    """A `display_fn` that only records the size of each update."""
+    def __init__(self):
+        self.sizes = []
+
+    def record(self, obj):
+        self.sizes.append(len(obj.data.encode('utf-8')))
+
+    def __call__(self, obj, display_id=None):
+        self.record(obj)
+        return DisplayHandle(self)
+
+@contextlib.contextmanager
+def _skip_setup_delay():
+    # The display transport waits 1 second for the frontend, when the figure
+    # is set up. There is no frontend here, and the wait is not part of the
+    # measurements, it only makes the benchmark slow.
+    with mock.patch.object(time, 'sleep', lambda seconds: None):
+        yield
+
+def _percentile(values, q):
+    if len(values) == 0:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def _plot_config(keys, facets):
+    facet_names = [f'facet{i}' for i in range(facets)]
+    return {
+        'mappings': {
+            f'key{i}': {
+                'line': 'train' if i % 2 == 0 else 'validation',
+                'facet': facet_names[(i // 2) % facets]
+            }
+            for i in range(keys)
+        },
+        'facet_config': {
+            name: { 'name': name, 'limit': [None, None], 'scale': 'linear' }
+            for name in facet_names
+        },
+        'xaxis_config': { 'name': 'Step', 'limit': [0, None] }
+    }
+
+def _drive_plot(points, keys, facets, draw_every, options):
+    recorder = DisplayRecorder()
+    plot = PlotLearningCurve(display_fn=recorder, **_plot_config(keys, facets), **options)
+    setup_updates = len(recorder.sizes)
+
+    append_time = 0
+    draw_times = []
+    for step in range(points):
+        y = { f'key{i}': math.exp(-step / points) + i for i in range(keys) }
+
+        start = time.perf_counter()
+        plot.append(step, y)
+        append_time += time.perf_counter() - start
+
+        if (step + 1) % draw_every == 0:
+            start = time.perf_counter()
+            plot.draw()
+            draw_times.append(time.perf_counter() - start)
+
+    updates = recorder.sizes[setup_updates:]
+    start = time.perf_counter()
+    plot.finalize()
+    finalize_time = time.perf_counter() - start
+    finalize_bytes = sum(recorder.sizes[setup_updates + len(updates):])
+
+    return {
+        'appends_per_second': points / append_time,
+        'draw_latency_mean': sum(draw_times) / len(draw_times) if draw_times else None,
+        'draw_latency_p95': _percentile(draw_times, 0.95),
+        'draw_latency_max': max(draw_times) if draw_times else None,
+        'updates': len(updates),
+        'bytes_per_update': sum(updates) / len(updates) if updates else None,
+        'finalize_seconds': finalize_time,
+        'finalize_bytes': finalize_bytes
+    }
+
+def _peak_memory(fn, *args):
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def benchmark_plot(points, keys, facets, draw_every, options):
+    with _skip_setup_delay():
+        result = _drive_plot(points, keys, facets, draw_every, options)
+        result['peak_memory_bytes'] = _peak_memory(_drive_plot, points, keys, facets, draw_every, options)
+    return result
+
+def _drive_keras(epochs, steps, granularity):
+    from lrcurve import KerasLearningCurve
+
+    recorder = DisplayRecorder()
+    callback = KerasLearningCurve(display_fn=recorder, granularity=granularity)
+    callback.params = { 'epochs': epochs, 'steps': steps }
+
+    start = time.perf_counter()
+    callback.on_train_begin()
+    for epoch in range(epochs):
+        for batch in range(steps):
+            callback.on_train_batch_end(batch, { 'loss': 1 / (epoch * steps + batch + 1) })
+        callback.on_epoch_end(epoch, { 'loss': 1 / (epoch + 1), 'val_loss': 1 / (epoch + 1) })
+    callback.on_train_end()
+    total_time = time.perf_counter() - start
+
+    return {
+        'batches_per_second': epochs * steps / total_time,
+        'updates': len(recorder.sizes),
+        'total_bytes': sum(recorder.sizes)
+    }
+
+def benchmark_keras(epochs, steps, granularity):
+    with _skip_setup_delay():
+        result = _drive_keras(epochs, steps, granularity)
+        result['peak_memory_bytes'] = _peak_memory(_drive_keras, epochs, steps, granularity)
+    return result
+
+_import_script = '''
+import sys, json, time
+start = time.perf_counter()
+import lrcurve
+print(json.dumps({
+    'import_seconds': time.perf_counter() - start,
+    'imports_tensorflow': 'tensorflow' in sys.modules,
+    'imports_ipython': 'IPython' in sys.modules
+}))
+'''
+
+def benchmark_import(repeats=5):
+    """Measures `import lrcurve` in a fresh interpreter, which should not
+    import TensorFlow or IPython."""
+    results = [
+        json.loads(subprocess.run(
+            [sys.executable, '-c', _import_script],
+            cwd=path.dirname(path.dirname(path.realpath(__file__))),
+            capture_output=True, text=True, check=True
+        ).stdout)
+        for _ in range(repeats)
+    ]
+    # The first import also compiles the bytecode, so the minimum is used
+    return {
+        **results[0],
+        'import_seconds': min(result['import_seconds'] for result in results)
+    }
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=path.dirname(path.realpath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(quick=False):
+    points = [1000, 10000] if quick else [1000, 10000, 100000]
+    keys = [2, 8]
+    facets = [1, 4]
+    draw_every = [1, 100]
+    options = {
+        'default': {},
+        'decimate': { 'decimate': True },
+        'float32': { 'encoding': 'float32' },
+        'retain': { 'retain_points': 1000, 'retain_max_bytes': 1024 * 1024 }
+    }
+
+    results = []
+    print('running import', file=sys.stderr)
+    results.append({ 'config': { 'benchmark': 'import' }, 'result': benchmark_import() })
+
+    for (option_name, option), n, k, f, d in itertools.product(options.items(), points, keys, facets, draw_every):
+        config = {
+            'benchmark': 'plot', 'options': option_name,
+            'points': n, 'keys': k, 'facets': f, 'draw_every': d
+        }
+        print(f'running {config}', file=sys.stderr)
+        results.append({ 'config': config, 'result': benchmark_plot(n, k, f, d, option) })
+
+    try:
+        import tensorflow.keras
+    except ModuleNotFoundError:
+        print('skipping keras benchmark, tensorflow is not installed', file=sys.stderr)
+    else:
+        for granularity in ['epoch', 'batch']:
+            config = { 'benchmark': 'keras', 'granularity': granularity, 'epochs': 20, 'steps': 100 }
+            print(f'running {config}', file=sys.stderr)
+            results.append({ 'config': config, 'result': benchmark_keras(20, 100, granularity) })
+
+    return {
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'results': results
+    }
+
+def compare(current, baseline):
+    """Prints the ratio between the current and the baseline results."""
+    baseline_results = {
+        json.dumps(item['config'], sort_keys=True): item['result'] for item in baseline['results']
+    }
+    print(f'comparing {current["revision"]} against {baseline["revision"]} (current / baseline)')
+    for item in current['results']:
+        baseline_result = baseline_results.get(json.dumps(item['config'], sort_keys=True))
+        if baseline_result is None:
+            continue
+        ratios = ', '.join(
+            f'{name}={value / baseline_result[name]:.2f}'
+            for name, value in item['result'].items()
+            if isinstance(value, (int, float)) and baseline_result.get(name)
+        )
+        print(f'{item["config"]}: {ratios}')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default='benchmark.json', help='where to save the results')
+    parser.add_argument('--compare', default=None, help='results to compare against')
+    parser.add_argument('--quick', action='store_true', help='only run the smaller configurations')
+    args = parser.parse_args()
+
+    current = run(quick=args.quick)
+    with open(args.output, 'w') as fp:
+        json.dump(current, fp, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as fp:
+            compare(current, json.load(fp))
+
+if __name__ == '__main__':
+    main()
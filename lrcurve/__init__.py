@@ -1,11 +1,20 @@
 
 from .plot_learning_curve import PlotLearningCurve
+from .plot_runs import PlotRuns
+from .metric_collector import MetricCollector, MetricClient
 
-try:
-    import tensorflow.keras as keras
-    from .keras_learning_curve import KerasLearningCurve
-except ModuleNotFoundError as e:
-    save_error = e
-    class KerasLearningCurve:
-        def __init__(self):
-            raise save_error
+def __getattr__(name):
+    # KerasLearningCurve is resolved on first access, such importing lrcurve
+    # doesn't import TensorFlow.
+    if name != 'KerasLearningCurve':
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    global KerasLearningCurve
+    try:
+        from .keras_learning_curve import KerasLearningCurve
+    except ModuleNotFoundError as e:
+        save_error = e
+        class KerasLearningCurve:
+            def __init__(self):
+                raise save_error
+    return KerasLearningCurve
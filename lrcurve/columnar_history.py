@@ -0,0 +1,209 @@
+from array import array
+from bisect import bisect_left
+
+def as_float64_buffer(values):
+    """Converts a sequence or an array-like (e.g. a NumPy array) of numbers
+    to a float64 buffer. Array-likes are converted as a whole."""
+    if isinstance(values, array) and values.typecode == 'd':
+        return array('d', values)
+    buffer = array('d')
+    if hasattr(values, '__array__'):
+        import numpy as np
+        buffer.frombytes(np.ascontiguousarray(values, dtype=np.float64).reshape(-1).tobytes())
+    else:
+        buffer.extend(float(value) for value in values)
+    return buffer
+
+def presence_mask(values, mask=None):
+    """Creates a presence mask for a float64 buffer. If `mask` is None,
+    the NaN values are considered missing. Otherwise `mask` is a sequence
+    or an array-like of booleans, where true means present."""
+    if mask is not None and hasattr(mask, '__array__'):
+        import numpy as np
+        return bytearray(np.asarray(mask, dtype=bool).reshape(-1).view(np.uint8).tobytes())
+    if isinstance(mask, (bytes, bytearray)):
+        return bytearray(mask)
+    if mask is not None:
+        return bytearray(bool(present) for present in mask)
+
+    try:
+        import numpy as np
+    except ModuleNotFoundError:
+        return bytearray(value == value for value in values)
+    return bytearray((~np.isnan(np.frombuffer(values, dtype=np.float64))).view(np.uint8).tobytes())
+
+def _offset_indices(indices, offset):
+    """Returns a copy of an int64 index buffer, with `offset` added."""
+    try:
+        import numpy as np
+    except ModuleNotFoundError:
+        return array('q', (index + offset for index in indices))
+    if len(indices) == 0 or offset == 0:
+        return array('q', indices)
+    shifted = array('q')
+    shifted.frombytes((np.frombuffer(indices, dtype=np.int64) + offset).tobytes())
+    return shifted
+
+def _compress(values, mask):
+    """Converts a float64 buffer and a presence mask to an int64 buffer of
+    the present indices, and a float64 buffer of the present values."""
+    if mask.count(0) == 0:
+        return (array('q', range(len(values))), array('d', values))
+    try:
+        import numpy as np
+    except ModuleNotFoundError:
+        indices = array('q', (i for i, present in enumerate(mask) if present))
+        return (indices, array('d', (values[i] for i in indices)))
+    present = np.frombuffer(bytes(mask), dtype=np.uint8).astype(bool)
+    indices, compressed = (array('q'), array('d'))
+    indices.frombytes(np.flatnonzero(present).astype(np.int64).tobytes())
+    compressed.frombytes(np.frombuffer(values, dtype=np.float64)[present].tobytes())
+    return (indices, compressed)
+
+class ColumnarHistory:
+    """Column oriented storage of the appended learning curve data.
+
+    Storing every row as `[x, {key: value}]` costs a list, a dict, and a
+    boxed float per value. Instead, the x values are stored in one shared
+    float64 buffer, and each key stores the indices of the rows it is
+    included in and the values, as an int64 and a float64 buffer. A key
+    therefore only uses memory for the rows it is included in, which keeps
+    many sparse keys, such as the runs of a `PlotRuns`, cheap. The cost is
+    16 bytes per value, where a value buffer and presence mask costs 9
+    bytes per row, so a key included in every row uses 7 bytes more.
+
+    Example:
+        history = ColumnarHistory()
+        history.append(0, { 'loss': 1.0 })
+        history.append(1, { 'loss': 0.5, 'val_loss': 0.7 })
+        history.rows()  # [[0.0, {'loss': 1.0}], [1.0, {'loss': 0.5, 'val_loss': 0.7}]]
+    """
+    def __init__(self):
+        self._x = array('d')
+        self._indices = dict()
+        self._values = dict()
+
+    def __len__(self):
+        return len(self._x)
+
+    def keys(self):
+        """The keys that have been observed so far."""
+        return self._values.keys()
+
+    def x(self):
+        """The buffer containing all x values."""
+        return self._x
+
+    def _bounds(self, key, start, stop):
+        indices = self._indices[key]
+        return (bisect_left(indices, start), bisect_left(indices, stop))
+
+    def column(self, key, start=0, stop=None):
+        """Returns the values of a key in the rows `[start, stop)`, as an
+        `(indices, values)` tuple of an int64 and a float64 buffer. The row
+        indices are relative to `start`."""
+        stop = len(self._x) if stop is None else stop
+        first, last = self._bounds(key, start, stop)
+        return (
+            _offset_indices(self._indices[key][first:last], -start),
+            self._values[key][first:last]
+        )
+
+    def _add_key(self, key):
+        if key not in self._values:
+            self._indices[key] = array('q')
+            self._values[key] = array('d')
+
+    def append(self, x, y):
+        """Appends a row.
+
+        Arguments:
+            x: float - The x axis value.
+            y: dict - A mapping between the key and the float value.
+        """
+        row = len(self._x)
+        self._x.append(x)
+        for key, value in y.items():
+            self._add_key(key)
+            self._indices[key].append(row)
+            self._values[key].append(value)
+
+    def extend(self, x, y):
+        """Appends many rows at once.
+
+        Arguments:
+            x: array('d') - The x axis values.
+            y: dict - A mapping between the key and a `(values, mask)` tuple,
+                where `values` is an `array('d')` and `mask` is a bytearray,
+                both with the same length as `x`.
+        """
+        self.extend_sparse(x, {
+            key: _compress(values, mask) for key, (values, mask) in y.items()
+        })
+
+    def extend_sparse(self, x, y):
+        """Appends many rows at once, given only the present values.
+
+        Arguments:
+            x: array('d') - The x axis values.
+            y: dict - A mapping between the key and an `(indices, values)`
+                tuple, where `indices` is an `array('q')` of ascending row
+                indices, relative to the first row of `x`, and `values` is an
+                `array('d')` of the same length.
+        """
+        rows = len(self._x)
+        self._x.extend(x)
+        for key, (indices, values) in y.items():
+            self._add_key(key)
+            self._indices[key].extend(_offset_indices(indices, rows))
+            self._values[key].extend(values)
+
+    def discard(self, count):
+        """Removes the first `count` rows."""
+        del self._x[:count]
+        for key, indices in self._indices.items():
+            first = bisect_left(indices, count)
+            self._indices[key] = _offset_indices(indices[first:], -count)
+            del self._values[key][:first]
+
+    def columns(self, start=0, stop=None):
+        """Returns the rows in `[start, stop)` as a dict mapping each key
+        to an `(x, values)` tuple of buffers, containing only the present
+        values. Keys without any values are excluded.
+        """
+        stop = len(self._x) if stop is None else stop
+        columns = dict()
+        for key, indices in self._indices.items():
+            first, last = self._bounds(key, start, stop)
+            if first == last:
+                continue
+            elif last - first == stop - start:
+                columns[key] = (self._x[start:stop], self._values[key][first:last])
+            else:
+                columns[key] = (
+                    array('d', (self._x[i] for i in indices[first:last])),
+                    self._values[key][first:last]
+                )
+        return columns
+
+    def rows(self, start=0, stop=None):
+        """Returns the rows in `[start, stop)` as `[x, {key: value}]` lists.
+
+        This is the format `window.appendLearningCurve` expects.
+        """
+        stop = len(self._x) if stop is None else stop
+        rows = [[self._x[i], dict()] for i in range(start, stop)]
+        for key, indices in self._indices.items():
+            first, last = self._bounds(key, start, stop)
+            values = self._values[key]
+            for i in range(first, last):
+                rows[indices[i] - start][1][key] = values[i]
+        return rows
+
+    def nbytes(self):
+        """The memory used by the buffers, in bytes."""
+        return (
+            self._x.itemsize * len(self._x) +
+            sum(indices.itemsize * len(indices) for indices in self._indices.values()) +
+            sum(values.itemsize * len(values) for values in self._values.values())
+        )
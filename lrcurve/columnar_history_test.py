@@ -0,0 +1,72 @@
+from array import array
+from nose.tools import *
+
+from lrcurve.columnar_history import ColumnarHistory, as_float64_buffer, presence_mask
+
+def test_rows_roundtrip():
+    history = ColumnarHistory()
+    history.append(0, { 'loss': 1 })
+    history.append(1, { 'loss': 0.5, 'val_loss': 0.75 })
+    history.append(2, { 'val_loss': 0.25 })
+
+    assert_equal(len(history), 3)
+    assert_equal(history.rows(), [
+        [0, { 'loss': 1 }],
+        [1, { 'loss': 0.5, 'val_loss': 0.75 }],
+        [2, { 'val_loss': 0.25 }]
+    ])
+    assert_equal(history.rows(1, 2), [
+        [1, { 'loss': 0.5, 'val_loss': 0.75 }]
+    ])
+
+def test_keys_are_stored_sparsely():
+    history = ColumnarHistory()
+    history.append(0, { 'loss': 1 })
+    history.append(1, { 'loss': 1 })
+    history.append(2, { 'val_loss': 1 })
+
+    indices, values = history.column('val_loss')
+    assert_equal(list(indices), [2])
+    assert_equal(list(values), [1])
+    assert_equal(history.nbytes(), 3 * 8 + 3 * 16)
+
+    indices, values = history.column('loss', 1)
+    assert_equal(list(indices), [0])
+
+def test_discard():
+    history = ColumnarHistory()
+    history.append(0, { 'loss': 1 })
+    history.append(1, { 'val_loss': 2 })
+    history.append(2, { 'loss': 3 })
+    history.discard(1)
+
+    assert_equal(history.rows(), [
+        [1, { 'val_loss': 2 }],
+        [2, { 'loss': 3 }]
+    ])
+    assert_equal(list(history.column('loss')[0]), [1])
+
+def test_extend():
+    history = ColumnarHistory()
+    history.append(0, { 'loss': 1 })
+    history.extend(array('d', [1, 2]), {
+        'val_loss': (array('d', [0.5, 0]), bytearray([1, 0]))
+    })
+
+    assert_equal(history.rows(), [
+        [0, { 'loss': 1 }],
+        [1, { 'val_loss': 0.5 }],
+        [2, {}]
+    ])
+    history.extend_sparse(array('d', [3, 4]), {
+        'loss': (array('q', [1]), array('d', [0.25]))
+    })
+    assert_equal(history.rows(3), [
+        [3, {}],
+        [4, { 'loss': 0.25 }]
+    ])
+
+def test_presence_mask():
+    values = as_float64_buffer([1, float('nan'), 3])
+    assert_equal(list(presence_mask(values)), [1, 0, 1])
+    assert_equal(list(presence_mask(values, [True, True, False])), [1, 1, 0])
@@ -0,0 +1,97 @@
+import time
+import threading
+
+def _default_comm_fn(**kwargs):
+    from comm import create_comm
+    return create_comm(**kwargs)
+
+class CommTransport:
+    """Sends the plot updates over a Jupyter comm, with acknowledgements.
+
+    The comm is opened with the target name `lrcurve`, which is registered by
+    `learning_curve.js`. The frontend sends a `ready` message once the comm is
+    opened, and an `ack` message after each update has been processed.
+
+    The acknowledgements are used for backpressure. When `max_in_flight`
+    updates are unacknowledged, `.can_send()` returns false, such that the
+    caller can coalesce the data into fewer updates. Note that the kernel
+    only processes the acknowledgements when it is not busy. Therefore,
+    `.can_send()` also returns true when nothing has been sent for
+    `ack_timeout` seconds.
+
+    Arguments:
+        comm_fn: function - Creates the comm, the default is
+            `comm.create_comm`.
+        on_close: function - Called if the frontend closes the comm, which
+            happens if the frontend does not support the `lrcurve` target.
+        on_fetch: function - Called with the message, when the frontend
+            requests the detail of a zoomed x-range.
+        max_in_flight: int - The maximal number of unacknowledged updates.
+        ack_timeout: number - Seconds to wait for an acknowledgement.
+    """
+    def __init__(self, comm_fn=None, on_close=None, on_fetch=None, max_in_flight=2, ack_timeout=1):
+        comm_fn = _default_comm_fn if comm_fn is None else comm_fn
+
+        self._lock = threading.Lock()
+        self._max_in_flight = max_in_flight
+        self._ack_timeout = ack_timeout
+        self._ready = False
+        self._closed = False
+        self._sent = 0
+        self._acknowledged = 0
+        self._last_send = -ack_timeout
+        self._on_close_fn = on_close
+        self._on_fetch_fn = on_fetch
+
+        self._comm = comm_fn(target_name='lrcurve', data={})
+        self._comm.on_msg(self._on_msg)
+        self._comm.on_close(self._on_close)
+
+    @property
+    def ready(self):
+        """True when the frontend has confirmed the comm is open."""
+        return self._ready
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def _on_msg(self, msg):
+        data = msg['content']['data']
+        with self._lock:
+            if data.get('event') == 'ready':
+                self._ready = True
+            elif data.get('event') == 'ack':
+                self._ready = True
+                self._acknowledged = max(self._acknowledged, data['seq'])
+
+        # The fetch is answered using .send(), so the lock must be released
+        if data.get('event') == 'fetch' and self._on_fetch_fn is not None:
+            self._on_fetch_fn(data)
+
+    def _on_close(self, msg):
+        self._closed = True
+        if self._on_close_fn is not None:
+            self._on_close_fn()
+
+    def can_send(self):
+        """Returns false, when too many updates are unacknowledged."""
+        with self._lock:
+            return (
+                self._sent - self._acknowledged < self._max_in_flight or
+                time.perf_counter() - self._last_send >= self._ack_timeout
+            )
+
+    def send(self, method, id, **kwargs):
+        """Sends an update, where `method` is either `setup`, `reconfigure`,
+        `append`, or `detail`."""
+        with self._lock:
+            self._sent += 1
+            self._last_send = time.perf_counter()
+            seq = self._sent
+        self._comm.send({ 'method': method, 'id': id, 'seq': seq, **kwargs })
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._comm.close()
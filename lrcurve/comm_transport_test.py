@@ -0,0 +1,73 @@
+import time
+from nose.tools import *
+
+from lrcurve.comm_transport import CommTransport
+
+class FakeComm:
+    def __init__(self, target_name, data):
+        self.target_name = target_name
+        self.messages = []
+        self.closed = False
+
+    def on_msg(self, callback):
+        self.msg_callback = callback
+
+    def on_close(self, callback):
+        self.close_callback = callback
+
+    def send(self, data):
+        self.messages.append(data)
+
+    def close(self):
+        self.closed = True
+
+    def receive(self, data):
+        self.msg_callback({ 'content': { 'data': data } })
+
+def comm_replacer(comms):
+    def comm_fn(**kwargs):
+        comm = FakeComm(**kwargs)
+        comms.append(comm)
+        return comm
+    return comm_fn
+
+def test_ready_and_acknowledgement():
+    comms = []
+    transport = CommTransport(comm_fn=comm_replacer(comms), max_in_flight=2, ack_timeout=60)
+    comm, = comms
+    assert_equal(comm.target_name, 'lrcurve')
+    assert_false(transport.ready)
+
+    comm.receive({ 'event': 'ready' })
+    assert_true(transport.ready)
+
+    transport.send('append', 'id', data=[])
+    assert_true(transport.can_send())
+    transport.send('append', 'id', data=[])
+    assert_false(transport.can_send())
+
+    comm.receive({ 'event': 'ack', 'seq': 2 })
+    assert_true(transport.can_send())
+    assert_equal([message['seq'] for message in comm.messages], [1, 2])
+
+def test_ack_timeout():
+    transport = CommTransport(comm_fn=comm_replacer([]), max_in_flight=1, ack_timeout=0.05)
+    transport.send('append', 'id', data=[])
+    assert_false(transport.can_send())
+    time.sleep(0.1)
+    assert_true(transport.can_send())
+
+def test_close():
+    closed = []
+    comms = []
+    transport = CommTransport(comm_fn=comm_replacer(comms), on_close=lambda: closed.append(True))
+    comms[0].close_callback({})
+    assert_true(transport.closed)
+    assert_equal(closed, [True])
+
+def test_fetch():
+    fetched = []
+    comms = []
+    transport = CommTransport(comm_fn=comm_replacer(comms), on_fetch=fetched.append)
+    comms[0].receive({ 'event': 'fetch', 'request': 1, 'range': [0, 10], 'points': 600 })
+    assert_equal(fetched, [{ 'event': 'fetch', 'request': 1, 'range': [0, 10], 'points': 600 }])
@@ -0,0 +1,154 @@
+import math
+from array import array
+
+class MinMaxDecimator:
+    """Incremental per-pixel min/max decimation of the learning curve data.
+
+    The x-axis is divided into at most `buckets` buckets of equal width,
+    typically one per horizontal pixel. For each key, only the minimum and
+    maximum point within each bucket is kept, as those are the only points
+    that can change the rendered line.
+
+    The bucket width starts out as the distance between the first two
+    distinct x values. When an x value falls beyond the last bucket, the
+    bucket width is doubled by merging neighbouring buckets, thus the older
+    ranges are re-decimated as the x-axis grows.
+
+    Example:
+        decimator = MinMaxDecimator(600)
+        for step in range(100000):
+            decimator.add('loss', step, compute_loss())
+        options, rows = decimator.flush()
+    """
+    def __init__(self, buckets):
+        self._buckets = buckets
+        self._origin = None
+        self._width = None
+        self._stats = dict()
+        self._lowest_x = dict()
+
+        self._reset = True
+        self._dirty_from = None
+
+    def _bucket_index(self, x):
+        if self._origin is None:
+            self._origin = x
+        if self._width is None and x != self._origin:
+            self._width = abs(x - self._origin)
+
+        if x < self._origin:
+            # Points before the origin breaks the ordering of the buckets,
+            # so put them in the first bucket and redraw everything.
+            self._reset = True
+            return 0
+        if self._width is None:
+            return 0
+
+        index = int((x - self._origin) // self._width)
+        while index >= self._buckets:
+            self._merge()
+            index = int((x - self._origin) // self._width)
+        return index
+
+    def _merge(self):
+        self._width *= 2
+        self._reset = True
+
+        for key, key_stats in self._stats.items():
+            merged = dict()
+            for index, (min_x, min_y, max_x, max_y) in key_stats.items():
+                if index // 2 not in merged:
+                    merged[index // 2] = [min_x, min_y, max_x, max_y]
+                else:
+                    stats = merged[index // 2]
+                    if min_y < stats[1]:
+                        stats[0:2] = (min_x, min_y)
+                    if max_y > stats[3]:
+                        stats[2:4] = (max_x, max_y)
+            self._stats[key] = merged
+
+        lowest_x = dict()
+        for index, x in self._lowest_x.items():
+            lowest_x[index // 2] = min(x, lowest_x.get(index // 2, math.inf))
+        self._lowest_x = lowest_x
+
+    def add(self, key, x, y):
+        """Adds the point `(x, y)` to the line of `key`."""
+        if math.isnan(y):
+            return
+
+        index = self._bucket_index(x)
+        self._lowest_x[index] = min(x, self._lowest_x.get(index, math.inf))
+        if self._dirty_from is None or index < self._dirty_from:
+            self._dirty_from = index
+
+        key_stats = self._stats.setdefault(key, dict())
+        if index not in key_stats:
+            key_stats[index] = [x, y, x, y]
+        else:
+            stats = key_stats[index]
+            if y < stats[1]:
+                stats[0:2] = (x, y)
+            if y > stats[3]:
+                stats[2:4] = (x, y)
+
+    def extend(self, history, start=0, stop=None):
+        """Adds the rows in `[start, stop)` of a `ColumnarHistory`."""
+        for key, (xs, ys) in history.columns(start, stop).items():
+            for x, y in zip(xs, ys):
+                self.add(key, x, y)
+
+    def columns(self, start=0):
+        """Returns the decimated points in bucket `start` and onwards as a
+        dict mapping each key to an `(x, values)` tuple of buffers."""
+        columns = dict()
+        for key, key_stats in self._stats.items():
+            xs, ys = (array('d'), array('d'))
+            for index in sorted(key_stats.keys()):
+                if index < start:
+                    continue
+                min_x, min_y, max_x, max_y = key_stats[index]
+                if min_x == max_x:
+                    xs.append(min_x)
+                    ys.append(min_y)
+                elif min_x < max_x:
+                    xs.extend((min_x, max_x))
+                    ys.extend((min_y, max_y))
+                else:
+                    xs.extend((max_x, min_x))
+                    ys.extend((max_y, min_y))
+            if len(xs) > 0:
+                columns[key] = (xs, ys)
+        return columns
+
+    def rows(self, start=0):
+        """Returns the decimated points in bucket `start` and onwards as
+        `[x, {key: value}]` rows."""
+        return [
+            [x, { key: y }]
+            for key, (xs, ys) in self.columns(start).items()
+            for x, y in zip(xs, ys)
+        ]
+
+    def flush(self, columnar=False):
+        """Returns the changes since the last flush as `(options, rows)`.
+
+        The options tells `window.appendLearningCurve` which of the previously
+        sent points should be removed before the rows are appended. Either all
+        points (`reset`), or the points where x is at least `truncate`.
+
+        If `columnar` is true, the points are returned in the format of
+        `.columns()` instead of `.rows()`.
+        """
+        serialize = self.columns if columnar else self.rows
+        if self._reset:
+            options, rows = ({ 'reset': True }, serialize())
+        elif self._dirty_from is not None:
+            options = { 'truncate': self._lowest_x[self._dirty_from] }
+            rows = serialize(self._dirty_from)
+        else:
+            options, rows = (None, serialize(self._buckets))
+
+        self._reset = False
+        self._dirty_from = None
+        return (options, rows)
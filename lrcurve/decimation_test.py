@@ -0,0 +1,61 @@
+import math
+from nose.tools import *
+
+from lrcurve.decimation import MinMaxDecimator
+from lrcurve.columnar_history import ColumnarHistory
+
+def apply_update(frontend, options, rows):
+    # Emulates LearningCurveData in learning_curve.js
+    if options is not None and options.get('reset', False):
+        frontend.clear()
+    elif options is not None and 'truncate' in options:
+        for key, storage in frontend.items():
+            frontend[key] = [(x, y) for x, y in storage if x < options['truncate']]
+    for x, y in rows:
+        for key, value in y.items():
+            frontend.setdefault(key, []).append((x, value))
+
+def test_points_are_bounded_by_buckets():
+    decimator = MinMaxDecimator(50)
+    for step in range(10000):
+        decimator.add('loss', step, math.sin(step))
+
+    rows = decimator.rows()
+    assert_true(len(rows) <= 2 * 50)
+    assert_equal(min(y['loss'] for x, y in rows), min(math.sin(step) for step in range(10000)))
+    assert_equal(max(y['loss'] for x, y in rows), max(math.sin(step) for step in range(10000)))
+
+def test_no_decimation_of_short_histories():
+    decimator = MinMaxDecimator(50)
+    for step in range(20):
+        decimator.add('loss', step, step)
+
+    assert_equal(decimator.rows(), [[step, { 'loss': step }] for step in range(20)])
+
+def test_incremental_updates_match_full_decimation():
+    frontend = dict()
+    decimator = MinMaxDecimator(30)
+    for step in range(2000):
+        decimator.add('loss', step, math.cos(step / 7))
+        if step % 10 == 0:
+            decimator.add('val_loss', step, math.cos(step / 11))
+        if step % 13 == 0:
+            apply_update(frontend, *decimator.flush())
+    apply_update(frontend, *decimator.flush())
+
+    expected = dict()
+    apply_update(expected, None, decimator.rows())
+    assert_equal(frontend, expected)
+
+def test_extend_from_history():
+    history = ColumnarHistory()
+    for step in range(100):
+        history.append(step, { 'loss': step, 'val_loss': -step })
+
+    decimator = MinMaxDecimator(10)
+    decimator.extend(history)
+    options, rows = decimator.flush()
+
+    assert_equal(options, { 'reset': True })
+    assert_true(len(rows) <= 2 * 2 * 10)
+    assert_equal(decimator.flush(), (None, []))
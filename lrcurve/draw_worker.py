@@ -0,0 +1,54 @@
+import threading
+
+class DrawWorker:
+    """Calls `flush_fn` on a background thread, whenever it is scheduled.
+
+    Calling `.schedule()` is cheap, it only wakes up the worker thread. If
+    `.schedule()` is called while `flush_fn` is running, `flush_fn` is
+    called once more afterwards, thus many calls are coalesced into one.
+
+    An exception raised by `flush_fn` stops the worker, and is raised again
+    by the next call to `.schedule()` or `.cancel()`.
+
+    Arguments:
+        flush_fn: function - The function to call, it takes no arguments.
+    """
+    def __init__(self, flush_fn):
+        self._flush_fn = flush_fn
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._error = None
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = (self._error, None)
+            raise error
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopped:
+                return
+
+            try:
+                self._flush_fn()
+            except Exception as error:
+                self._error = error
+                return
+
+    def schedule(self):
+        """Ensures `flush_fn` will be called, once the worker is ready."""
+        self._raise_error()
+        self._wakeup.set()
+
+    def cancel(self):
+        """Stops the worker. If `flush_fn` is running, this waits for it to
+        complete."""
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join()
+        self._raise_error()
@@ -0,0 +1,50 @@
+import threading
+from nose.tools import *
+
+from lrcurve.draw_worker import DrawWorker
+
+def test_calls_are_coalesced():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+    done = threading.Event()
+    def flush():
+        calls.append(True)
+        if len(calls) == 1:
+            started.set()
+            release.wait()
+        else:
+            done.set()
+
+    worker = DrawWorker(flush)
+    worker.schedule()
+    started.wait()
+    # Scheduled while the first call is running, which is coalesced into one call
+    for _ in range(100):
+        worker.schedule()
+    release.set()
+    done.wait()
+    worker.cancel()
+
+    assert_equal(len(calls), 2)
+
+def test_runs_on_another_thread():
+    threads = []
+    called = threading.Event()
+    worker = DrawWorker(lambda: (threads.append(threading.current_thread()), called.set()))
+    worker.schedule()
+    called.wait()
+    worker.cancel()
+
+    assert_equal(len(threads), 1)
+    assert_not_equal(threads[0], threading.current_thread())
+
+@raises(RuntimeError)
+def test_error_is_raised_again():
+    def flush():
+        raise RuntimeError('failed')
+    worker = DrawWorker(flush)
+    worker.schedule()
+    # The worker stops after the error
+    worker._thread.join()
+    worker.schedule()
@@ -0,0 +1,90 @@
+import time
+import threading
+
+class AdaptiveFlushTimer:
+    """Rate limited calls to `flush_fn` from a background thread.
+
+    Calling `.schedule()` is cheap and can be done as often as desired. It
+    ensures that `flush_fn` will be called within the current interval. The
+    interval is at least `1 / max_calls_per_second`, but it is increased when
+    `flush_fn` is slow, such that `flush_fn` at most takes up a `max_load`
+    fraction of the time.
+
+    An exception raised by `flush_fn` is raised again by the next call to
+    `.schedule()` or `.cancel()`, like `DrawWorker`.
+
+    Arguments:
+        flush_fn: function - The function to call, it takes no arguments.
+        max_calls_per_second: number - The maximal rate of calls.
+        max_load: number - The maximal fraction of time spent in `flush_fn`.
+        clock: function - Returns the current time in seconds, the default
+            is `time.perf_counter` (mostly useful for internal testing).
+        timer_fn: function - Creates a timer, that calls a function after a
+            delay in seconds, the default is `threading.Timer` (mostly useful
+            for internal testing).
+    """
+    def __init__(self, flush_fn, max_calls_per_second, max_load=0.1, clock=None, timer_fn=None):
+        if not isinstance(max_calls_per_second, (int, float)) or max_calls_per_second <= 0:
+            raise ValueError(f'max_updates_per_second must be a positive number, was {max_calls_per_second}')
+
+        self._flush_fn = flush_fn
+        self._min_interval = 1 / max_calls_per_second
+        self._max_load = max_load
+        self._clock = time.perf_counter if clock is None else clock
+        self._timer_fn = threading.Timer if timer_fn is None else timer_fn
+
+        self._lock = threading.Lock()
+        self._timer = None
+        self._cost = 0
+        self._interval = self._min_interval
+        self._last_call = -self._min_interval
+        self._error = None
+
+    @property
+    def interval(self):
+        """The current interval in seconds, between calls to `flush_fn`."""
+        return self._interval
+
+    def _raise_error(self):
+        with self._lock:
+            error, self._error = (self._error, None)
+        if error is not None:
+            raise error
+
+    def schedule(self):
+        """Ensures `flush_fn` will be called, once the interval allows it."""
+        self._raise_error()
+        with self._lock:
+            if self._timer is not None:
+                return
+
+            delay = max(0, self._last_call + self._interval - self._clock())
+            self._timer = self._timer_fn(delay, self._call)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self):
+        """Cancels the scheduled call, if it has not started yet."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._raise_error()
+
+    def _call(self):
+        with self._lock:
+            self._timer = None
+            self._last_call = start = self._clock()
+
+        try:
+            self._flush_fn()
+        except Exception as error:
+            with self._lock:
+                self._error = error
+            return
+
+        # Use an exponential moving average of the cost, such a single
+        # slow update does not throttle the plot for a long time.
+        cost = self._clock() - start
+        self._cost = 0.8 * self._cost + 0.2 * cost
+        self._interval = max(self._min_interval, self._cost / self._max_load)
@@ -0,0 +1,106 @@
+from nose.tools import *
+
+from lrcurve.flush_timer import AdaptiveFlushTimer
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+class FakeTimer:
+    def __init__(self, delay, fn):
+        self.delay = delay
+        self.fn = fn
+        self.started = False
+        self.cancelled = False
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+def timer_replacer(timers):
+    def timer_fn(delay, fn):
+        timer = FakeTimer(delay, fn)
+        timers.append(timer)
+        return timer
+    return timer_fn
+
+def test_calls_are_rate_limited():
+    calls = []
+    clock = FakeClock()
+    timers = []
+    timer = AdaptiveFlushTimer(lambda: calls.append(clock.now), 20,
+                               clock=clock, timer_fn=timer_replacer(timers))
+
+    # The first call is not delayed
+    timer.schedule()
+    timer.schedule()
+    assert_equal(len(timers), 1)
+    assert_equal(timers[0].delay, 0)
+    assert_true(timers[0].started)
+    timers[0].fn()
+
+    # Later calls are delayed by the interval
+    clock.now = 0.01
+    timer.schedule()
+    timer.schedule()
+    assert_equal(len(timers), 2)
+    assert_almost_equal(timers[1].delay, 0.04)
+    clock.now = 0.05
+    timers[1].fn()
+
+    # Once the interval has passed, the call is not delayed
+    clock.now = 1
+    timer.schedule()
+    assert_equal(timers[2].delay, 0)
+    assert_equal(calls, [0, 0.05])
+
+def test_interval_adapts_to_cost():
+    clock = FakeClock()
+    timers = []
+
+    def flush():
+        clock.now += 0.02
+
+    timer = AdaptiveFlushTimer(flush, 1000, max_load=0.1, clock=clock, timer_fn=timer_replacer(timers))
+    timer.schedule()
+    timers[0].fn()
+
+    # The moving average of the cost is 0.2 * 0.02, which must be at most
+    # a 0.1 fraction of the interval
+    assert_almost_equal(timer.interval, 0.04)
+
+def test_cancel():
+    calls = []
+    timers = []
+    timer = AdaptiveFlushTimer(lambda: calls.append(True), 1,
+                               clock=FakeClock(), timer_fn=timer_replacer(timers))
+    timer.schedule()
+    timers[0].fn()
+    timer.schedule()
+    timer.cancel()
+
+    assert_true(timers[1].cancelled)
+    assert_equal(len(calls), 1)
+
+    # A new call can be scheduled after cancelling
+    timer.schedule()
+    assert_equal(len(timers), 3)
+
+@raises(ValueError)
+def test_max_calls_per_second_is_not_positive():
+    AdaptiveFlushTimer(lambda: None, 0)
+
+@raises(RuntimeError)
+def test_error_is_raised_again():
+    def flush():
+        raise RuntimeError('failed')
+    timers = []
+    timer = AdaptiveFlushTimer(flush, 20, clock=FakeClock(), timer_fn=timer_replacer(timers))
+    timer.schedule()
+    timers[0].fn()
+    timer.schedule()
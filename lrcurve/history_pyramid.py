@@ -0,0 +1,188 @@
+import math
+from array import array
+
+# The statistics stored for each key in a summary
+_fields = ('min_x', 'min_y', 'max_x', 'max_y', 'total', 'count')
+
+def _merge_stats(stats, other):
+    if other[5] == 0:
+        return stats
+    if stats[5] == 0:
+        return list(other)
+    if other[1] < stats[1]:
+        stats[0:2] = other[0:2]
+    if other[3] > stats[3]:
+        stats[2:4] = other[2:4]
+    stats[4] += other[4]
+    stats[5] += other[5]
+    return stats
+
+class _SummaryLevel:
+    """The summaries of one level, in ascending x order. Each summary covers
+    the range `[x_start, x_end]`, and stores the statistics of each key as
+    columns of float64 buffers."""
+    def __init__(self):
+        self.x_start = array('d')
+        self.x_end = array('d')
+        self.columns = dict()
+
+    def __len__(self):
+        return len(self.x_start)
+
+    def stats(self, index):
+        """Returns the statistics of the summary at `index`, for each key."""
+        return {
+            key: [column[index] for column in columns]
+            for key, columns in self.columns.items()
+            if columns[5][index] > 0
+        }
+
+    def append(self, x_start, x_end, stats):
+        rows = len(self.x_start)
+        for key in stats.keys():
+            if key not in self.columns:
+                self.columns[key] = tuple(array('d', bytes(8 * rows)) for _ in _fields)
+
+        self.x_start.append(x_start)
+        self.x_end.append(x_end)
+        for key, columns in self.columns.items():
+            for column, value in zip(columns, stats.get(key, (0, 0, 0, 0, 0, 0))):
+                column.append(value)
+
+    def merged(self, start, stop):
+        """Returns the summaries in `[start, stop)` merged into one summary,
+        as a `(x_start, x_end, stats)` tuple."""
+        stats = dict()
+        for index in range(start, stop):
+            for key, key_stats in self.stats(index).items():
+                stats[key] = _merge_stats(stats.get(key, [0, 0, 0, 0, 0, 0]), key_stats)
+        return (self.x_start[start], self.x_end[stop - 1], stats)
+
+    def discard(self, count):
+        """Removes the first `count` summaries."""
+        del self.x_start[:count]
+        del self.x_end[:count]
+        for columns in self.columns.values():
+            for column in columns:
+                del column[:count]
+
+    def nbytes(self):
+        return 8 * len(self.x_start) * (2 + len(_fields) * len(self.columns))
+
+class HistoryPyramid:
+    """Multi-resolution summaries of the learning curve history.
+
+    Rows are added in blocks of `fanout` rows, each summarized as the
+    minimum, maximum, and mean of every key. When a level exceeds its
+    capacity, the oldest `fanout` summaries are merged into one summary of
+    the next, coarser, level. The coarsest level halves its resolution
+    instead. Thus the most recent data has the finest resolution, and the
+    memory is bounded by `levels * capacity` summaries.
+
+    The rows must be added in ascending x order.
+
+    Example:
+        pyramid = HistoryPyramid()
+        pyramid.extend(history, 0, len(history))
+        pyramid.shrink(pyramid.capacity(1024 * 1024))
+        decimator = MinMaxDecimator(600)
+        pyramid.feed(decimator, [0, 1000])
+
+    Arguments:
+        levels: int - The number of levels (default 4).
+        fanout: int - The number of rows, or summaries, merged into one
+            summary of the next level (default 8).
+    """
+    def __init__(self, levels=4, fanout=8):
+        # The first level is the finest, and contains the most recent data
+        self._levels = [_SummaryLevel() for _ in range(levels)]
+        self._fanout = fanout
+
+    def __len__(self):
+        return sum(len(level) for level in self._levels)
+
+    def levels(self):
+        """The number of levels."""
+        return len(self._levels)
+
+    def summaries(self, level):
+        """Returns the summaries of a level, as a list of
+        `(x_start, x_end, {key: (min, max, mean)})` tuples."""
+        summaries = self._levels[level]
+        return [
+            (summaries.x_start[index], summaries.x_end[index], {
+                key: (min_y, max_y, total / count)
+                for key, (min_x, min_y, max_x, max_y, total, count) in summaries.stats(index).items()
+            })
+            for index in range(len(summaries))
+        ]
+
+    def extend(self, history, start, stop):
+        """Summarizes the rows `[start, stop)` of a `ColumnarHistory`."""
+        x = history.x()
+        blocks = [dict() for _ in range(start, stop, self._fanout)]
+        for key in history.keys():
+            indices, values = history.column(key, start, stop)
+            for index, value in zip(indices, values):
+                stats = blocks[index // self._fanout]
+                row_x = x[start + index]
+                key_stats = stats.get(key)
+                if key_stats is None:
+                    stats[key] = [row_x, value, row_x, value, value, 1]
+                    continue
+                if value < key_stats[1]:
+                    key_stats[0:2] = (row_x, value)
+                if value > key_stats[3]:
+                    key_stats[2:4] = (row_x, value)
+                key_stats[4] += value
+                key_stats[5] += 1
+
+        for block, stats in enumerate(blocks):
+            block_start = start + block * self._fanout
+            block_stop = min(block_start + self._fanout, stop)
+            self._levels[0].append(x[block_start], x[block_stop - 1], stats)
+
+    def capacity(self, max_bytes):
+        """The number of summaries per level, that keeps the memory of the
+        pyramid within `max_bytes`."""
+        keys = max((len(level.columns) for level in self._levels), default=0)
+        summary_bytes = 8 * (2 + len(_fields) * keys)
+        return max(2, max_bytes // (len(self._levels) * summary_bytes))
+
+    def shrink(self, capacity):
+        """Merges summaries, until each level has at most `capacity` summaries."""
+        for level_index, level in enumerate(self._levels):
+            if len(level) <= capacity:
+                continue
+
+            if level_index < len(self._levels) - 1:
+                # Move the oldest summaries to the next level
+                coarser = self._levels[level_index + 1]
+                excess = len(level) - capacity
+                count = min(len(level), math.ceil(excess / self._fanout) * self._fanout)
+                for start in range(0, count, self._fanout):
+                    coarser.append(*level.merged(start, min(start + self._fanout, count)))
+                level.discard(count)
+            else:
+                # The coarsest level halves its resolution
+                while len(level) > capacity:
+                    halved = _SummaryLevel()
+                    for start in range(0, len(level), 2):
+                        halved.append(*level.merged(start, min(start + 2, len(level))))
+                    self._levels[level_index] = level = halved
+
+    def feed(self, decimator, x_range=None):
+        """Adds the minimum and maximum points of the summaries within
+        `x_range` to a `MinMaxDecimator`, from the oldest to the newest."""
+        low, high = (-math.inf, math.inf) if x_range is None else x_range
+        for level in reversed(self._levels):
+            for index in range(len(level)):
+                if level.x_end[index] < low or level.x_start[index] > high:
+                    continue
+                for key, (min_x, min_y, max_x, max_y, total, count) in level.stats(index).items():
+                    for x, y in sorted([(min_x, min_y), (max_x, max_y)]):
+                        decimator.add(key, x, y)
+
+    def nbytes(self):
+        """The memory used by the summaries, in bytes."""
+        return sum(level.nbytes() for level in self._levels)
@@ -0,0 +1,58 @@
+import math
+from nose.tools import *
+
+from lrcurve.history_pyramid import HistoryPyramid
+from lrcurve.columnar_history import ColumnarHistory
+from lrcurve.decimation import MinMaxDecimator
+
+def create_history(rows, start=0):
+    history = ColumnarHistory()
+    for step in range(start, start + rows):
+        y = { 'loss': math.sin(step / 10) }
+        if step % 2 == 0:
+            y['val_loss'] = step
+        history.append(step, y)
+    return history
+
+def test_summaries():
+    pyramid = HistoryPyramid(fanout=4)
+    pyramid.extend(create_history(8), 0, 8)
+
+    summaries = pyramid.summaries(0)
+    assert_equal(len(summaries), 2)
+    x_start, x_end, stats = summaries[1]
+    assert_equal((x_start, x_end), (4, 7))
+    assert_equal(stats['val_loss'], (4, 6, 5))
+    assert_almost_equal(stats['loss'][2], sum(math.sin(step / 10) for step in range(4, 8)) / 4)
+
+def test_shrink_moves_old_summaries_to_coarser_levels():
+    pyramid = HistoryPyramid(levels=3, fanout=4)
+    history = create_history(1000)
+    pyramid.extend(history, 0, len(history))
+    pyramid.shrink(10)
+
+    assert_true(all(len(pyramid.summaries(level)) <= 10 for level in range(3)))
+    # The levels are ordered from the newest to the oldest data
+    assert_equal(pyramid.summaries(0)[-1][1], 999)
+    assert_equal(pyramid.summaries(2)[0][0], 0)
+    assert_true(pyramid.summaries(1)[-1][1] < pyramid.summaries(0)[0][0])
+
+    # The statistics are preserved by merging
+    assert_equal(max(stats['val_loss'][1] for _, _, stats in pyramid.summaries(0)), 998)
+    assert_equal(min(stats['val_loss'][0] for _, _, stats in pyramid.summaries(2)), 0)
+
+def test_capacity_bounds_memory():
+    pyramid = HistoryPyramid()
+    for start in range(0, 100000, 1000):
+        pyramid.extend(create_history(1000, start), 0, 1000)
+        pyramid.shrink(pyramid.capacity(64 * 1024))
+    assert_true(pyramid.nbytes() <= 64 * 1024)
+
+def test_feed_range():
+    pyramid = HistoryPyramid(fanout=4)
+    pyramid.extend(create_history(100), 0, 100)
+
+    decimator = MinMaxDecimator(1000)
+    pyramid.feed(decimator, [40, 59])
+    xs, ys = decimator.columns()['val_loss']
+    assert_equal(list(xs), list(range(40, 60, 2)))
@@ -2,13 +2,44 @@
 from .plot_learning_curve import PlotLearningCurve
 import tensorflow.keras as keras
 
+# The arguments of PlotLearningCurve.reconfigure, the remaining arguments
+# can only be passed to the PlotLearningCurve constructor.
+_reconfigure_arguments = {
+    'height', 'width', 'mappings', 'line_config', 'facet_config', 'xaxis_config', 'renderer'
+}
+
+# Older versions of keras includes these in the batch logs
+_ignored_batch_keys = {'batch', 'size'}
+
+def _compiled_metric_names(model):
+    # The names of the metrics given to model.compile(). Metrics for a
+    # specific output are prefixed by keras, so they are left for the
+    # runtime discovery.
+    try:
+        metrics = model.get_compile_config().get('metrics')
+    except (AttributeError, NotImplementedError):
+        return set()
+    if not isinstance(metrics, (list, tuple)):
+        return set()
+
+    names = set()
+    for metric in metrics:
+        if isinstance(metric, str):
+            names.add(metric)
+        elif isinstance(metric, dict) and 'name' in metric.get('config', {}):
+            names.add(metric['config']['name'])
+        elif isinstance(getattr(metric, 'name', None), str):
+            names.add(metric.name)
+    return names
+
 class KerasLearningCurve(keras.callbacks.Callback):
     """Keras.callback interface to draw learning curve
 
     This attempts to dynamically construct a learning curve plot
     based on the keras model configuration. This depends on `metrics`
     in `model.compile()`, `epochs` and `validation_data` in
-    `model.fit()`.
+    `model.fit()`. The plot is created when training begins, metrics that
+    could not be predicted from the model are added when they are logged.
 
     Example:
         model.fit(x_train, y_train,
@@ -22,18 +53,51 @@ class KerasLearningCurve(keras.callbacks.Callback):
         draw_every: Only update the plot every `draw_interval` epoch. This
             can be useful on a remote connection, where data transfer between
             server and client might be slow.
+        granularity: Either 'epoch' or 'batch' (default 'epoch'). With 'batch'
+            the training metrics are plotted for every `batch_window` batches,
+            using the global step as the x-axis. The validation metrics are
+            still computed per epoch, and are placed on the same step axis.
+            Keras logs the running mean over the epoch after each batch, the
+            value of each batch is recovered from that, which is exact when
+            all batches have the same size. Consider also setting
+            `max_updates_per_second`.
+        batch_window: The number of batches that are aggregated into one
+            point, when `granularity='batch'` (default 1).
+        batch_reduction: How the batches in the window are aggregated, either
+            'mean' or 'last' (default 'mean').
+        epoch_stats_fn: Called with the epoch and the result of `.stats()`
+            at the end of every epoch (default None).
         **kwargs: forwarded to PlotLearningCurve, the defaults
             are infered from the keras model configuration, or mappings
             if mappings is defined.
     """
-    def __init__(self, draw_interval=1, **kwargs):
+    def __init__(self, draw_interval=1, granularity='epoch', batch_window=1,
+                 batch_reduction='mean', epoch_stats_fn=None, **kwargs):
         if not isinstance(draw_interval, int) or draw_interval <= 0:
             raise ValueError('draw_interval must be a positive integer')
+        if granularity not in {'epoch', 'batch'}:
+            raise ValueError('granularity must be either epoch or batch')
+        if not isinstance(batch_window, int) or batch_window <= 0:
+            raise ValueError('batch_window must be a positive integer')
+        if batch_reduction not in {'mean', 'last'}:
+            raise ValueError('batch_reduction must be either mean or last')
 
         self._draw_interval = draw_interval
+        self._granularity = granularity
+        self._batch_window = batch_window
+        self._batch_reduction = batch_reduction
+        self._epoch_stats_fn = epoch_stats_fn
         self._kwargs = kwargs
 
+        self._in_fit = False
+        self._step = 0
+        self._window = dict()
+        self._window_size = 0
+        self._running_means = dict()
+        self._test_logs = None
+
         self._observed_metrics = set()
+        self._unlogged_metrics = None
         self._dynamic = True
         self._plotter = None
 
@@ -51,11 +115,14 @@ class KerasLearningCurve(keras.callbacks.Callback):
         if xaxis_config is None:
             xaxis_config = dict()
         if 'name' not in xaxis_config:
-            xaxis_config['name'] = 'Epoch'
+            xaxis_config['name'] = 'Step' if self._granularity == 'batch' else 'Epoch'
         if 'limit' not in xaxis_config:
             xaxis_config['limit'] = [0, None]
         if xaxis_config['limit'][1] is None:
-            xaxis_config['limit'][1] = self.params['epochs'] - 1
+            if self._granularity == 'epoch':
+                xaxis_config['limit'][1] = self.params['epochs'] - 1
+            elif self.params.get('steps') is not None:
+                xaxis_config['limit'][1] = self.params['epochs'] * self.params['steps'] - 1
 
         # Dynamically infer mappings
         if mappings is None:
@@ -119,21 +186,151 @@ class KerasLearningCurve(keras.callbacks.Callback):
         if self._plotter is None:
             self._plotter = PlotLearningCurve(**settings)
         else:
-            self._plotter.reconfigure(**settings)
+            self._plotter.reconfigure(**{
+                key: value for key, value in settings.items() if key in _reconfigure_arguments
+            })
 
-    def on_epoch_end(self, epoch, logs=None):
-        logs = logs or {}
+    def _observe(self, keys):
+        if self._dynamic and len(keys - self._observed_metrics) > 0:
+            self._observed_metrics.update(keys)
+            self._initialize_plotter()
+
+    def _flush_window(self):
+        if self._window_size == 0:
+            return
 
-        if self._dynamic and len(logs.keys() - self._observed_metrics) > 0:
-            self._observed_metrics.update(logs.keys())
+        if self._batch_reduction == 'mean':
+            values = { key: total / count for key, (total, count) in self._window.items() }
+        else:
+            values = self._window
+        self._window = dict()
+        self._window_size = 0
+
+        self._observe(values.keys())
+        self._plotter.append(self._step - 1, values)
+        self._plotter.draw()
+
+    def _expected_metrics(self):
+        # The keys fit() is expected to log, which allows the plot to be
+        # created once with all facets. Keys that can't be predicted, are
+        # discovered when they are logged.
+        model = getattr(self, 'model', None)
+        if model is None:
+            return set()
+
+        names = {'loss'} | _compiled_metric_names(model)
+        names.update(
+            name for name in getattr(model, 'metrics_names', [])
+            if name != 'compile_metrics'
+        )
+        if self.params.get('do_validation') or \
+           self.params.get('validation_data') is not None or \
+           self.params.get('validation_split'):
+            names.update({ f'val_{name}' for name in names })
+        return names
+
+    def on_train_begin(self, logs=None):
+        self._in_fit = True
+        expected = self._expected_metrics()
+        self._observe(expected)
+        self._unlogged_metrics = set(expected)
+
+    def _drop_unlogged(self, logs):
+        # The predicted keys, that the first epoch did not log, would only
+        # leave empty facets. If they are logged later, they are discovered.
+        if self._unlogged_metrics is None:
+            return
+        unlogged = self._unlogged_metrics - logs.keys()
+        self._unlogged_metrics = None
+        if self._dynamic and len(unlogged) > 0:
+            self._observed_metrics -= unlogged
             self._initialize_plotter()
 
-        self._plotter.append(epoch, logs)
+    def on_train_batch_end(self, batch, logs=None):
+        if self._granularity != 'batch':
+            return
+
+        # The logs contain the running mean over the epoch. The value of
+        # batch n is recovered as n * m_n - (n - 1) * m_{n-1}.
+        if batch == 0:
+            self._running_means = dict()
+        running_means = dict()
+        for key, mean in (logs or {}).items():
+            if key in _ignored_batch_keys:
+                continue
+            running_means[key] = mean
+            previous = self._running_means.get(key)
+            value = mean if previous is None else (batch + 1) * mean - batch * previous
+
+            # Aggregate without converting the values, such that there is
+            # no overhead until the window is complete.
+            if self._batch_reduction == 'mean':
+                total, count = self._window.get(key, (0, 0))
+                self._window[key] = (total + value, count + 1)
+            else:
+                self._window[key] = value
+
+        self._running_means = running_means
+        self._step += 1
+        self._window_size += 1
+        if self._window_size == self._batch_window:
+            self._flush_window()
+
+    def on_test_batch_end(self, batch, logs=None):
+        # The test logs contain the running average, so only the last
+        # logs are kept.
+        if self._granularity == 'batch':
+            self._test_logs = logs
+
+    def on_test_end(self, logs=None):
+        # During .fit() the validation metrics are added in on_epoch_end
+        if self._granularity != 'batch' or self._in_fit:
+            return
+
+        test_logs = logs or self._test_logs or {}
+        self._test_logs = None
+        values = {
+            f'val_{key}': value for key, value in test_logs.items()
+            if key not in _ignored_batch_keys
+        }
+        if len(values) > 0:
+            self._observe(values.keys())
+            self._plotter.append(max(0, self._step - 1), values)
+            self._plotter.draw()
+
+    def on_epoch_end(self, epoch, logs=None):
+        self._drop_unlogged(logs or {})
+        self._append_epoch(epoch, logs or {})
+
+        if self._epoch_stats_fn is not None and self._plotter is not None:
+            self._epoch_stats_fn(epoch, self._plotter.stats())
+
+    def _append_epoch(self, epoch, logs):
+        if self._granularity == 'batch':
+            # The training metrics are plotted per batch, so only place
+            # the validation metrics on the step axis.
+            self._flush_window()
+            logs = { key: value for key, value in logs.items() if key.startswith('val_') }
+            if len(logs) == 0:
+                return
+            x = self._step - 1
+        else:
+            x = epoch
+
+        self._observe(logs.keys())
+        self._plotter.append(x, logs)
 
         # Update plot
         if epoch % self._draw_interval == 0:
             self._plotter.draw()
 
+    def stats(self):
+        """Returns statistics about the cost of the plot, see
+        `PlotLearningCurve.stats()`. Returns None if the plot has not been
+        created yet."""
+        return None if self._plotter is None else self._plotter.stats()
+
     def on_train_end(self, logs=None):
+        self._in_fit = False
         if self._plotter is not None:
             self._plotter.finalize()
@@ -1,4 +1,8 @@
+import sys
+import subprocess
+import os.path as path
 from nose.tools import *
+import tensorflow.keras as keras
 
 from lrcurve import KerasLearningCurve
 
@@ -15,6 +19,14 @@ def display_replacer(display_objects):
         return DisplayHandle(display_objects)
     return display
 
+def test_import_is_lazy():
+    loaded = subprocess.run(
+        [sys.executable, '-c', 'import sys, lrcurve; print(sorted(set(sys.modules) & {"tensorflow", "IPython"}))'],
+        cwd=path.dirname(path.dirname(path.realpath(__file__))),
+        capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert_equal(loaded, '[]')
+
 def test_crude_sanity_check():
     # Unfortunetly the notebooks are really the best way to test if
     # things are working.
@@ -26,3 +38,98 @@ def test_draw_interval_is_not_positive_number():
         draw_interval=0,
         display_fn=display_replacer([])
     )
+
+def test_batch_granularity():
+    display_objects = []
+    plot = KerasLearningCurve(granularity='batch', batch_window=2,
+                              display_fn=display_replacer(display_objects))
+    plot.params = { 'epochs': 2, 'steps': 4 }
+    plot.on_train_begin()
+    for epoch in range(2):
+        # The running means of the batch losses 1, 3, 2, 6
+        for batch, running_mean in enumerate([1, 2, 2, 3]):
+            plot.on_train_batch_end(batch, { 'loss': running_mean })
+        plot.on_epoch_end(epoch, { 'loss': 3, 'val_loss': epoch })
+    plot.on_train_end()
+
+    assert_equal(plot._plotter._settings['xAxisConfig'], { 'name': 'Step', 'limit': [0, 7] })
+    assert_equal(plot._plotter._data.rows(), [
+        [1, { 'loss': 2 }], [3, { 'loss': 4 }], [3, { 'val_loss': 0 }],
+        [5, { 'loss': 2 }], [7, { 'loss': 4 }], [7, { 'val_loss': 1 }]
+    ])
+
+def test_epoch_stats_fn():
+    reported = []
+    plot = KerasLearningCurve(display_fn=display_replacer([]),
+                              epoch_stats_fn=lambda epoch, stats: reported.append((epoch, stats)))
+    plot.params = { 'epochs': 2, 'steps': 4 }
+    plot.on_train_begin()
+    for epoch in range(2):
+        plot.on_epoch_end(epoch, { 'loss': 1.5, 'val_loss': epoch })
+    plot.on_train_end()
+
+    assert_equal([epoch for epoch, _ in reported], [0, 1])
+    assert_equal([stats['draws'] for _, stats in reported], [1, 2])
+    assert_equal(plot.stats()['history_rows'], 2)
+
+def _compiled_model(metrics):
+    model = keras.Sequential([keras.layers.Input((3,)), keras.layers.Dense(1)])
+    model.compile(loss='mse', metrics=metrics)
+    return model
+
+def test_configured_on_train_begin():
+    plot = KerasLearningCurve(display_fn=display_replacer([]))
+    plot.set_model(_compiled_model(['mae', keras.metrics.AUC(name='auc')]))
+    plot.set_params({ 'epochs': 2, 'steps': 4, 'do_validation': True })
+    plot.on_train_begin()
+
+    assert_equal(set(plot._plotter._settings['facetConfig']), { 'loss', 'mae', 'auc' })
+    assert_equal(set(plot._plotter._settings['mappings']), {
+        'loss', 'mae', 'auc', 'val_loss', 'val_mae', 'val_auc'
+    })
+
+    for epoch in range(2):
+        plot.on_epoch_end(epoch, {
+            'loss': 1, 'mae': 1, 'auc': 0.5, 'val_loss': 1, 'val_mae': 1, 'val_auc': 0.5
+        })
+    assert_equal(plot.stats()['reconfigures'], 1)
+    plot.on_train_end()
+
+def test_unpredicted_metrics_are_discovered():
+    plot = KerasLearningCurve(display_fn=display_replacer([]))
+    plot.set_model(_compiled_model(['mae']))
+    plot.set_params({ 'epochs': 2, 'steps': 4 })
+    plot.on_train_begin()
+    plot.on_epoch_end(0, { 'loss': 1, 'mae': 1, 'val_loss': 1, 'val_mae': 1 })
+
+    assert_equal(set(plot._plotter._settings['mappings']), { 'loss', 'mae', 'val_loss', 'val_mae' })
+    assert_equal(plot.stats()['reconfigures'], 2)
+    assert_equal(plot.stats()['sleep_seconds'], 1)
+    plot.on_train_end()
+
+def test_unlogged_metrics_are_dropped():
+    plot = KerasLearningCurve(display_fn=display_replacer([]))
+    plot.set_model(_compiled_model(['mae']))
+    plot.set_params({ 'epochs': 2, 'steps': 4, 'do_validation': True })
+    plot.on_train_begin()
+    plot.on_epoch_end(0, { 'loss': 1, 'mae': 1 })
+
+    assert_equal(set(plot._plotter._settings['mappings']), { 'loss', 'mae' })
+    assert_equal(set(plot._plotter._settings['facetConfig']), { 'loss', 'mae' })
+    plot.on_epoch_end(1, { 'loss': 1, 'mae': 1, 'val_loss': 1 })
+    assert_equal(set(plot._plotter._settings['mappings']), { 'loss', 'mae', 'val_loss' })
+    plot.on_train_end()
+
+@raises(ValueError)
+def test_granularity_is_unknown():
+    KerasLearningCurve(
+        granularity='step',
+        display_fn=display_replacer([])
+    )
+
+@raises(ValueError)
+def test_batch_window_is_not_positive_number():
+    KerasLearningCurve(
+        batch_window=0,
+        display_fn=display_replacer([])
+    )
@@ -0,0 +1,276 @@
+import os
+import socket
+import threading
+import multiprocessing.connection as connection
+
+from .flush_timer import AdaptiveFlushTimer
+
+_reductions = {
+    'mean': lambda values: sum(values) / len(values),
+    'min': min,
+    'max': max
+}
+
+class MetricCollector:
+    """Collects data-points from other processes, and appends them to a plot.
+
+    The collector listens on a local socket. Each worker, for example a
+    DistributedDataParallel rank or a `multiprocessing` worker, connects using
+    a `MetricClient` and sends its data-points in batches. The batches are
+    received on background threads, such the workers are never blocked by
+    the plot.
+
+    Without a reduction, each worker gets its own line. The data key is
+    renamed to `f'{key}/{rank}'`, so the mappings should include those keys.
+    With a reduction, the values of all `world_size` workers are combined
+    into one value, once every worker has reported a key for a given x. The
+    workers must report increasing x values. Once every worker has reported
+    a larger x, a key that some workers did not report is combined using
+    the workers that did. The combined values are appended in x order.
+
+    The plot is updated from one background thread, at most
+    `plot.max_updates_per_second` times per second, or 10 times per second
+    if the plot has no rate limit.
+
+    Example:
+        plot = PlotLearningCurve(mappings={
+            'loss/0': { 'line': 'rank0', 'facet': 'loss' },
+            'loss/1': { 'line': 'rank1', 'facet': 'loss' }
+        }, ...)
+        collector = MetricCollector(plot)
+        # in each worker process
+        with MetricClient(collector.address, collector.authkey, rank) as client:
+            client.append(step, { 'loss': loss })
+        # in the notebook, once the workers are done
+        collector.close()
+        plot.finalize()
+
+    Arguments:
+        plot: PlotLearningCurve - The plot to append the data-points to.
+        reduction: How the values are combined across workers, either None,
+            'mean', 'min', or 'max' (default None).
+        world_size: int - The number of workers, required with a reduction.
+        address: The address to listen on (default a free localhost port).
+        clock: function - See `AdaptiveFlushTimer` (mostly useful for
+            internal testing).
+        timer_fn: function - See `AdaptiveFlushTimer` (mostly useful for
+            internal testing).
+    """
+    def __init__(self, plot, reduction=None, world_size=None, address=('localhost', 0),
+                 clock=None, timer_fn=None):
+        if reduction is not None and reduction not in _reductions:
+            raise ValueError(f'reduction must be one of None, {", ".join(_reductions)}, was {reduction}')
+        if reduction is not None and (not isinstance(world_size, int) or world_size <= 0):
+            raise ValueError(f'world_size must be a positive integer when using a reduction, was {world_size}')
+
+        self._plot = plot
+        self._reduction = reduction
+        self._world_size = world_size
+        self._authkey = os.urandom(32)
+
+        # Maps x to {key: values} reported so far, when using a reduction
+        self._partial = dict()
+        # Maps each rank to the largest x it has reported
+        self._latest = dict()
+        self._lock = threading.Lock()
+        self._closing = False
+        self._readers = []
+        self._draw_timer = AdaptiveFlushTimer(
+            plot.draw, plot.max_updates_per_second or 10, clock=clock, timer_fn=timer_fn
+        )
+
+        self._listener = connection.Listener(address, authkey=self._authkey)
+        self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def address(self):
+        """The address `MetricClient` should connect to."""
+        return self._listener.address
+
+    @property
+    def authkey(self):
+        """The key `MetricClient` should authenticate with."""
+        return self._authkey
+
+    def _accept_loop(self):
+        while not self._closing:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, connection.AuthenticationError):
+                continue
+
+            # A worker may connect just before the collector is closed, its
+            # data-points must still be received
+            reader = threading.Thread(target=self._read_loop, args=(conn, ), daemon=True)
+            with self._lock:
+                self._readers.append(reader)
+            reader.start()
+
+    def _read_loop(self, conn):
+        with conn:
+            try:
+                _, rank = conn.recv()
+                while True:
+                    self._receive(rank, conn.recv())
+            except (EOFError, OSError):
+                pass
+
+    def _receive(self, rank, records):
+        if self._reduction is None:
+            for x, y in records:
+                self._plot.append(x, { f'{key}/{rank}': value for key, value in y.items() })
+        else:
+            with self._lock:
+                rows = self._reduce(rank, records)
+            for x, y in rows:
+                self._plot.append(x, y)
+
+        self._draw_timer.schedule()
+
+    def _reduce(self, rank, records):
+        # Returns the rows that are complete, or stale, in x order
+        rows = dict()
+        for x, y in records:
+            self._latest[rank] = max(x, self._latest.get(rank, x))
+            partial = self._partial.setdefault(x, dict())
+            for key, value in y.items():
+                values = partial.setdefault(key, [])
+                values.append(value)
+                if len(values) == self._world_size:
+                    del partial[key]
+                    rows.setdefault(x, dict())[key] = _reductions[self._reduction](values)
+            if len(partial) == 0:
+                del self._partial[x]
+
+        # No worker will report an x, that is smaller than what all workers
+        # have reported already
+        if len(self._latest) == self._world_size:
+            oldest = min(self._latest.values())
+            for x in [x for x in self._partial.keys() if x < oldest]:
+                for key, values in self._partial.pop(x).items():
+                    rows.setdefault(x, dict())[key] = _reductions[self._reduction](values)
+
+        return sorted(rows.items())
+
+    def _wake_accept_loop(self):
+        try:
+            connection.Client(self.address, authkey=self._authkey).close()
+        except (OSError, EOFError, connection.AuthenticationError):
+            pass
+
+    def close(self, timeout=None):
+        """Stops listening, and waits for the connected workers to close.
+
+        Values that have not been reported by all workers are combined
+        using the workers that did report them.
+
+        Arguments:
+            timeout: number - Seconds to wait for each worker (default None).
+        """
+        if self._closing:
+            return
+        self._closing = True
+
+        # Wake the accept loop, such it notices the collector is closing.
+        # If the accept loop has already stopped, nothing answers the
+        # authentication handshake. Sockets are therefore connected without
+        # it, while a pipe client waits on another thread until the
+        # listener is closed.
+        family = connection.address_type(self.address)
+        if family == 'AF_PIPE':
+            threading.Thread(target=self._wake_accept_loop, daemon=True).start()
+        else:
+            try:
+                with socket.socket(getattr(socket, family)) as sock:
+                    sock.connect(self.address)
+            except OSError:
+                pass
+        self._accept_thread.join(timeout)
+        self._listener.close()
+
+        with self._lock:
+            readers = list(self._readers)
+        for reader in readers:
+            reader.join(timeout)
+        self._draw_timer.cancel()
+
+        with self._lock:
+            partial = self._partial
+            self._partial = dict()
+        for x, y in sorted(partial.items()):
+            self._plot.append(x, {
+                key: _reductions[self._reduction](values) for key, values in y.items()
+            })
+        self._plot.draw()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+class MetricClient:
+    """Sends data-points from a worker process to a `MetricCollector`.
+
+    `.append()` only stores the data-point, the data-points are sent in
+    batches from a background thread. This means a worker can call
+    `.append()` on every step, without waiting for the collector.
+
+    Arguments:
+        address: The `address` of the collector.
+        authkey: bytes - The `authkey` of the collector.
+        rank: int - Identifies the worker (default 0).
+        interval: number - Seconds between each batch (default 0.1).
+    """
+    def __init__(self, address, authkey, rank=0, interval=0.1):
+        self._conn = connection.Client(address, authkey=authkey)
+        self._conn.send(('hello', rank))
+        self._interval = interval
+
+        self._lock = threading.Lock()
+        self._records = []
+        self._closed = threading.Event()
+        self._sender = threading.Thread(target=self._send_loop, daemon=True)
+        self._sender.start()
+
+    def append(self, x, y):
+        """Stores a data-point, to be sent in the next batch.
+
+        Arguments:
+            x: number - The x axis value, typically the epoch or iteration.
+            y: dict - A mapping between the data-key and the y-axis value.
+                The values can be numbers or scalar tensors, which are
+                converted on the background thread.
+        """
+        with self._lock:
+            self._records.append((x, y))
+
+    def _send_batch(self):
+        with self._lock:
+            records = self._records
+            self._records = []
+        if len(records) > 0:
+            self._conn.send([
+                (float(x), { key: float(value) for key, value in y.items() })
+                for x, y in records
+            ])
+
+    def _send_loop(self):
+        while not self._closed.wait(self._interval):
+            self._send_batch()
+
+    def close(self):
+        """Sends the remaining data-points, and closes the connection."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._sender.join()
+        self._send_batch()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
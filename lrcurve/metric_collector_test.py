@@ -0,0 +1,195 @@
+import time
+import threading
+import multiprocessing
+from nose.tools import *
+
+from lrcurve.metric_collector import MetricCollector, MetricClient
+
+class FakePlot:
+    def __init__(self, max_updates_per_second=None):
+        self.max_updates_per_second = max_updates_per_second
+        self.rows = []
+        self.draws = 0
+        self.drawing = 0
+        self.max_drawing = 0
+        self.lock = threading.Lock()
+
+    def append(self, x, y):
+        self.rows.append((x, y))
+
+    def draw(self):
+        with self.lock:
+            self.draws += 1
+            self.drawing += 1
+            self.max_drawing = max(self.max_drawing, self.drawing)
+        time.sleep(0.01)
+        with self.lock:
+            self.drawing -= 1
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+class FakeTimer:
+    def __init__(self, delay, fn):
+        self.delay = delay
+        self.fn = fn
+        self.started = False
+        self.cancelled = False
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+def timer_replacer(timers):
+    def timer_fn(delay, fn):
+        timer = FakeTimer(delay, fn)
+        timers.append(timer)
+        return timer
+    return timer_fn
+
+def _wait_for_rows(plot, count):
+    for _ in range(1000):
+        if len(plot.rows) >= count:
+            return
+        time.sleep(0.01)
+
+def _worker(address, authkey, rank):
+    with MetricClient(address, authkey, rank) as client:
+        for step in range(100):
+            client.append(step, { 'loss': rank })
+
+def test_per_rank_lines():
+    plot = FakePlot()
+    collector = MetricCollector(plot)
+    with MetricClient(collector.address, collector.authkey, rank=3) as client:
+        client.append(0, { 'loss': 1 })
+        client.append(1, { 'loss': 0.5 })
+    collector.close()
+
+    assert_equal(plot.rows, [(0.0, { 'loss/3': 1.0 }), (1.0, { 'loss/3': 0.5 })])
+    assert_true(plot.draws >= 1)
+
+def test_mean_reduction():
+    plot = FakePlot()
+    collector = MetricCollector(plot, reduction='mean', world_size=2)
+    client_0 = MetricClient(collector.address, collector.authkey, rank=0)
+    client_1 = MetricClient(collector.address, collector.authkey, rank=1)
+    client_0.append(0, { 'loss': 1, 'val_loss': 4 })
+    client_1.append(0, { 'loss': 3 })
+    client_0.close()
+    client_1.close()
+    collector.close()
+
+    assert_equal(plot.rows, [(0.0, { 'loss': 2.0 }), (0.0, { 'val_loss': 4.0 })])
+
+def test_worker_processes():
+    plot = FakePlot()
+    collector = MetricCollector(plot, reduction='max', world_size=4)
+    workers = [
+        multiprocessing.Process(target=_worker, args=(collector.address, collector.authkey, rank))
+        for rank in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    collector.close()
+
+    assert_equal(plot.rows, [(float(step), { 'loss': 3.0 }) for step in range(100)])
+
+def test_draws_are_rate_limited():
+    plot = FakePlot(max_updates_per_second=5)
+    clock = FakeClock()
+    timers = []
+    collector = MetricCollector(plot, clock=clock, timer_fn=timer_replacer(timers))
+    clients = [
+        MetricClient(collector.address, collector.authkey, rank=rank, interval=0.01)
+        for rank in range(4)
+    ]
+    for step in range(50):
+        for client in clients:
+            client.append(step, { 'loss': step })
+        time.sleep(0.01)
+    for client in clients:
+        client.close()
+    _wait_for_rows(plot, 200)
+
+    # All batches received before the timer fires are drawn once
+    assert_equal(len(timers), 1)
+    assert_equal(timers[0].delay, 0)
+    assert_equal(plot.draws, 0)
+    timers[0].fn()
+    assert_equal(plot.draws, 1)
+
+    # Batches received within the interval are delayed until it has passed
+    clock.now = 0.05
+    with MetricClient(collector.address, collector.authkey, rank=4) as client:
+        client.append(50, { 'loss': 50 })
+    _wait_for_rows(plot, 201)
+    assert_equal(len(timers), 2)
+    assert_almost_equal(timers[1].delay, 0.15)
+
+    collector.close()
+    assert_true(timers[1].cancelled)
+    assert_equal(len(plot.rows), 201)
+    assert_equal(plot.draws, 2)
+    assert_equal(plot.max_drawing, 1)
+
+def test_stale_steps_are_combined():
+    plot = FakePlot()
+    collector = MetricCollector(plot, reduction='mean', world_size=2)
+    client_0 = MetricClient(collector.address, collector.authkey, rank=0)
+    client_1 = MetricClient(collector.address, collector.authkey, rank=1)
+    client_0.append(0, { 'loss': 1, 'val_loss': 4 })
+    client_0.append(1, { 'loss': 1 })
+    client_1.append(0, { 'loss': 3 })
+    client_1.append(1, { 'loss': 3 })
+    client_0.close()
+    client_1.close()
+
+    # Both workers reported x=1, so val_loss at x=0 is not waiting for rank 1
+    reported = dict()
+    for _ in range(100):
+        reported = { (x, key): value for x, y in list(plot.rows) for key, value in y.items() }
+        if len(reported) == 3:
+            break
+        time.sleep(0.01)
+    assert_equal(reported, { (0.0, 'loss'): 2.0, (0.0, 'val_loss'): 4.0, (1.0, 'loss'): 2.0 })
+    assert_equal(collector._partial, dict())
+    xs = [x for x, _ in plot.rows]
+    assert_equal(xs, sorted(xs))
+    collector.close()
+
+def test_worker_connecting_while_closing():
+    plot = FakePlot()
+    collector = MetricCollector(plot)
+
+    # Return the next connection only once the collector is closing
+    accept = collector._listener.accept
+    def delayed_accept():
+        conn = accept()
+        while not collector._closing:
+            time.sleep(0.001)
+        return conn
+    collector._listener.accept = delayed_accept
+
+    with MetricClient(collector.address, collector.authkey, rank=0) as client:
+        client.append(0, { 'loss': 1 })
+    with MetricClient(collector.address, collector.authkey, rank=1) as client:
+        client.append(0, { 'loss': 2 })
+    closer = threading.Thread(target=collector.close, daemon=True)
+    closer.start()
+    closer.join(10)
+
+    assert_false(closer.is_alive())
+    assert_equal(sorted(plot.rows, key=lambda row: list(row[1])), [(0.0, { 'loss/0': 1.0 }), (0.0, { 'loss/1': 2.0 })])
+
+@raises(ValueError)
+def test_reduction_requires_world_size():
+    MetricCollector(FakePlot(), reduction='mean')
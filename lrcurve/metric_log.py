@@ -0,0 +1,183 @@
+import os
+import sys
+import mmap
+import json
+import time
+import zlib
+import struct
+from array import array
+
+# The file starts with the magic bytes, followed by the records. Each record
+# has a header with the record type, the payload length, and a CRC32 of the
+# payload. A record that was only partially written when the process
+# crashed, fails the length or CRC32 check and is ignored.
+_magic = b'LRCURVE\x02'
+_header = struct.Struct('<BII')
+_rows_header = struct.Struct('<II')
+_key_header = struct.Struct('<H')
+_count_header = struct.Struct('<I')
+
+_settings_record = 0
+_rows_record = 1
+
+def _little_endian(buffer):
+    if sys.byteorder == 'big':
+        buffer.byteswap()
+    return buffer
+
+def _encode_settings(settings):
+    return json.dumps(settings).encode('utf-8')
+
+def _encode_rows(history, start, stop):
+    columns = [(key, *history.column(key, start, stop)) for key in history.keys()]
+    columns = [(key, indices, values) for key, indices, values in columns if len(values) > 0]
+    parts = [_rows_header.pack(stop - start, len(columns))]
+    for key, indices, values in columns:
+        name = key.encode('utf-8')
+        parts.append(_key_header.pack(len(name)))
+        parts.append(name)
+
+    parts.append(_little_endian(history.x()[start:stop]).tobytes())
+    for key, indices, values in columns:
+        parts.append(_count_header.pack(len(values)))
+        parts.append(_little_endian(indices).tobytes())
+        parts.append(_little_endian(values).tobytes())
+    return b''.join(parts)
+
+def _decode_rows(payload):
+    payload = memoryview(payload)
+    rows, key_count = _rows_header.unpack_from(payload, 0)
+    offset = _rows_header.size
+
+    keys = []
+    for _ in range(key_count):
+        length, = _key_header.unpack_from(payload, offset)
+        offset += _key_header.size
+        keys.append(bytes(payload[offset:offset + length]).decode('utf-8'))
+        offset += length
+
+    x = array('d')
+    x.frombytes(payload[offset:offset + 8 * rows])
+    offset += 8 * rows
+
+    columns = dict()
+    for key in keys:
+        count, = _count_header.unpack_from(payload, offset)
+        offset += _count_header.size
+        indices, values = (array('q'), array('d'))
+        indices.frombytes(payload[offset:offset + 8 * count])
+        offset += 8 * count
+        values.frombytes(payload[offset:offset + 8 * count])
+        offset += 8 * count
+        columns[key] = (_little_endian(indices), _little_endian(values))
+
+    return (_little_endian(x), columns)
+
+class MetricLogReader:
+    """Reads the records of a metric log.
+
+    The file is memory-mapped, and each record is decoded directly into
+    float64 buffers. Therefore the time it takes to read a log depends on
+    the file size, not on the number of rows. `.read()` can be called
+    repeatedly to read records, that another process has appended since.
+
+    Arguments:
+        path: str - The path of the metric log.
+    """
+    def __init__(self, path):
+        self._path = path
+        self._offset = len(_magic)
+
+    @property
+    def offset(self):
+        """The file offset after the last complete record."""
+        return self._offset
+
+    def read(self):
+        """Returns a list of new complete records.
+
+        Each record is either `('settings', dict)` or
+        `('rows', (x, {key: (indices, values)}))`, see
+        `ColumnarHistory.extend_sparse`.
+        """
+        records = []
+        with open(self._path, 'rb') as fp:
+            size = os.fstat(fp.fileno()).st_size
+            if size < len(_magic) or size <= self._offset:
+                return records
+
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped[:len(_magic)] != _magic:
+                    raise ValueError(f'{self._path} is not an lrcurve metric log')
+
+                while self._offset + _header.size <= size:
+                    kind, length, checksum = _header.unpack_from(mapped, self._offset)
+                    start = self._offset + _header.size
+                    if start + length > size:
+                        break
+                    payload = mapped[start:start + length]
+                    if zlib.crc32(payload) != checksum:
+                        break
+
+                    if kind == _settings_record:
+                        records.append(('settings', json.loads(payload.decode('utf-8'))))
+                    elif kind == _rows_record:
+                        records.append(('rows', _decode_rows(payload)))
+                    self._offset = start + length
+
+        return records
+
+class MetricLogWriter:
+    """Appends the learning curve data to an append-only binary file.
+
+    Each `.write_rows()` call appends one record, containing the rows as
+    columns. The file is flushed after every record, but only fsynced once
+    every `fsync_interval` seconds, and when the log is closed.
+
+    If the file already exists, it is overwritten. With `resume`, the new
+    records are instead appended after the last complete record, and a
+    record that was only partially written, because the process crashed,
+    is removed.
+
+    Arguments:
+        path: str - The path of the metric log.
+        fsync_interval: number - Seconds between each fsync (default 1).
+        resume: bool - Append to an existing file (default False).
+    """
+    def __init__(self, path, fsync_interval=1, resume=False):
+        self._fsync_interval = fsync_interval
+        self._last_fsync = time.perf_counter()
+
+        if resume and os.path.exists(path) and os.path.getsize(path) >= len(_magic):
+            reader = MetricLogReader(path)
+            reader.read()
+            self._fp = open(path, 'r+b')
+            self._fp.truncate(reader.offset)
+            self._fp.seek(reader.offset)
+        else:
+            self._fp = open(path, 'wb')
+            self._fp.write(_magic)
+
+    def _write(self, kind, payload):
+        self._fp.write(_header.pack(kind, len(payload), zlib.crc32(payload)))
+        self._fp.write(payload)
+        self._fp.flush()
+        if time.perf_counter() - self._last_fsync >= self._fsync_interval:
+            self.fsync()
+
+    def write_settings(self, settings):
+        """Appends the plot settings, which must be JSON serializable."""
+        self._write(_settings_record, _encode_settings(settings))
+
+    def write_rows(self, history, start, stop):
+        """Appends the rows `[start, stop)` of a `ColumnarHistory`."""
+        self._write(_rows_record, _encode_rows(history, start, stop))
+
+    def fsync(self):
+        os.fsync(self._fp.fileno())
+        self._last_fsync = time.perf_counter()
+
+    def close(self):
+        if not self._fp.closed:
+            self.fsync()
+            self._fp.close()
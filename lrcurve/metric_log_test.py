@@ -0,0 +1,88 @@
+import os
+import tempfile
+from nose.tools import *
+
+from lrcurve.columnar_history import ColumnarHistory
+from lrcurve.metric_log import MetricLogReader, MetricLogWriter
+
+def _history():
+    history = ColumnarHistory()
+    history.append(0, { 'loss': 1 })
+    history.append(1, { 'loss': 0.5, 'val_loss': 0.75 })
+    history.append(2, { 'val_loss': 0.25 })
+    return history
+
+def _rows(records):
+    replayed = ColumnarHistory()
+    for kind, record in records:
+        if kind == 'rows':
+            replayed.extend_sparse(*record)
+    return replayed.rows()
+
+def test_roundtrip():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'run.lrcurve')
+        history = _history()
+        writer = MetricLogWriter(path)
+        writer.write_settings({ 'width': 300 })
+        writer.write_rows(history, 0, 1)
+        writer.write_rows(history, 1, 3)
+        writer.close()
+
+        records = MetricLogReader(path).read()
+        assert_equal(records[0], ('settings', { 'width': 300 }))
+        assert_equal(_rows(records), history.rows())
+
+def test_follow():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'run.lrcurve')
+        history = _history()
+        writer = MetricLogWriter(path)
+        reader = MetricLogReader(path)
+
+        writer.write_rows(history, 0, 2)
+        assert_equal(_rows(reader.read()), history.rows(0, 2))
+        assert_equal(reader.read(), [])
+        writer.write_rows(history, 2, 3)
+        assert_equal(_rows(reader.read()), [[2, { 'val_loss': 0.25 }]])
+        writer.close()
+
+def test_partial_record_is_ignored():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'run.lrcurve')
+        history = _history()
+        writer = MetricLogWriter(path)
+        writer.write_rows(history, 0, 1)
+        writer.write_rows(history, 1, 3)
+        writer.close()
+
+        # Emulate a crash in the middle of writing the last record
+        os.truncate(path, os.path.getsize(path) - 5)
+        assert_equal(_rows(MetricLogReader(path).read()), history.rows(0, 1))
+
+        # The partial record is removed, when appending to the file
+        writer = MetricLogWriter(path, resume=True)
+        writer.write_rows(history, 1, 3)
+        writer.close()
+        assert_equal(_rows(MetricLogReader(path).read()), history.rows())
+
+@raises(ValueError)
+def test_not_a_metric_log():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'run.lrcurve')
+        with open(path, 'wb') as fp:
+            fp.write(b'not a metric log')
+        MetricLogReader(path).read()
+
+def test_existing_file_is_overwritten():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'run.lrcurve')
+        history = _history()
+        writer = MetricLogWriter(path)
+        writer.write_rows(history, 0, 1)
+        writer.close()
+
+        writer = MetricLogWriter(path)
+        writer.write_rows(history, 1, 3)
+        writer.close()
+        assert_equal(_rows(MetricLogReader(path).read()), history.rows(1, 3))
@@ -0,0 +1,82 @@
+def _materialize_values(values):
+    """Converts a list of scalar tensors or arrays to a list of floats.
+
+    The values are concatenated and converted at once, such that a tensor on a
+    device only requires one synchronization.
+    """
+    module = type(values[0]).__module__.split('.')[0]
+    converted = None
+    try:
+        if module == 'torch':
+            import torch
+            with torch.no_grad():
+                converted = torch.cat([value.reshape(-1) for value in values]).tolist()
+        elif module == 'tensorflow':
+            import tensorflow as tf
+            converted = tf.concat([tf.reshape(value, [-1]) for value in values], 0).numpy().tolist()
+        elif module == 'numpy':
+            import numpy as np
+            converted = np.asarray(values, dtype=np.float64).reshape(-1).tolist()
+    except (ValueError, TypeError, RuntimeError):
+        # The values could not be concatenated, e.g. because they are on
+        # different devices. Fallback to converting each value.
+        pass
+
+    # If a value is not a scalar, float() raises the appropriate error
+    if converted is None or len(converted) != len(values):
+        converted = [float(value) for value in values]
+    return converted
+
+class PendingRows:
+    """Rows where the values have not been converted to floats yet.
+
+    Converting a tensor to a float forces a device synchronization, which is
+    expensive in a training loop. Instead, the references are stored, and
+    converted all at once by `.materialize()`.
+
+    Example:
+        pending = PendingRows()
+        pending.append(0, { 'loss': torch.tensor(1.0) })
+        pending.materialize()  # [(0.0, {'loss': 1.0})]
+    """
+    def __init__(self):
+        self._x = []
+        self._y = []
+
+    def __len__(self):
+        return len(self._x)
+
+    def append(self, x, y):
+        """Appends a row. The values are only checked to be numbers, scalar
+        tensors, or arrays, such that a wrong type is reported by the
+        `.append()` that caused it."""
+        for key, value in y.items():
+            if not (hasattr(value, '__float__') or hasattr(value, '__array__')):
+                raise ValueError(f'y["{key}"] must be a number or a scalar tensor, was {type(value).__name__}')
+        self._x.append(x)
+        self._y.append(y)
+
+    def materialize(self):
+        """Returns the rows as `(x, {key: float})` tuples, and clears the
+        pending rows. The rows are cleared even if a value can not be
+        converted, such that it does not prevent converting later rows."""
+        xs, ys = (self._x, self._y)
+        self._x = []
+        self._y = []
+
+        columns = dict()
+        for row_index, y in enumerate(ys):
+            for key, value in y.items():
+                indices, values = columns.setdefault(key, ([], []))
+                indices.append(row_index)
+                values.append(value)
+
+        rows = [(float(x), dict()) for x in xs]
+        for key, (indices, values) in columns.items():
+            try:
+                converted = _materialize_values(values)
+            except (ValueError, TypeError) as error:
+                raise ValueError(f'y["{key}"] could not be converted to a float: {error}') from error
+            for row_index, value in zip(indices, converted):
+                rows[row_index][1][key] = value
+        return rows
@@ -0,0 +1,75 @@
+import numpy as np
+import tensorflow as tf
+from nose.tools import *
+from nose.plugins.skip import SkipTest
+
+from lrcurve.pending_rows import PendingRows
+
+def test_materialize_numbers():
+    pending = PendingRows()
+    pending.append(0, { 'loss': 1 })
+    pending.append(1, { 'loss': 0.5, 'val_loss': 2 })
+
+    assert_equal(len(pending), 2)
+    assert_equal(pending.materialize(), [
+        (0.0, { 'loss': 1.0 }),
+        (1.0, { 'loss': 0.5, 'val_loss': 2.0 })
+    ])
+    assert_equal(len(pending), 0)
+
+def test_materialize_numpy():
+    pending = PendingRows()
+    pending.append(0, { 'loss': np.float32(0.5), 'acc': np.array([0.25]) })
+    pending.append(1, { 'loss': np.array(0.75), 'acc': np.array([0.5]) })
+
+    rows = pending.materialize()
+    assert_equal(rows, [
+        (0.0, { 'loss': 0.5, 'acc': 0.25 }),
+        (1.0, { 'loss': 0.75, 'acc': 0.5 })
+    ])
+    assert_equal(type(rows[0][1]['loss']), float)
+
+def test_materialize_tensorflow():
+    weight = tf.Variable(2.0)
+    pending = PendingRows()
+    pending.append(0, { 'loss': weight * 0.25 })
+    pending.append(1, { 'loss': tf.constant([0.125]) })
+
+    assert_equal(pending.materialize(), [
+        (0.0, { 'loss': 0.5 }),
+        (1.0, { 'loss': 0.125 })
+    ])
+
+def test_materialize_torch():
+    try:
+        import torch
+    except ModuleNotFoundError:
+        raise SkipTest('torch is not installed')
+
+    weight = torch.tensor(2.0, requires_grad=True)
+    pending = PendingRows()
+    pending.append(0, { 'loss': weight * 0.25 })
+    pending.append(1, { 'loss': torch.tensor([0.125]) })
+
+    assert_equal(pending.materialize(), [
+        (0.0, { 'loss': 0.5 }),
+        (1.0, { 'loss': 0.125 })
+    ])
+
+@raises(ValueError)
+def test_append_string():
+    PendingRows().append(0, { 'loss': '0.5' })
+
+@raises(ValueError)
+def test_append_none():
+    PendingRows().append(0, { 'loss': None })
+
+def test_materialize_error_clears_rows():
+    pending = PendingRows()
+    pending.append(0, { 'loss': np.array([1.0, 2.0]) })
+    with assert_raises_regex(ValueError, 'y\\["loss"\\]'):
+        pending.materialize()
+    assert_equal(len(pending), 0)
+
+    pending.append(1, { 'loss': 0.5 })
+    assert_equal(pending.materialize(), [(1.0, { 'loss': 0.5 })])
@@ -1,12 +1,126 @@
 
+import sys
+import copy
+import bisect
 import time
 import uuid
 import json
+import warnings
+import threading
+import hashlib
+import functools
 import os.path as path
-import IPython
+
+from .columnar_history import ColumnarHistory, as_float64_buffer, presence_mask
+from .pending_rows import PendingRows
+from .decimation import MinMaxDecimator
+from .history_pyramid import HistoryPyramid
+from .wire_format import validate_encoding, encode_columns, compress_payload, estimate_json_size
+from .flush_timer import AdaptiveFlushTimer
+from .draw_worker import DrawWorker
+from .comm_transport import CommTransport
+from .metric_log import MetricLogReader, MetricLogWriter
+from .plot_stats import PlotStats
+from .streaming_transforms import StreamingTransforms, validate_transform
+
+def _ipython_display():
+    # IPython is only imported once a plot is created, such importing
+    # lrcurve stays fast.
+    import IPython.display
+    return IPython.display
 
 web_assets_dir = path.join(path.dirname(path.realpath(__file__)), 'web_assets')
 
+# The web assets are injected in the first plot of the kernel session, later
+# plots reuse the assets already loaded in the frontend. The first plot also
+# stores the assets in the browser's localStorage, from where later plots
+# load them if the frontend was reloaded, or the notebook is reopened.
+_web_assets_injected = False
+
+@functools.lru_cache(maxsize=None)
+def read_web_asset(filename):
+    """Returns the content of a file in the web assets directory, such as
+    'learning_curve.css'. The content is cached."""
+    with open(path.join(web_assets_dir, filename)) as fp:
+        return fp.read()
+
+def web_assets_html():
+    """Returns the web assets as `<style>` and `<script>` tags."""
+    return (
+        f'<style>{read_web_asset("learning_curve.css")}</style>'
+        f'<script>{read_web_asset("d3.bundle.js")}</script>'
+        f'<script>{read_web_asset("learning_curve.js")}</script>'
+    )
+
+@functools.lru_cache(maxsize=None)
+def _web_assets_json():
+    assets = json.dumps({
+        'css': read_web_asset('learning_curve.css'),
+        'scripts': [read_web_asset('d3.bundle.js'), read_web_asset('learning_curve.js')]
+    })
+    # The key includes a hash of the assets, such a new version of lrcurve
+    # does not use the assets stored by an old version.
+    key = f'lrcurve-assets-{hashlib.sha1(assets.encode("utf-8")).hexdigest()[:12]}'
+    return (key, assets.replace('</', '<\\/'))
+
+_install_web_assets_js = (
+    'function (assets) {'
+    '  var style = document.createElement("style");'
+    '  style.textContent = assets.css;'
+    '  document.head.appendChild(style);'
+    '  assets.scripts.forEach(function (script) { (0, eval)(script); });'
+    '}'
+)
+
+def _store_web_assets_html():
+    # Loads the assets and stores them in localStorage for the later plots
+    key, assets = _web_assets_json()
+    return (
+        f'<script>(function (install, assets) {{'
+        f'  if (!window.setupLearningCurve) install(assets);'
+        f'  try {{'
+        f'    Object.keys(window.localStorage).forEach(function (key) {{'
+        f'      if (key.startsWith("lrcurve-assets-")) window.localStorage.removeItem(key);'
+        f'    }});'
+        f'    window.localStorage.setItem("{key}", JSON.stringify(assets));'
+        f'  }} catch (error) {{}}'
+        f'}})({_install_web_assets_js}, {assets});</script>'
+    )
+
+def _load_web_assets_js(run=''):
+    # Loads the assets from localStorage if they are missing, then calls
+    # `run`. If they are not stored either, `run` is queued until another
+    # output loads the assets.
+    key, _ = _web_assets_json()
+    return (
+        f'(function (install, run) {{'
+        f'  if (!window.setupLearningCurve) {{'
+        f'    var assets = null;'
+        f'    try {{ assets = JSON.parse(window.localStorage.getItem("{key}")); }} catch (error) {{}}'
+        f'    if (!assets) return (window.lrcurveQueue = window.lrcurveQueue || []).push(run);'
+        f'    install(assets);'
+        f'  }}'
+        f'  run();'
+        f'}})({_install_web_assets_js}, function () {{ {run} }});'
+    )
+
+def _should_inject_web_assets(inline_assets):
+    global _web_assets_injected
+    # In Google Colab each output is rendered in its own iframe, so the
+    # assets can't be shared between plots.
+    if inline_assets or not _web_assets_injected or 'google.colab' in sys.modules:
+        _web_assets_injected = True
+        return True
+    return False
+
+def _redecimated(decimator, buckets):
+    # Decimates the points of a decimator further, to fewer buckets
+    redecimated = MinMaxDecimator(buckets)
+    for key, (xs, ys) in decimator.columns().items():
+        for x, y in zip(xs, ys):
+            redecimated.add(key, x, y)
+    return redecimated
+
 def _valid_limit(limit):
     return (
         isinstance(limit, list) and
@@ -15,7 +129,7 @@ def _valid_limit(limit):
         (limit[1] is None or isinstance(limit[1], (float, int)))
     )
 
-def validate_settings(height, width, mappings, line_config, facet_config, xaxis_config):
+def validate_settings(height, width, mappings, line_config, facet_config, xaxis_config, renderer='svg'):
     # arguments assertion
     if not isinstance(height, int) or height <= 0:
         raise ValueError(f'height must be a positive number or None, was {height}')
@@ -30,6 +144,10 @@ def validate_settings(height, width, mappings, line_config, facet_config, xaxis_
             raise ValueError(f'line_config["{line_key}"]["name"] must a string')
         if 'color' not in line_def or not isinstance(line_def['color'], str):
             raise ValueError(f'line_config["{line_key}"]["color"] must a string')
+        if 'dash' in line_def and not isinstance(line_def['dash'], str):
+            raise ValueError(f'line_config["{line_key}"]["dash"] must a string')
+        if 'group' in line_def and not isinstance(line_def['group'], str):
+            raise ValueError(f'line_config["{line_key}"]["group"] must a string')
 
     if not isinstance(facet_config, dict):
         raise ValueError('line_config must be a dict')
@@ -45,6 +163,9 @@ def validate_settings(height, width, mappings, line_config, facet_config, xaxis_
 
     if not isinstance(mappings, dict):
         raise ValueError('mappings must be a dict')
+    # learning_curve.js draws one band per line, like it draws one data key
+    # per line, so only one key of a line can have a band transform
+    band_keys = dict()
     for mapping_key, mapping_def in mappings.items():
         if 'line' not in mapping_def or not isinstance(mapping_def['line'], str):
             raise ValueError(f'mappings["{mapping_key}"]["line"] must a string')
@@ -54,12 +175,76 @@ def validate_settings(height, width, mappings, line_config, facet_config, xaxis_
             raise ValueError(f'the mapping line {mapping_def["line"]} must exist in line_config')
         if mapping_def['facet'] not in facet_config:
             raise ValueError(f'the mapping facet {mapping_def["facet"]} must exist in facet_config')
+        if 'transform' in mapping_def:
+            validate_transform(mapping_key, mapping_def['transform'])
+            if mapping_def['transform']['type'] == 'band':
+                line = (mapping_def['facet'], mapping_def['line'])
+                if line in band_keys:
+                    raise ValueError(
+                        f'mappings["{mapping_key}"] and mappings["{band_keys[line]}"] both have a band '
+                        f'transform, but only one key of the line {line[1]} can have a band'
+                    )
+                band_keys[line] = mapping_key
 
     if 'name' not in xaxis_config or not isinstance(xaxis_config['name'], str):
         raise ValueError(f'xaxis_config["name"] must a string')
     if 'limit' not in xaxis_config or not _valid_limit(xaxis_config['limit']):
         raise ValueError(f'xaxis_config["limit"] must be a list with length two')
 
+    if renderer not in {'svg', 'canvas'}:
+        raise ValueError(f'renderer must either svg or canvas, was {renderer}')
+
+def create_settings(height, width, mappings, line_config, facet_config, xaxis_config, renderer='svg'):
+    """Validates the plot configuration, and converts it to the settings
+    used by `learning_curve.js`. The `id` is not included."""
+    height = len(facet_config) * 200 + 90 if height is None else height
+    validate_settings(height, width, mappings, line_config, facet_config, xaxis_config, renderer)
+
+    return {
+        'width': width,
+        'height': height,
+        'mappings': mappings,
+        'lineConfig': line_config,
+        'facetConfig': facet_config,
+        'xAxisConfig': xaxis_config,
+        'renderer': renderer
+    }
+
+def settings_delta(previous, current):
+    """Returns the settings that changed from `previous` to `current`, such
+    `learning_curve.js` can add the new lines and facets without recreating
+    the figure. Returns None, if the figure must be recreated because lines
+    or facets were removed, or the width, x-axis, or renderer changed."""
+    if previous is None:
+        return None
+    for name in ['width', 'xAxisConfig', 'renderer']:
+        if previous[name] != current[name]:
+            return None
+
+    delta = dict()
+    for name in ['mappings', 'lineConfig', 'facetConfig']:
+        if not previous[name].keys() <= current[name].keys():
+            return None
+        changed = {
+            key: value for key, value in current[name].items()
+            if previous[name].get(key) != value
+        }
+        if len(changed) > 0:
+            delta[name] = changed
+
+    # The frontend stores the data by line and facet, so moving a key
+    # requires recreating the figure.
+    for key, mapping_def in delta.get('mappings', dict()).items():
+        if key in previous['mappings'] and (
+            previous['mappings'][key]['line'] != mapping_def['line'] or
+            previous['mappings'][key]['facet'] != mapping_def['facet']
+        ):
+            return None
+
+    if previous['height'] != current['height']:
+        delta['height'] = current['height']
+    return delta
+
 class PlotLearningCurve:
     """Framework agnostic interface to plot learning curves.
 
@@ -88,7 +273,15 @@ class PlotLearningCurve:
         width: The width in pixels of the plot (default 600).
         mappings: dict describing how each data key relates to a facet and line.
             The line and facet values, are the keys described in line_config
-            and facet_config.
+            and facet_config. Optionally, a `transform` can smooth the values
+            of a key, before they are sent to the figure. The transform is
+            either `{ 'type': 'ema', 'alpha': 0.1 }`, a rolling mean
+            `{ 'type': 'mean', 'window': 100 }`, or a rolling mean with a
+            shaded band of ± one standard deviation
+            `{ 'type': 'band', 'window': 100 }`, which at most one key of
+            each line can have. Adding `'stride': 100`
+            only sends every 100th transformed value, which reduces the
+            data sent to the figure.
             Default is:
                 {
                     'loss': { 'line': 'train', 'facet': 'loss' },
@@ -96,6 +289,9 @@ class PlotLearningCurve:
                 }
         line_config: dict mapping line-keywords to presented name and color.
             The name is a string and the color should be CSS-SVG compatible.
+            Optionally, `dash` is a SVG stroke-dasharray such as '6,3', and
+            `group` is a string. Lines with a group are shown in the legend
+            by their group, and clicking the group hides its lines.
             Default is:
                 {
                     'train': { 'name': 'Train', 'color': '#F8766D' },
@@ -115,6 +311,9 @@ class PlotLearningCurve:
             dynamically change.
             Default is:
                 { 'name': 'Epoch', 'limit': [0, None] }
+        renderer: How the lines are drawn, either 'svg' or 'canvas' (default
+            'svg'). The axes, grid, and legend are always SVG, but drawing
+            the lines on a canvas is much faster when there are many points.
         display_fn: To display HTML or JavaScript in a notebook with an IPython
             backend, `IPython.display.display` is called. The called function
             can be overwritten by setting this argument (mostly useful for
@@ -122,27 +321,180 @@ class PlotLearningCurve:
         debug: Depending on the notebook, a JavaScript evaluation does not provide
             a stack trace in the developer console. Setting this to `true` works
             around that by injecting `<script>` tags instead.
+        decimate: Only send the points that can change the rendered line
+            (default False). Each line is reduced to the minimum and maximum
+            point per horizontal pixel, based on `width`. This keeps the size
+            of each update bounded, no matter how long the training runs.
+        encoding: The format used to send the data to the frontend (default
+            'json'). Setting this to 'float64' or 'float32' sends each line
+            as base64 encoded typed arrays instead. This reduces the size of
+            each update and avoids the JSON parsing, which is useful on
+            remote connections.
+        max_updates_per_second: Rate limit the updates of the figure (default
+            None). When set, `.draw()` only schedules an update, which is sent
+            from a background thread. The rate is lowered further if updating
+            the figure is slow. This allows calling `.draw()` on every
+            iteration, without paying the display latency every time.
+        background_draw: Send the updates from a background thread (default
+            False). When set, `.draw()` only wakes up the background thread,
+            which serializes and sends the data appended so far. Thus the
+            training loop never waits for the serialization or the display.
+            This is implied by `max_updates_per_second`.
+        transport: How the updates are sent to the frontend (default 'display').
+            'display' replaces the JavaScript in a display handle, this works
+            everywhere but requires a 1 second delay when the plot is created.
+            'comm' sends the updates over a Jupyter comm, which the frontend
+            acknowledges. This provides backpressure. The kernel only learns
+            that the frontend supports the comm when it is idle, so 'display'
+            is used until then, e.g. while the cell that created the plot is
+            running. In particular, creating the plot and training in the
+            same cell still has the 1 second delay. The comm is supported by the classic Jupyter Notebook
+            and Google Colab. Other frontends, such as JupyterLab and VS Code,
+            do not give the output access to the kernel, so they always use
+            'display'.
+        comm_fn: Creates the Jupyter comm used by the 'comm' transport, the
+            default is `comm.create_comm` (mostly useful for internal testing).
+        inline_assets: Include the JavaScript and CSS assets in the plot output
+            (default False). By default the assets are only included in the
+            first plot of the kernel session, as later plots can reuse them.
+            The first plot also stores the assets in the browser's
+            localStorage, which later plots use if the frontend was reloaded.
+            This should be set if the output of the first plot was cleared,
+            and the notebook is opened in another browser.
+        log_path: Stream the data to an append-only file (default None). The
+            file is written on every `.draw()`, such the data is preserved
+            if the kernel crashes before `.finalize()` is called. The plot
+            can be recreated from the file with `PlotLearningCurve.from_log`.
+            Rows appended between draws are written within a second.
+            An existing file is overwritten.
+        persist_max_points: The maximal number of points per line, that
+            `.finalize()` saves in the notebook (default None). Each line is
+            reduced using the same min/max decimation as `decimate`.
+        persist_max_bytes: The maximal size in bytes of the output, that
+            `.finalize()` saves in the notebook (default None). This includes
+            the settings and the data, but not the web assets, which are
+            saved once by the first plot. The data is decimated to the number
+            of points estimated to fit, and then halved until it fits. If not
+            even the minimum and maximum of each line fits, those are saved
+            anyway, and a warning is shown.
+        persist_compress: Compress the data that `.finalize()` saves in the
+            notebook using zlib (default False). Reopening the notebook then
+            requires a browser that supports `DecompressionStream`.
+        stats_fn: Called with the result of `.stats()` after every update of
+            the figure (default None). This is useful for reporting the
+            plotting overhead to a dashboard.
+        retain_points: Only keep the most recent `retain_points` rows at full
+            resolution (default None). Older rows are summarized by their
+            minimum, maximum, and mean, at coarser resolutions the older the
+            rows are. The rows are summarized when the figure is updated,
+            and this implies `decimate`. With the 'comm' transport, zooming
+            in the figure fetches the detail of the zoomed range.
+        retain_max_bytes: The memory budget, in bytes, for the rows kept by
+            `retain_points` and the summaries (default None). The summaries
+            are merged into coarser resolutions, to stay within the budget.
+            By default each resolution has at most `retain_points` summaries.
     """
     def __init__(self,
-                 display_fn=IPython.display.display,
+                 display_fn=None,
                  debug=False,
+                 decimate=False,
+                 encoding='json',
+                 max_updates_per_second=None,
+                 background_draw=False,
+                 transport='display',
+                 comm_fn=None,
+                 inline_assets=False,
+                 log_path=None,
+                 persist_max_points=None,
+                 persist_max_bytes=None,
+                 persist_compress=False,
+                 stats_fn=None,
+                 retain_points=None,
+                 retain_max_bytes=None,
                  **kwargs
     ):
+        self._ipython_display = _ipython_display()
+        validate_encoding(encoding)
+        if transport not in {'display', 'comm'}:
+            raise ValueError(f'transport must either display or comm, was {transport}')
+        if persist_max_points is not None and (not isinstance(persist_max_points, int) or persist_max_points <= 0):
+            raise ValueError(f'persist_max_points must be a positive integer or None, was {persist_max_points}')
+        if persist_max_bytes is not None and (not isinstance(persist_max_bytes, int) or persist_max_bytes <= 0):
+            raise ValueError(f'persist_max_bytes must be a positive integer or None, was {persist_max_bytes}')
+        if retain_points is not None and (not isinstance(retain_points, int) or retain_points <= 0):
+            raise ValueError(f'retain_points must be a positive integer or None, was {retain_points}')
+        if retain_max_bytes is not None and (not isinstance(retain_max_bytes, int) or retain_max_bytes <= 0):
+            raise ValueError(f'retain_max_bytes must be a positive integer or None, was {retain_max_bytes}')
+        if retain_max_bytes is not None and retain_points is None:
+            raise ValueError('retain_max_bytes requires retain_points')
+
+        self._max_updates_per_second = max_updates_per_second
+        self._flush_timer = None
+        if max_updates_per_second is not None:
+            self._flush_timer = AdaptiveFlushTimer(self._flush, max_updates_per_second)
+        elif background_draw:
+            self._flush_timer = DrawWorker(self._flush)
+
         # Store settings
         self._debug = debug
-        self._display = display_fn
+        self._decimate = decimate
+        self._encoding = encoding
+        self._persist_max_points = persist_max_points
+        self._persist_max_bytes = persist_max_bytes
+        self._persist_compress = persist_compress
+        self._retain_points = retain_points
+        self._retain_max_bytes = retain_max_bytes
+        self._stats = PlotStats()
+        self._stats_fn = stats_fn
+        self._decimator = None
+        self._display = self._ipython_display.display if display_fn is None else display_fn
         self._settings = {
             'id': str(uuid.uuid4())
         }
 
-        # Prepear data containers
-        self._data = []
-        self._backlog = []
-        self._display(self._create_inital_html())
+        # Prepear data containers. The backlog is the rows in self._data
+        # from self._backlog_start and onwards. The data lock protects the
+        # data containers, while the update lock ensures the updates are
+        # sent in order.
+        self._data = ColumnarHistory()
+        self._pyramid = None if retain_points is None else HistoryPyramid()
+        self._pending = PendingRows()
+        self._transforms = StreamingTransforms({})
+        self._backlog_start = 0
+        # Set when the frontend must clear its data before the backlog
+        # is appended, because the backlog is sent again
+        self._backlog_reset = False
+        self._log = None if log_path is None else MetricLogWriter(log_path)
+        self._log_start = 0
+        # The appended rows are also written to the log between draws, at
+        # most once per second
+        self._log_timer = None if log_path is None else AdaptiveFlushTimer(self._flush_log, 1)
+        self._follow_stop = None
+        self._data_lock = threading.Lock()
+        self._update_lock = threading.Lock()
+        self._display(self._create_inital_html(_should_inject_web_assets(inline_assets)))
         self._update_element = self._display(
-            IPython.display.Javascript('void(0);'),
+            self._ipython_display.Javascript('void(0);'),
             display_id=True
         )
+        self._display_initialized = False
+        self._frontend_settings = None
+
+        # The comm must be opened after the initial HTML has been displayed,
+        # as that is where the comm target is registered.
+        self._transport = None
+        self._transport_setup = False
+        if transport == 'comm':
+            try:
+                self._transport = CommTransport(
+                    comm_fn, on_close=self._fallback_to_display, on_fetch=self._send_detail
+                )
+            except ModuleNotFoundError:
+                warnings.warn(
+                    "transport='comm' requires the comm package, "
+                    "using transport='display' instead"
+                )
+
         self.reconfigure(**kwargs)
 
     def reconfigure(self,
@@ -159,30 +511,141 @@ class PlotLearningCurve:
                     facet_config = {
                         'loss': { 'name': 'loss', 'limit': [None, None], 'scale': 'log10' }
                     },
-                    xaxis_config = { 'name': 'Epoch', 'limit': [0, None] }
+                    xaxis_config = { 'name': 'Epoch', 'limit': [0, None] },
+                    renderer = 'svg'
     ):
         """Change the plot settings, after the plot have been initally drawn.
 
         This is useful for when additional facets or lines have been discovered.
+        Only the added or changed lines and facets are sent to the frontend,
+        which adds them without redrawing the existing facets.
         """
-        height = len(facet_config) * 200 + 90 if height is None else height
-        validate_settings(height, width, mappings, line_config, facet_config, xaxis_config)
-
-        self._settings.update({
-            'width': width,
-            'height': height,
-            'mappings': mappings,
-            'lineConfig': line_config,
-            'facetConfig': facet_config,
-            'xAxisConfig': xaxis_config
-        })
-
-        disp = self._create_setup_javascript()
+        self._reconfigure_kwargs = dict(
+            height=height, width=width, mappings=mappings, line_config=line_config,
+            facet_config=facet_config, xaxis_config=xaxis_config, renderer=renderer
+        )
+        self._settings.update(create_settings(**self._reconfigure_kwargs))
+        if self._log is not None:
+            self._log.write_settings(self._reconfigure_kwargs)
+
+        # Re-decimate the history, when the resolution changes
+        with self._data_lock:
+            self._materialize_pending()
+            self._transforms = StreamingTransforms(mappings, self._transforms)
+            if (self._decimate or self._pyramid is not None) and \
+               (self._decimator is None or self._decimator_width != width):
+                self._decimator = self._decimated(width)
+                self._decimator_width = width
+
+        delta = settings_delta(self._frontend_settings, self._settings)
+        self._frontend_settings = copy.deepcopy(self._settings)
+        self._stats.add(reconfigures=1)
+        if delta is not None and len(delta) == 0:
+            return
+
+        with self._update_lock:
+            was_setup = self._transport_setup
+            transport = self._ready_transport()
+            # If the transport was just set up, the full settings have been sent
+            if transport is not None and was_setup:
+                if delta is None:
+                    transport.send('setup', self._settings['id'], settings=self._settings)
+                else:
+                    transport.send('reconfigure', self._settings['id'], changes=delta)
+        if transport is not None:
+            return
+
+        disp = self._create_setup_javascript(delta)
         # A bug in Google Colab means that sometimes the .update() doesn't get executed at all
         # if the iframe is not properly initialized yet. Unfortunately, I can't find a way
         # to probe if the initialization is complete. Instead, add a 1 second delay.
-        time.sleep(1)
-        self._update_element.update(disp)
+        # This is only needed for the first setup. Afterwards, the iframe is initialized,
+        # and the draw() updates are already sent through the same display handle
+        # without any delay.
+        if not self._display_initialized:
+            time.sleep(1)
+            self._display_initialized = True
+            self._stats.add(sleep_seconds=1)
+        with self._update_lock:
+            self._update_element.update(disp)
+
+    @classmethod
+    def from_log(cls, log_path, follow=False, poll_interval=1, **kwargs):
+        """Creates a plot from a file written using the `log_path` argument.
+
+        The plot settings stored in the file are used, unless they are
+        overwritten by `kwargs`.
+
+        Example:
+            plot = PlotLearningCurve.from_log('run.lrcurve', follow=True)
+            # ... once the run is done
+            plot.finalize()
+
+        Arguments:
+            log_path: str - The path of the file.
+            follow: bool - Keep reading the rows another process appends to
+                the file, until `.finalize()` is called (default False).
+            poll_interval: number - Seconds between reading the file, when
+                `follow` is true (default 1).
+            kwargs: The arguments for `PlotLearningCurve`.
+        """
+        reader = MetricLogReader(log_path)
+        records = reader.read()
+
+        settings = dict()
+        for kind, record in records:
+            if kind == 'settings':
+                settings = record
+        plot = cls(**{ **settings, **kwargs })
+        plot._extend_from_log(records)
+        plot.draw()
+
+        if follow:
+            plot._follow_stop = threading.Event()
+            threading.Thread(
+                target=plot._follow_log, args=(reader, poll_interval), daemon=True
+            ).start()
+        return plot
+
+    def _extend_from_log(self, records):
+        with self._data_lock:
+            self._materialize_pending()
+            for kind, record in records:
+                if kind == 'rows':
+                    self._data.extend_sparse(*record)
+
+    def _follow_log(self, reader, poll_interval):
+        while not self._follow_stop.wait(poll_interval):
+            records = reader.read()
+            self._extend_from_log(records)
+            self.draw()
+
+    def _write_log(self):
+        if self._log is not None and len(self._data) > self._log_start:
+            self._log.write_rows(self._data, self._log_start, len(self._data))
+            self._log_start = len(self._data)
+
+    def _fallback_to_display(self):
+        # The frontend closed the comm, so send everything again using
+        # the display handle. This is not needed if the plot is finalized.
+        if self._transport is None:
+            return
+        self._transport = None
+        # Nothing was sent over the comm, if the frontend never confirmed it
+        if not self._transport_setup:
+            return
+        self._frontend_settings = None
+
+        with self._data_lock:
+            # The frontend already has the rows sent over the comm, so they
+            # must be cleared before everything is sent again
+            self._backlog_start = 0
+            if self._decimator is not None:
+                self._decimator = self._decimated(self._decimator_width)
+            else:
+                self._backlog_reset = True
+        self.reconfigure(**self._reconfigure_kwargs)
+        self._flush(force=True)
 
     def __enter__(self):
         return self
@@ -190,68 +653,401 @@ class PlotLearningCurve:
     def __exit__(self, *args):
         self.finalize()
 
-    def _create_inital_html(self):
-        with open(path.join(web_assets_dir, 'd3.bundle.js')) as d3_fp, \
-             open(path.join(web_assets_dir, 'learning_curve.css')) as css_fp, \
-             open(path.join(web_assets_dir, 'learning_curve.js')) as js_fp:
-            return IPython.display.HTML(
-                f'<style>{css_fp.read()}</style>'
-                f'<script>{d3_fp.read()}</script>'
-                f'<script>{js_fp.read()}</script>'
-                f'<svg id="{self._settings["id"]}" class="learning-curve"></svg>'
-            )
+    def _create_inital_html(self, inject_web_assets):
+        return self._ipython_display.HTML(
+            (_store_web_assets_html() if inject_web_assets else '') +
+            f'<svg id="{self._settings["id"]}" class="learning-curve"></svg>'
+            f'<script>'
+            f'  {_load_web_assets_js()}'
+            # When the notebook is reopened, an output after this one may
+            # still load the assets, so the message is removed if they load.
+            f'  setTimeout(() => {{'
+            f'    if (!window.setupLearningCurve) {{'
+            f'      const message = document.createElement("pre");'
+            f'      message.textContent = "lrcurve: the web assets are not loaded, use PlotLearningCurve(inline_assets=True)";'
+            f'      document.getElementById("{self._settings["id"]}").before(message);'
+            f'      (window.lrcurveQueue = window.lrcurveQueue || []).push(() => message.remove());'
+            f'    }}'
+            f'  }});'
+            f'</script>'
+        )
+
+    def _create_setup_javascript(self, delta=None):
+        if delta is None:
+            call = f'window.setupLearningCurve("{self._settings["id"]}", {json.dumps(self._settings)});'
+        else:
+            call = f'window.reconfigureLearningCurve("{self._settings["id"]}", {json.dumps(delta)});'
 
-    def _create_setup_javascript(self):
         if self._debug:
-            return IPython.display.HTML(
-                f'<script>'
-                f'  window.setupLearningCurve("{self._settings["id"]}", {json.dumps(self._settings)});'
-                f'</script>'
-            )
+            return self._ipython_display.HTML(f'<script>  {call}</script>')
         else:
-            return IPython.display.Javascript(
-                f'window.setupLearningCurve("{self._settings["id"]}", {json.dumps(self._settings)});'
-            )
+            return self._ipython_display.Javascript(call)
 
-    def _create_append_javascript(self):
+    def _create_append_javascript(self, data, options=None):
         if self._debug:
-            return IPython.display.HTML(
+            return self._ipython_display.HTML(
                 f'<script>'
-                f'  window.appendLearningCurve("{self._settings["id"]}", {json.dumps(self._backlog)});'
+                f'  window.appendLearningCurve("{self._settings["id"]}", {json.dumps(data)}, {json.dumps(options)});'
                 f'</script>'
             )
         else:
-            return IPython.display.Javascript(
-                f'window.appendLearningCurve("{self._settings["id"]}", {json.dumps(self._backlog)});'
+            return self._ipython_display.Javascript(
+                f'window.appendLearningCurve("{self._settings["id"]}", {json.dumps(data)}, {json.dumps(options)});'
             )
 
+    def _create_finalized_html(self, serialized_data):
+        # When the notebook is reopened, the assets may be loaded by a later
+        # output, so wait for them rather than including them.
+        return self._ipython_display.HTML(
+            f'<script>' +
+            _load_web_assets_js(
+                f'window.setupLearningCurve("{self._settings["id"]}", {json.dumps(self._settings)});'
+                f'window.appendLearningCurve("{self._settings["id"]}", {serialized_data});'
+            ) +
+            f'</script>'
+        )
+
+    def _serialize_backlog(self):
+        columnar = self._encoding != 'json'
+        if self._decimator is not None:
+            self._decimator.extend(self._data, self._backlog_start)
+            options, data = self._decimator.flush(columnar=columnar)
+        else:
+            options = { 'reset': True } if self._backlog_reset else None
+            self._backlog_reset = False
+            if columnar:
+                data = self._data.columns(self._backlog_start)
+            else:
+                data = self._data.rows(self._backlog_start)
+
+        if columnar:
+            self._stats.add(points_sent=sum(len(xs) for xs, _ in data.values()))
+        else:
+            self._stats.add(points_sent=sum(len(y) for _, y in data))
+        self._backlog_start = len(self._data)
+        return (encode_columns(data, self._encoding) if columnar else data, options)
+
+    def _serialize_history(self, source):
+        if self._encoding == 'json':
+            data = source.rows()
+        else:
+            data = encode_columns(source.columns(), self._encoding)
+        return compress_payload(data) if self._persist_compress else data
+
+    def _serialize_persisted(self):
+        # Returns the data saved by .finalize(), serialized as JSON. Without
+        # any limits, everything that was drawn is persisted.
+        if self._persist_max_points is None:
+            source = self._data if self._decimator is None else self._decimator
+        else:
+            # Each bucket keeps up to two points per line
+            source = self._decimated(max(1, self._persist_max_points // 2))
+        serialized = json.dumps(self._serialize_history(source))
+        if self._persist_max_bytes is None:
+            return serialized
+
+        # The limit also includes the settings and the rest of the output
+        overhead = len(self._create_finalized_html('').data)
+        if overhead + len(serialized) <= self._persist_max_bytes:
+            return serialized
+
+        # Decimate to the number of buckets estimated to fit, from the size
+        # per point. Then halve the buckets until the data fits. Only the
+        # first step decimates the history, the following steps decimate
+        # the previous decimated points.
+        if isinstance(source, MinMaxDecimator):
+            lengths = [len(xs) for xs, _ in source.columns().values()]
+        else:
+            lengths = [len(source.column(key)[1]) for key in source.keys()]
+        budget = max(0, self._persist_max_bytes - overhead)
+        buckets = max(1, int(budget / len(serialized) * sum(lengths) / (2 * max(1, len(lengths)))))
+        while True:
+            if isinstance(source, MinMaxDecimator):
+                source = _redecimated(source, buckets)
+            else:
+                source = self._decimated(buckets)
+            serialized = json.dumps(self._serialize_history(source))
+            size = overhead + len(serialized)
+            if size <= self._persist_max_bytes:
+                return serialized
+            if buckets == 1:
+                # Keep the minimum and maximum of each line, rather than
+                # silently persisting an empty figure
+                warnings.warn(
+                    f'persist_max_bytes={self._persist_max_bytes} is too small, '
+                    f'persisting only the minimum and maximum of each line ({size} bytes)'
+                )
+                return serialized
+            buckets //= 2
+
+    def _decimated(self, buckets, x_range=None):
+        # Decimates the summaries and the rows at full resolution
+        decimator = MinMaxDecimator(buckets)
+        start, stop = (0, len(self._data))
+        if self._pyramid is not None:
+            self._pyramid.feed(decimator, x_range)
+        if x_range is not None:
+            start = bisect.bisect_left(self._data.x(), x_range[0])
+            stop = bisect.bisect_right(self._data.x(), x_range[1])
+        decimator.extend(self._data, start, stop)
+        return decimator
+
+    def _compact(self):
+        # Summarize the oldest rows, once they have been sent and logged.
+        # The rows are summarized in batches, as removing rows from the
+        # history copies the remaining rows.
+        excess = len(self._data) - self._retain_points
+        if excess < max(1, self._retain_points // 4):
+            return
+        count = min(excess, self._backlog_start if self._log is None else
+                            min(self._backlog_start, self._log_start))
+        if count <= 0:
+            return
+
+        self._pyramid.extend(self._data, 0, count)
+        self._data.discard(count)
+        self._backlog_start -= count
+        self._log_start -= count
+
+        if self._retain_max_bytes is None:
+            capacity = self._retain_points
+        else:
+            capacity = self._pyramid.capacity(self._retain_max_bytes - self._data.nbytes())
+        self._pyramid.shrink(capacity)
+
+    def _ready_transport(self):
+        # Returns the comm transport, once the frontend has confirmed that
+        # it supports the comm. The frontend may already have been set up
+        # using the display handle, so the full settings are sent first,
+        # which also gives the frontend the comm for fetching details.
+        # Must be called with the update lock held.
+        transport = self._transport
+        if transport is None or not transport.ready:
+            return None
+        if not self._transport_setup:
+            transport.send('setup', self._settings['id'], settings=self._settings)
+            self._transport_setup = True
+        return transport
+
+    def _send_detail(self, request):
+        # The frontend requests the points of a zoomed x-range. Without
+        # decimation, the frontend already has all the points.
+        transport = self._transport
+        if transport is None or self._decimator is None:
+            return
+
+        x_range = request['range']
+        with self._data_lock:
+            self._materialize_pending()
+            decimator = self._decimated(request['points'], x_range)
+        if self._encoding == 'json':
+            data = decimator.rows()
+        else:
+            data = encode_columns(decimator.columns(), self._encoding)
+
+        with self._update_lock:
+            transport.send('detail', self._settings['id'],
+                           request=request['request'], range=x_range, data=data)
+
     def append(self, x, y):
         """Appends graph data without updating the figure.
 
         It can be useful to append several data-points before updating the
         figure with `.draw()`.
 
+        The y-axis values can be numbers, or scalar tensors or arrays from
+        PyTorch, TensorFlow, or NumPy. Tensors and arrays are not converted
+        until the figure is updated, where all values for a key are converted
+        at once. This avoids a device synchronization on every `.append()`.
+
+        It is safe to call `.append()` from multiple threads. When the figure
+        is updated from a background thread, the values are also converted
+        on the background thread.
+
         Arguments:
             x: number - The x axis value, typically the epoch or iteration.
             y: dict - A mapping between the mappings-key and the y-axis value.
                 NOte that not all mapping-keys have to be included.
         """
-        x = x
-        y = { key: float(value) for key, value in y.items() }
-        row = [x, y]
-        self._data.append(row)
-        self._backlog.append(row)
+        with self._data_lock:
+            if self._flush_timer is None and len(self._pending) == 0 and \
+               all(isinstance(value, (int, float)) for value in y.values()):
+                self._append_row(float(x), { key: float(value) for key, value in y.items() })
+            else:
+                self._pending.append(x, dict(y))
+        if self._log_timer is not None:
+            self._log_timer.schedule()
+
+    def append_many(self, xs, ys, masks=None):
+        """Appends many data-points at once, without updating the figure.
+
+        This is much faster than calling `.append()` for every row, which is
+        useful when importing existing logs or replaying a finished run. The
+        columns are validated and converted as a whole.
+
+        Arguments:
+            xs: sequence or array - The x axis values.
+            ys: dict - A mapping between the mappings-key and a sequence or
+                array of y-axis values, with the same length as `xs`. NaN
+                values are considered missing.
+            masks: dict - An optional mapping between the mappings-key and
+                a sequence or array of booleans, where false means missing.
+                If specified for a key, NaN values are not treated specially.
+        """
+        masks = dict() if masks is None else masks
+        x = as_float64_buffer(xs)
+        columns = dict()
+        for key, values in ys.items():
+            values = as_float64_buffer(values)
+            if len(values) != len(x):
+                raise ValueError(f'ys["{key}"] must have the same length as xs')
+            mask = presence_mask(values, masks.get(key))
+            if len(mask) != len(x):
+                raise ValueError(f'masks["{key}"] must have the same length as xs')
+            columns[key] = (values, mask)
+
+        with self._data_lock:
+            self._materialize_pending()
+            if self._transforms.keys().isdisjoint(columns.keys()):
+                self._data.extend(x, columns)
+            else:
+                # The transforms must see the values one at the time
+                for i in range(len(x)):
+                    self._append_row(x[i], {
+                        key: values[i] for key, (values, mask) in columns.items() if mask[i]
+                    })
+        if self._log_timer is not None:
+            self._log_timer.schedule()
+
+    def _append_row(self, x, y):
+        if len(self._transforms) > 0 and len(y) > 0:
+            y = self._transforms.apply(y)
+            if len(y) == 0:
+                return
+        self._data.append(x, y)
+
+    def _materialize_pending(self):
+        if len(self._pending) > 0:
+            for x, y in self._pending.materialize():
+                self._append_row(x, y)
+
+    def _flush_log(self):
+        with self._update_lock:
+            if self._log is not None:
+                with self._data_lock:
+                    self._materialize_pending()
+                    self._write_log()
+
+    def _flush(self, force=False):
+        with self._update_lock:
+            if self._log is not None:
+                with self._data_lock:
+                    self._materialize_pending()
+                    self._write_log()
+
+            transport = self._ready_transport()
+            # Let the data accumulate in the backlog, if the frontend is behind
+            if transport is not None and not force and not transport.can_send():
+                return
+
+            start = time.perf_counter()
+            with self._data_lock:
+                self._materialize_pending()
+                if len(self._data) == self._backlog_start:
+                    return
+                data, options = self._serialize_backlog()
+                if self._pyramid is not None:
+                    self._compact()
+
+            if transport is not None:
+                # The comm encodes the message itself, so encoding it here
+                # as well would double the cost.
+                size = estimate_json_size(data)
+                serialized = time.perf_counter()
+                transport.send('append', self._settings['id'], data=data, options=options)
+            else:
+                disp = self._create_append_javascript(data, options)
+                size = len(disp.data)
+                serialized = time.perf_counter()
+                self._update_element.update(disp)
+
+            self._stats.add(
+                draws=1, bytes_serialized=size,
+                serialize_seconds=serialized - start,
+                update_seconds=time.perf_counter() - serialized
+            )
+            if self._stats_fn is not None:
+                self._stats_fn(self.stats())
+
+    @property
+    def max_updates_per_second(self):
+        """The rate limit of the figure updates, or None."""
+        return self._max_updates_per_second
+
+    def stats(self):
+        """Returns statistics about the cost of the plot.
+
+        The statistics are a dict with:
+            draws: The number of updates sent to the figure.
+            points_sent: The number of data-points sent to the figure.
+            bytes_serialized: The size of the updates sent to the figure.
+                With the `comm` transport this is estimated, as the comm
+                encodes the updates.
+            serialize_seconds: Time spent converting the data to an update.
+            update_seconds: Time spent sending the updates. With the `comm`
+                transport this includes encoding the updates.
+            reconfigures: The number of times the plot was configured.
+            sleep_seconds: Time spent waiting for the figure to initialize.
+            overhead_seconds: The sum of the time spent above.
+            backlog_rows: The number of rows that have not been sent yet.
+            history_rows: The number of rows in the history, at full resolution.
+            history_bytes: The memory used by the history, including the
+                summaries of `retain_points`, in bytes.
+        """
+        stats = self._stats.snapshot()
+        stats['overhead_seconds'] = (
+            stats['serialize_seconds'] + stats['update_seconds'] + stats['sleep_seconds']
+        )
+        with self._data_lock:
+            stats['backlog_rows'] = len(self._data) + len(self._pending) - self._backlog_start
+            stats['history_rows'] = len(self._data) + len(self._pending)
+            stats['history_bytes'] = self._data.nbytes()
+            if self._pyramid is not None:
+                stats['history_bytes'] += self._pyramid.nbytes()
+        return stats
 
     def draw(self):
         """Updates the figure with the appended data.
 
         Remember to call `.finalize()` to make the new figure presist in
         the saved notebook.
+
+        If `max_updates_per_second` or `background_draw` is set, the update
+        is only scheduled, and sent from a background thread.
         """
-        if len(self._backlog) > 0:
-            disp = self._create_append_javascript()
-            self._backlog = []
-            self._update_element.update(disp)
+        if self._flush_timer is not None:
+            self._flush_timer.schedule()
+        else:
+            self._flush()
+
+    def export(self, output_path, format='html'):
+        """Writes the figure to a standalone file, which does not require a
+        notebook.
+
+        The 'html' format includes the web assets, and is drawn by the same
+        JavaScript as the notebook. The 'svg' format is rendered in Python,
+        and can be viewed without JavaScript. In both cases the data is
+        decimated to the minimum and maximum point per horizontal pixel.
+
+        Arguments:
+            output_path: str - The file to write.
+            format: str - Either 'html' or 'svg' (default 'html').
+        """
+        from .static_export import export_history
+        with self._data_lock:
+            self._materialize_pending()
+            export_history(output_path, self._data, self._settings, format=format,
+                           pyramid=self._pyramid)
 
     def finalize(self):
         """Saves the data to the notebook file, such the graph is presistent.
@@ -260,24 +1056,35 @@ class PlotLearningCurve:
         the notebook file is opened. If saving the notebook results is not
         required, then calling this method is optional.
         """
-        # In case there is data left in the backlog, draw it
-        if len(self._backlog) > 0:
-            self.draw()
+        if self._follow_stop is not None:
+            self._follow_stop.set()
+
+        # In case there is data left in the backlog, draw it now
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush(force=True)
+        if self._log_timer is not None:
+            self._log_timer.cancel()
+        with self._update_lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
 
         # Add a <script> tag containing the data, without affecting the current
         # figure.
-        if self._update_element is not None:
-            self._update_element.update(
-                IPython.display.Javascript(
-                    'window.setupLearningCurve = function (id, settings) {};'
-                    'window.appendLearningCurve = function (id, data) {};'
+        with self._data_lock:
+            self._materialize_pending()
+            serialized = self._serialize_persisted()
+        with self._update_lock:
+            if self._update_element is not None:
+                # Mark the live figure as finalized, such the <script> tag
+                # below only has an effect when the notebook is reopened.
+                self._update_element.update(
+                    self._ipython_display.Javascript(
+                        f'document.getElementById("{self._settings["id"]}").finalized = true;'
+                    )
                 )
-            )
-            self._update_element.update(
-                IPython.display.HTML(
-                    f'<script>'
-                    f'  window.setupLearningCurve("{self._settings["id"]}", {json.dumps(self._settings)});'
-                    f'  window.appendLearningCurve("{self._settings["id"]}", {json.dumps(self._data)});'
-                    f'</script>'
-                )
-            )
+                self._update_element.update(self._create_finalized_html(serialized))
@@ -1,6 +1,17 @@
+import os
+import json
+import zlib
+import time
+import base64
+import warnings
+import threading
+import tempfile
+import numpy as np
 from nose.tools import *
 
 from lrcurve import PlotLearningCurve
+from lrcurve.columnar_history import ColumnarHistory
+from lrcurve.metric_log import MetricLogReader
 
 class DisplayHandle:
     def __init__(self, display_objects):
@@ -15,6 +26,37 @@ def display_replacer(display_objects):
         return DisplayHandle(display_objects)
     return display
 
+class FakeComm:
+    def __init__(self, target_name, data, ready=True):
+        self.target_name = target_name
+        self.messages = []
+        self.closed = False
+        self.ready = ready
+
+    def on_msg(self, callback):
+        self.msg_callback = callback
+        if self.ready:
+            self.receive({ 'event': 'ready' })
+
+    def on_close(self, callback):
+        self.close_callback = callback
+
+    def send(self, data):
+        self.messages.append(data)
+
+    def close(self):
+        self.closed = True
+
+    def receive(self, data):
+        self.msg_callback({ 'content': { 'data': data } })
+
+def comm_replacer(comms, ready=True):
+    def comm_fn(**kwargs):
+        comm = FakeComm(**kwargs, ready=ready)
+        comms.append(comm)
+        return comm
+    return comm_fn
+
 def test_crude_sanity_check():
     # Unfortunetly the notebooks are really the best way to test if
     # things are working.
@@ -67,6 +109,514 @@ def test_with_scope_extern():
 
     assert_equal(len(display_objects), 6)
 
+def test_web_assets_are_injected_once():
+    first = []
+    PlotLearningCurve(display_fn=display_replacer(first), transport='comm', comm_fn=comm_replacer([]))
+    second = []
+    PlotLearningCurve(display_fn=display_replacer(second), transport='comm', comm_fn=comm_replacer([]))
+    inlined = []
+    PlotLearningCurve(display_fn=display_replacer(inlined), transport='comm', comm_fn=comm_replacer([]),
+                      inline_assets=True)
+
+    assert_not_in('window.d3', second[0].data)
+    assert_in('window.d3', inlined[0].data)
+
+def test_finalized_output_loads_web_assets():
+    inlined = []
+    PlotLearningCurve(display_fn=display_replacer(inlined), inline_assets=True).finalize()
+    second = []
+    PlotLearningCurve(display_fn=display_replacer(second)).finalize()
+
+    # The output with the assets stores them, which the later outputs load
+    assert_in('window.localStorage.setItem("lrcurve-assets-', inlined[0].data)
+    assert_in('window.localStorage.getItem("lrcurve-assets-', second[0].data)
+    assert_in('window.localStorage.getItem("lrcurve-assets-', second[-1].data)
+    assert_not_in('window.d3', second[-1].data)
+    assert_true(len(second[-1].data) < 5000)
+
+def test_decimate():
+    display_objects = []
+    with PlotLearningCurve(display_fn=display_replacer(display_objects), decimate=True, width=100) as plot:
+        for i in range(1, 1000):
+            plot.append(i, {
+                'loss': i * 10 + 1,
+                'val_loss': i * 10
+            })
+            if i % 100 == 0:
+                plot.draw()
+
+    assert_equal(len(display_objects), 15)
+    assert_true(len(json.dumps(_persisted_data(display_objects[-1]))) < 100 * 2 * 2 * 30)
+
+def test_binary_encoding():
+    display_objects = []
+    with PlotLearningCurve(display_fn=display_replacer(display_objects), encoding='float32') as plot:
+        for i in range(1, 10):
+            plot.append(i, {
+                'loss': i * 10 + 1,
+                'val_loss': i * 10
+            })
+        plot.draw()
+
+    assert_equal(len(display_objects), 6)
+    assert_in('"encoding": "float32"', display_objects[3].data)
+
+def test_max_updates_per_second():
+    display_objects = []
+    with PlotLearningCurve(display_fn=display_replacer(display_objects), max_updates_per_second=1) as plot:
+        for i in range(1, 1000):
+            plot.append(i, {
+                'loss': i * 10 + 1,
+                'val_loss': i * 10
+            })
+            plot.draw()
+
+    assert_true(len(display_objects) <= 7)
+    assert_in('999', display_objects[-1].data)
+
+def test_background_draw():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects), background_draw=True)
+
+    def append_from_thread(key):
+        for i in range(1000):
+            plot.append(i, { key: i + 1 })
+            plot.draw()
+    threads = [threading.Thread(target=append_from_thread, args=(key, )) for key in ['loss', 'val_loss']]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    plot.finalize()
+
+    assert_equal(plot.stats()['points_sent'], 2000)
+    assert_equal(len(plot._data), 2000)
+    losses = [y['loss'] for _, y in plot._data.rows() if 'loss' in y]
+    assert_equal(losses, list(range(1, 1001)))
+
+def test_comm_transport():
+    display_objects = []
+    comms = []
+    with PlotLearningCurve(display_fn=display_replacer(display_objects),
+                           transport='comm', comm_fn=comm_replacer(comms)) as plot:
+        for i in range(1, 10):
+            plot.append(i, {
+                'loss': i * 10 + 1,
+                'val_loss': i * 10
+            })
+        plot.draw()
+
+    assert_equal(len(display_objects), 4)
+    assert_equal([message['method'] for message in comms[0].messages], ['setup', 'append'])
+    assert_true(comms[0].closed)
+    assert_equal(plot.stats()['bytes_serialized'], len(json.dumps(comms[0].messages[1]['data'])))
+
+def test_comm_transport_fallback():
+    display_objects = []
+    comms = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects),
+                             transport='comm', comm_fn=comm_replacer(comms))
+    plot.append(0, { 'loss': 1 })
+    plot.draw()
+    comms[0].close_callback({})
+    plot.append(1, { 'loss': 1 })
+    plot.draw()
+
+    assert_equal(len(display_objects), 5)
+    assert_in('[[0.0, {"loss": 1.0}]], {"reset": true}', display_objects[3].data)
+    assert_in('[[1.0, {"loss": 1.0}]]', display_objects[4].data)
+
+def test_comm_transport_without_comm_package():
+    def comm_fn(**kwargs):
+        raise ModuleNotFoundError("No module named 'comm'")
+
+    display_objects = []
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        plot = PlotLearningCurve(display_fn=display_replacer(display_objects),
+                                 transport='comm', comm_fn=comm_fn)
+
+    assert_equal(len(caught), 1)
+    assert_in('comm package', str(caught[0].message))
+    plot.append(0, { 'loss': 1 })
+    plot.draw()
+    assert_in('[[0.0, {"loss": 1.0}]]', display_objects[-1].data)
+
+def test_comm_transport_waits_for_ready():
+    display_objects = []
+    comms = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects),
+                             transport='comm', comm_fn=comm_replacer(comms, ready=False))
+    plot.append(0, { 'loss': 1 })
+    plot.draw()
+    assert_equal(comms[0].messages, [])
+    assert_in('window.setupLearningCurve', display_objects[2].data)
+    assert_in('[[0.0, {"loss": 1.0}]]', display_objects[3].data)
+
+    comms[0].receive({ 'event': 'ready' })
+    plot.append(1, { 'loss': 1 })
+    plot.draw()
+    assert_equal(len(display_objects), 4)
+    assert_equal([message['method'] for message in comms[0].messages], ['setup', 'append'])
+    assert_equal(comms[0].messages[1]['data'], [[1.0, { 'loss': 1.0 }]])
+
+def test_comm_transport_unsupported():
+    display_objects = []
+    comms = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects),
+                             transport='comm', comm_fn=comm_replacer(comms, ready=False))
+    plot.append(0, { 'loss': 1 })
+    plot.draw()
+    # The data was already sent using display, so it is not sent again
+    comms[0].close_callback({})
+    plot.append(1, { 'loss': 1 })
+    plot.draw()
+
+    assert_equal(len(display_objects), 5)
+    assert_in('[[1.0, {"loss": 1.0}]]', display_objects[4].data)
+
+def test_reconfigure_sends_changes():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects))
+    plot.reconfigure(
+        mappings={
+            'loss': { 'line': 'train', 'facet': 'loss' },
+            'val_loss': { 'line': 'validation', 'facet': 'loss' },
+            'acc': { 'line': 'train', 'facet': 'acc' }
+        },
+        facet_config={
+            'loss': { 'name': 'loss', 'limit': [None, None], 'scale': 'log10' },
+            'acc': { 'name': 'Accuracy', 'limit': [0, 1], 'scale': 'linear' }
+        }
+    )
+
+    assert_equal(len(display_objects), 4)
+    assert_in('window.reconfigureLearningCurve', display_objects[3].data)
+    changes = json.loads(display_objects[3].data.split(', ', 1)[1][:-2])
+    assert_equal(changes, {
+        'height': 490,
+        'mappings': { 'acc': { 'line': 'train', 'facet': 'acc' } },
+        'facetConfig': { 'acc': { 'name': 'Accuracy', 'limit': [0, 1], 'scale': 'linear' } }
+    })
+    assert_equal(plot.stats()['sleep_seconds'], 1)
+
+def test_reconfigure_without_changes():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects))
+    plot.reconfigure()
+
+    assert_equal(len(display_objects), 3)
+    assert_equal(plot.stats()['reconfigures'], 2)
+
+def test_reconfigure_removed_line():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects))
+    plot.reconfigure(mappings={ 'loss': { 'line': 'train', 'facet': 'loss' } })
+
+    assert_equal(len(display_objects), 4)
+    assert_in('window.setupLearningCurve', display_objects[3].data)
+    # The iframe is initialized by the first setup, so the second setup
+    # is sent without waiting
+    assert_equal(plot.stats()['sleep_seconds'], 1)
+
+def test_comm_transport_reconfigure():
+    comms = []
+    plot = PlotLearningCurve(display_fn=display_replacer([]),
+                             transport='comm', comm_fn=comm_replacer(comms))
+    plot.reconfigure(line_config={
+        'train': { 'name': 'Train', 'color': '#000000' },
+        'validation': { 'name': 'Validation', 'color': '#00BFC4' }
+    })
+
+    assert_equal([message['method'] for message in comms[0].messages], ['setup', 'reconfigure'])
+    assert_equal(comms[0].messages[1]['changes'], {
+        'lineConfig': { 'train': { 'name': 'Train', 'color': '#000000' } }
+    })
+
+@raises(ValueError)
+def test_transport_is_unknown():
+    PlotLearningCurve(
+        transport='string',
+        display_fn=display_replacer([])
+    )
+
+@raises(ValueError)
+def test_encoding_is_unknown():
+    PlotLearningCurve(
+        encoding='string',
+        display_fn=display_replacer([])
+    )
+
+def test_deferred_arrays():
+    display_objects = []
+    with PlotLearningCurve(display_fn=display_replacer(display_objects)) as plot:
+        plot.append(0, { 'loss': 1 })
+        for i in range(1, 10):
+            plot.append(i, {
+                'loss': np.float32(i * 10 + 1),
+                'val_loss': i * 10
+            })
+        assert_equal(len(plot._pending), 9)
+        plot.draw()
+        assert_equal(len(plot._pending), 0)
+
+    assert_in('[1.0, {"loss": 11.0, "val_loss": 10.0}]', display_objects[3].data)
+
+def test_append_many():
+    display_objects = []
+    with PlotLearningCurve(display_fn=display_replacer(display_objects)) as plot:
+        plot.append_many(np.arange(3), {
+            'loss': np.array([3, 2, 1]),
+            'val_loss': [np.nan, 1.5, 0.5]
+        })
+        plot.append_many([3], { 'loss': [0.5] }, masks={ 'loss': [False] })
+        plot.draw()
+
+    assert_in(
+        '[[0.0, {"loss": 3.0}], [1.0, {"loss": 2.0, "val_loss": 1.5}], '
+        '[2.0, {"loss": 1.0, "val_loss": 0.5}], [3.0, {}]]',
+        display_objects[3].data
+    )
+
+def test_retain_points():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects),
+                             retain_points=100, retain_max_bytes=16 * 1024)
+    for step in range(10000):
+        plot.append(step, { 'loss': 1 / (step + 1), 'val_loss': step })
+        if step % 50 == 0:
+            plot.draw()
+    plot.finalize()
+
+    assert_true(len(plot._data) <= 125)
+    assert_true(plot.stats()['history_bytes'] <= 16 * 1024)
+    rows = _persisted_data(display_objects[-1])
+    assert_true(len(rows) <= 4 * 600)
+    assert_equal(min(y['val_loss'] for _, y in rows if 'val_loss' in y), 0)
+    assert_equal(max(y['val_loss'] for _, y in rows if 'val_loss' in y), 9999)
+
+def test_retain_points_fetch_detail():
+    comms = []
+    plot = PlotLearningCurve(display_fn=display_replacer([]), retain_points=100,
+                             transport='comm', comm_fn=comm_replacer(comms))
+    for step in range(10000):
+        plot.append(step, { 'loss': step })
+        if step % 50 == 0:
+            plot.draw()
+            comms[0].receive({ 'event': 'ack', 'seq': len(comms[0].messages) })
+
+    comms[0].receive({ 'event': 'fetch', 'request': 3, 'range': [5000, 5099], 'points': 600 })
+    detail = comms[0].messages[-1]
+    assert_equal(detail['method'], 'detail')
+    assert_equal(detail['request'], 3)
+    xs = [x for x, _ in detail['data']]
+    assert_true(min(xs) <= 5000 and max(xs) >= 5099)
+    assert_true(len(xs) < 200)
+
+@raises(ValueError)
+def test_retain_max_bytes_without_retain_points():
+    PlotLearningCurve(display_fn=display_replacer([]), retain_max_bytes=1024)
+
+def test_unconvertible_value_does_not_block_later_draws():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects))
+    plot.append(0, { 'loss': np.array([1.0, 2.0]) })
+    assert_raises(ValueError, plot.draw)
+
+    plot.append(1, { 'loss': np.float32(0.5) })
+    plot.draw()
+    assert_in('[[1.0, {"loss": 0.5}]]', display_objects[-1].data)
+
+@raises(ValueError)
+def test_append_many_with_wrong_length():
+    plot = PlotLearningCurve(display_fn=display_replacer([]))
+    plot.append_many([0, 1], { 'loss': [1] })
+
+def test_log_path_and_from_log():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'run.lrcurve')
+        plot = PlotLearningCurve(
+            display_fn=display_replacer([]), log_path=path,
+            xaxis_config={ 'name': 'Step', 'limit': [0, None] }
+        )
+        for i in range(10):
+            plot.append(i, { 'loss': 1 / (i + 1) })
+            plot.draw()
+        # Emulate a crash, by not calling plot.finalize()
+
+        display_objects = []
+        replayed = PlotLearningCurve.from_log(path, display_fn=display_replacer(display_objects))
+        assert_equal(replayed._settings['xAxisConfig']['name'], 'Step')
+        assert_equal(replayed._data.rows(), plot._data.rows())
+        assert_true('window.appendLearningCurve' in display_objects[-1].data)
+
+def test_log_is_written_between_draws():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'run.lrcurve')
+        plot = PlotLearningCurve(display_fn=display_replacer([]), log_path=path)
+        plot.append(0, { 'loss': 1 })
+        plot.append_many([1, 2], { 'loss': [0.5, 0.25] })
+        # Emulate a crash before any draw, by not calling plot.finalize()
+
+        history = ColumnarHistory()
+        reader = MetricLogReader(path)
+        for _ in range(200):
+            for kind, record in reader.read():
+                if kind == 'rows':
+                    history.extend_sparse(*record)
+            if len(history) == 3:
+                break
+            time.sleep(0.01)
+        rows = history.rows()
+        assert_equal(rows, [[0, { 'loss': 1 }], [1, { 'loss': 0.5 }], [2, { 'loss': 0.25 }]])
+
+def test_from_log_follow():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'run.lrcurve')
+        plot = PlotLearningCurve(display_fn=display_replacer([]), log_path=path)
+        plot.append(0, { 'loss': 1 })
+        plot.draw()
+
+        replayed = PlotLearningCurve.from_log(
+            path, follow=True, poll_interval=0.01, display_fn=display_replacer([])
+        )
+        plot.append(1, { 'loss': 0.5 })
+        plot.finalize()
+        time.sleep(0.1)
+        replayed.finalize()
+        assert_equal(replayed._data.rows(), [[0, { 'loss': 1 }], [1, { 'loss': 0.5 }]])
+
+def _persisted_data(display_object):
+    script = display_object.data
+    start = script.rindex('window.appendLearningCurve(')
+    start = script.index(', ', start) + 2
+    return json.JSONDecoder().raw_decode(script, start)[0]
+
+def test_persist_max_points():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects), persist_max_points=100)
+    plot.append_many(np.arange(10000), { 'loss': np.random.uniform(size=10000) })
+    plot.finalize()
+
+    rows = _persisted_data(display_objects[-1])
+    assert_true(50 <= len(rows) <= 100)
+
+def test_persist_compress_and_max_bytes():
+    display_objects = []
+    plot = PlotLearningCurve(
+        display_fn=display_replacer(display_objects),
+        persist_compress=True, persist_max_bytes=2000
+    )
+    plot.append_many(np.arange(10000), { 'loss': np.random.uniform(size=10000) })
+    plot.finalize()
+
+    # The limit includes the settings and the rest of the output
+    assert_true(len(display_objects[-1].data) <= 2000)
+    data = _persisted_data(display_objects[-1])
+    rows = json.loads(zlib.decompress(base64.b64decode(data['payload'])))
+    assert_true(0 < len(rows) < 10000)
+
+def test_persist_max_bytes_decimates_history_once():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects), persist_max_bytes=5000)
+    plot.append_many(np.arange(100000), { 'loss': np.random.uniform(size=100000) })
+    decimated = []
+    decimated_fn = plot._decimated
+    plot._decimated = lambda *args: decimated.append(args) or decimated_fn(*args)
+    plot.finalize()
+
+    # The following steps decimate the decimated points
+    assert_equal(len(decimated), 1)
+    assert_true(len(display_objects[-1].data) <= 5000)
+    assert_true(len(_persisted_data(display_objects[-1])) > 10)
+
+def test_persist_max_bytes_too_small():
+    display_objects = []
+    plot = PlotLearningCurve(display_fn=display_replacer(display_objects), persist_max_bytes=10)
+    plot.append_many(np.arange(1000), { 'loss': np.arange(1000) + 1, 'val_loss': np.arange(1000) })
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        plot.finalize()
+
+    assert_equal(len(caught), 1)
+    assert_in('persist_max_bytes=10', str(caught[0].message))
+    rows = _persisted_data(display_objects[-1])
+    assert_equal(min(y['loss'] for _, y in rows if 'loss' in y), 1)
+    assert_equal(max(y['loss'] for _, y in rows if 'loss' in y), 1000)
+    assert_equal(max(y['val_loss'] for _, y in rows if 'val_loss' in y), 999)
+
+@raises(ValueError)
+def test_persist_max_bytes_is_not_positive():
+    PlotLearningCurve(display_fn=display_replacer([]), persist_max_bytes=0)
+
+def test_stats():
+    reported = []
+    plot = PlotLearningCurve(display_fn=display_replacer([]), stats_fn=reported.append)
+    plot.append(0, { 'loss': 1, 'val_loss': 2 })
+    plot.append(1, { 'loss': 0.5 })
+    assert_equal(plot.stats()['backlog_rows'], 2)
+    plot.draw()
+
+    stats = plot.stats()
+    assert_equal(stats['draws'], 1)
+    assert_equal(stats['points_sent'], 3)
+    assert_equal(stats['reconfigures'], 1)
+    assert_equal(stats['sleep_seconds'], 1)
+    assert_equal(stats['backlog_rows'], 0)
+    assert_equal(stats['history_rows'], 2)
+    assert_equal(stats['history_bytes'], 2 * 8 + 3 * 16)
+    assert_true(stats['bytes_serialized'] > 0)
+    assert_equal(len(reported), 1)
+
+def test_streaming_transform():
+    plot = PlotLearningCurve(
+        display_fn=display_replacer([]),
+        mappings={
+            'loss': { 'line': 'train', 'facet': 'loss',
+                      'transform': { 'type': 'band', 'window': 4, 'stride': 4 } },
+            'val_loss': { 'line': 'validation', 'facet': 'loss' }
+        }
+    )
+    plot.append_many(np.arange(8), { 'loss': np.arange(8) * 2.0 })
+    plot.append(8, { 'val_loss': 1 })
+
+    rows = plot._data.rows()
+    assert_equal([x for x, _ in rows], [3, 7, 8])
+    assert_equal(rows[0][1]['loss'], 3)
+    assert_equal(rows[1][1]['loss'], 11)
+    assert_almost_equal(rows[1][1]['loss:upper'] - rows[1][1]['loss'], np.std([8, 10, 12, 14]))
+
+@raises(ValueError)
+def test_mappings_transform_is_invalid():
+    PlotLearningCurve(
+        mappings={ 'loss': { 'line': 'train', 'facet': 'loss', 'transform': { 'type': 'ema' } } },
+        display_fn=display_replacer([])
+    )
+
+@raises(ValueError)
+def test_mappings_two_bands_on_one_line():
+    band = { 'type': 'band', 'window': 10 }
+    PlotLearningCurve(
+        mappings={
+            'loss': { 'line': 'train', 'facet': 'loss', 'transform': band },
+            'batch_loss': { 'line': 'train', 'facet': 'loss', 'transform': band }
+        },
+        display_fn=display_replacer([])
+    )
+
+def test_canvas_renderer():
+    display_objects = []
+    PlotLearningCurve(display_fn=display_replacer(display_objects), renderer='canvas')
+
+    assert_in('"renderer": "canvas"', display_objects[2].data)
+
+@raises(ValueError)
+def test_renderer_is_unknown():
+    PlotLearningCurve(
+        renderer='webgl',
+        display_fn=display_replacer([])
+    )
+
 @raises(ValueError)
 def test_height_is_string():
     PlotLearningCurve(
@@ -0,0 +1,160 @@
+import copy
+
+from .plot_learning_curve import PlotLearningCurve
+
+# The d3.schemeCategory10 colors
+_default_colors = [
+    '#1F77B4', '#FF7F0E', '#2CA02C', '#D62728', '#9467BD',
+    '#8C564B', '#E377C2', '#7F7F7F', '#BCBD22', '#17BECF'
+]
+
+# The dash patterns used to distinguish the lines within a run
+_default_dashes = ['', '6,3', '2,2', '8,3,2,3']
+
+class RunHandle:
+    """Appends data to one run of a `PlotRuns`.
+
+    The data keys are the same as for a single `PlotLearningCurve`.
+    """
+    def __init__(self, runs, name):
+        self._runs = runs
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
+
+    def _run_key(self, key):
+        return f'{key}@{self._name}'
+
+    def append(self, x, y):
+        """Appends graph data without updating the figure, see
+        `PlotLearningCurve.append`."""
+        self._runs._plot.append(x, { self._run_key(key): value for key, value in y.items() })
+
+    def append_many(self, xs, ys, masks=None):
+        """Appends many data-points at once, see `PlotLearningCurve.append_many`."""
+        self._runs._plot.append_many(
+            xs,
+            { self._run_key(key): values for key, values in ys.items() },
+            None if masks is None else { self._run_key(key): mask for key, mask in masks.items() }
+        )
+
+    def draw(self):
+        """Updates the figure with the appended data, of all runs."""
+        self._runs.draw()
+
+class PlotRuns:
+    """Plots many runs, such as the trials of a hyperparameter sweep, in
+    one figure.
+
+    All runs share one display handle and the same facets. Each run gets its
+    own color, while the lines within a run (e.g. train and validation) are
+    distinguished by their dash pattern. Clicking a run in the legend hides
+    it, which is handled entirely in the browser. Runs can be added at any
+    time, also while other runs are being appended to.
+
+    Example:
+        with PlotRuns() as runs:
+            trials = [runs.add_run(f'lr={lr}') for lr in [0.1, 0.01, 0.001]]
+            for epoch in range(100):
+                for trial in trials:
+                    trial.append(epoch, { 'loss': ..., 'val_loss': ... })
+                runs.draw()
+
+    Arguments:
+        mappings: dict - The mappings of a single run, see `PlotLearningCurve`.
+        line_config: dict - The lines of a single run. The color is replaced by
+            the run color, and a `dash` pattern is added unless specified.
+        facet_config: dict - See `PlotLearningCurve`.
+        xaxis_config: dict - See `PlotLearningCurve`.
+        height: int - See `PlotLearningCurve`.
+        width: int - See `PlotLearningCurve`.
+        renderer: str - See `PlotLearningCurve`, 'canvas' is recommended for
+            many runs.
+        colors: list - The colors assigned to the runs, in order (default
+            d3.schemeCategory10).
+        kwargs: Other arguments for `PlotLearningCurve`.
+    """
+    def __init__(self,
+                 mappings = {
+                     'loss': { 'line': 'train', 'facet': 'loss' },
+                     'val_loss': { 'line': 'validation', 'facet': 'loss' }
+                 },
+                 line_config = {
+                     'train': { 'name': 'Train', 'color': '#F8766D' },
+                     'validation': { 'name': 'Validation', 'color': '#00BFC4' }
+                 },
+                 facet_config = {
+                     'loss': { 'name': 'loss', 'limit': [None, None], 'scale': 'log10' }
+                 },
+                 xaxis_config = { 'name': 'Epoch', 'limit': [0, None] },
+                 height = None,
+                 width = 600,
+                 renderer = 'svg',
+                 colors = _default_colors,
+                 **kwargs
+    ):
+        if not isinstance(colors, list) or len(colors) == 0:
+            raise ValueError('colors must be a non-empty list')
+
+        self._mappings = copy.deepcopy(mappings)
+        self._line_config = copy.deepcopy(line_config)
+        self._layout = dict(
+            facet_config=facet_config, xaxis_config=xaxis_config,
+            height=height, width=width, renderer=renderer
+        )
+        self._colors = colors
+        self._runs = dict()
+
+        self._plot = PlotLearningCurve(**self._configuration(), **kwargs)
+
+    def _configuration(self):
+        mappings = dict()
+        line_config = dict()
+        for run_name, color in self._runs.items():
+            for line_index, (line_key, line_def) in enumerate(self._line_config.items()):
+                line_config[f'{line_key}@{run_name}'] = {
+                    'dash': _default_dashes[line_index % len(_default_dashes)],
+                    **line_def,
+                    'color': color,
+                    'group': run_name
+                }
+            for key, mapping_def in self._mappings.items():
+                mappings[f'{key}@{run_name}'] = {
+                    **mapping_def,
+                    'line': f'{mapping_def["line"]}@{run_name}'
+                }
+
+        return dict(mappings=mappings, line_config=line_config, **self._layout)
+
+    def add_run(self, name, color=None):
+        """Adds a run to the figure, and returns a `RunHandle` for appending
+        data to it.
+
+        Arguments:
+            name: str - The name of the run, shown in the legend.
+            color: str - The color of the run (default the next color).
+        """
+        if not isinstance(name, str):
+            raise ValueError(f'the run name must be a string, was {name}')
+        if name in self._runs:
+            raise ValueError(f'the run {name} already exists')
+
+        self._runs[name] = self._colors[len(self._runs) % len(self._colors)] if color is None else color
+        self._plot.reconfigure(**self._configuration())
+        return RunHandle(self, name)
+
+    def draw(self):
+        """Updates the figure with the appended data, see `PlotLearningCurve.draw`."""
+        self._plot.draw()
+
+    def finalize(self):
+        """Saves the data to the notebook file, see `PlotLearningCurve.finalize`."""
+        self._plot.finalize()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.finalize()
@@ -0,0 +1,55 @@
+from nose.tools import *
+
+from lrcurve import PlotRuns
+
+class DisplayHandle:
+    def __init__(self, display_objects):
+        self.display_objects = display_objects
+
+    def update(self, obj):
+        self.display_objects.append(obj)
+
+def display_replacer(display_objects):
+    def display(obj, display_id=None):
+        display_objects.append(obj)
+        return DisplayHandle(display_objects)
+    return display
+
+def test_runs_share_one_plot():
+    display_objects = []
+    runs = PlotRuns(display_fn=display_replacer(display_objects))
+    first = runs.add_run('lr=0.1')
+    first.append(0, { 'loss': 1 })
+    runs.draw()
+    second = runs.add_run('lr=0.01', color='#000000')
+    second.append(0, { 'loss': 2, 'val_loss': 3 })
+    runs.finalize()
+
+    settings = runs._plot._settings
+    assert_equal(settings['mappings']['val_loss@lr=0.01'], { 'line': 'validation@lr=0.01', 'facet': 'loss' })
+    assert_equal(settings['lineConfig']['validation@lr=0.01'], {
+        'name': 'Validation', 'color': '#000000', 'dash': '6,3', 'group': 'lr=0.01'
+    })
+    assert_equal(settings['lineConfig']['train@lr=0.1']['color'], '#1F77B4')
+    assert_equal(runs._plot._data.rows(), [
+        [0, { 'loss@lr=0.1': 1 }],
+        [0, { 'loss@lr=0.01': 2, 'val_loss@lr=0.01': 3 }]
+    ])
+    # Adding a run does not wait for the frontend again
+    assert_equal(runs._plot.stats()['reconfigures'], 3)
+    assert_equal(runs._plot.stats()['sleep_seconds'], 1)
+
+def test_memory_is_linear_in_rows():
+    runs = PlotRuns(display_fn=display_replacer([]))
+    handles = [runs.add_run(f'trial-{run}') for run in range(64)]
+    for handle in handles:
+        handle.append_many(range(1000), { 'loss': [1.0] * 1000, 'val_loss': [1.0] * 1000 })
+
+    # Each row costs its x value, and an index and a value per present key
+    assert_equal(runs._plot.stats()['history_bytes'], 64 * 1000 * (8 + 2 * 16))
+
+@raises(ValueError)
+def test_run_already_exists():
+    runs = PlotRuns(display_fn=display_replacer([]))
+    runs.add_run('trial')
+    runs.add_run('trial')
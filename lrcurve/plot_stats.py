@@ -0,0 +1,32 @@
+import threading
+
+class PlotStats:
+    """Thread-safe counters, describing the cost of updating a plot.
+
+    Example:
+        stats = PlotStats()
+        stats.add(draws=1, update_seconds=0.01)
+        stats.snapshot()  # {'draws': 1, 'update_seconds': 0.01, ...}
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {
+            'draws': 0,
+            'points_sent': 0,
+            'bytes_serialized': 0,
+            'serialize_seconds': 0.0,
+            'update_seconds': 0.0,
+            'reconfigures': 0,
+            'sleep_seconds': 0.0
+        }
+
+    def add(self, **increments):
+        """Increments the counters by the given amounts."""
+        with self._lock:
+            for name, increment in increments.items():
+                self._counters[name] += increment
+
+    def snapshot(self):
+        """Returns a copy of the counters."""
+        with self._lock:
+            return dict(self._counters)
@@ -0,0 +1,521 @@
+import os
+import math
+import json
+import shutil
+import inspect
+import unicodedata
+import os.path as path
+from html import escape
+from concurrent.futures import ProcessPoolExecutor
+
+from .plot_learning_curve import PlotLearningCurve, create_settings, web_assets_dir, read_web_asset, web_assets_html
+from .columnar_history import ColumnarHistory
+from .decimation import MinMaxDecimator
+from .metric_log import MetricLogReader
+
+# The layout constants from learning_curve.js
+_margin = { 'top': 10, 'right': 10, 'bottom': 10, 'left': 45 }
+_axis_margin = { 'top': 10, 'right': 15, 'bottom': 10, 'left': 15 }
+_facet_width = 30
+_legend_height = 40
+_x_axis_height = 30
+_x_label_height = 20
+
+# The advance widths of the printable ASCII characters in Helvetica, in
+# 1/1000 em. Arial and Liberation Sans have the same metrics, so the legend
+# is set in those fonts, so the text can be measured without a browser.
+_legend_font = "Helvetica, Arial, 'Liberation Sans', sans-serif"
+_legend_font_size = 14
+_helvetica_widths = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+]
+
+_formats = {'html', 'svg'}
+
+_reconfigure_defaults = {
+    name: parameter.default
+    for name, parameter in inspect.signature(PlotLearningCurve.reconfigure).parameters.items()
+    if parameter.default is not inspect.Parameter.empty
+}
+
+def _tick_step(start, stop, count):
+    step = (stop - start) / max(count, 1)
+    power = math.floor(math.log10(step))
+    error = step / 10 ** power
+    if error >= math.sqrt(50):
+        factor = 10
+    elif error >= math.sqrt(10):
+        factor = 5
+    elif error >= math.sqrt(2):
+        factor = 2
+    else:
+        factor = 1
+    return factor * 10 ** power
+
+def _linear_ticks(domain, count):
+    """Returns the nice domain and its ticks, similar to d3.scaleLinear."""
+    start, stop = domain
+    if start == stop:
+        start, stop = (start - 1, stop + 1)
+    for _ in range(2):
+        step = _tick_step(start, stop, count)
+        start, stop = (math.floor(start / step) * step, math.ceil(stop / step) * step)
+
+    ticks = [
+        round(i * step, 12)
+        for i in range(round(start / step), round(stop / step) + 1)
+    ]
+    return ((start, stop), ticks)
+
+def _log_ticks(domain, count):
+    """Returns the nice domain and its ticks, similar to d3.scaleLog."""
+    start, stop = (math.floor(math.log10(domain[0])), math.ceil(math.log10(domain[1])))
+    if start == stop:
+        start, stop = (start - 1, stop + 1)
+
+    powers = list(range(start, stop + 1))
+    if len(powers) > count + 1:
+        every = math.ceil(len(powers) / (count + 1))
+        powers = powers[::every]
+    return ((10 ** start, 10 ** stop), [10 ** power for power in powers])
+
+def _grid_ticks(major_ticks, minor_tick_max):
+    # Same as highestMinorMod and createGridTicks in learning_curve.js
+    minor_mod = (minor_tick_max - 1) // max(1, len(major_ticks) - 1)
+    ticks = []
+    for major, next_major in zip(major_ticks[:-1], major_ticks[1:]):
+        ticks.append((major, True))
+        for i in range(1, minor_mod):
+            ticks.append((major + (i / minor_mod) * (next_major - major), False))
+    ticks.append((major_ticks[-1], True))
+    return ticks
+
+def _text_width(text, font_size=_legend_font_size):
+    # Other characters use the width of a digit, or a full em if they are
+    # wide east asian characters
+    width = 0
+    for char in text:
+        if 32 <= ord(char) < 127:
+            width += _helvetica_widths[ord(char) - 32]
+        elif unicodedata.east_asian_width(char) in {'W', 'F'}:
+            width += 1000
+        else:
+            width += 556
+    return width * font_size / 1000
+
+def _format_tick(value):
+    return f'{value:g}'
+
+def _compute_limit(original, values):
+    values = [value for value in values if math.isfinite(value)]
+    return [
+        (min(values) if values else None) if original[0] is None else original[0],
+        (max(values) if values else None) if original[1] is None else original[1]
+    ]
+
+class _Scale:
+    def __init__(self, limit, scale, size, count, invert=False):
+        log = scale == 'log10'
+        lower, upper = limit
+        if log:
+            lower = 1 if lower is None or lower <= 0 else lower
+            upper = lower if upper is None or upper <= 0 else upper
+            (self.lower, self.upper), self.ticks = _log_ticks((lower, upper), count)
+        else:
+            lower = 0 if lower is None else lower
+            upper = lower if upper is None else upper
+            (self.lower, self.upper), self.ticks = _linear_ticks((lower, upper), count)
+
+        self._transform = math.log10 if log else float
+        self._size = size
+        self._invert = invert
+        self._offset = self._transform(self.lower)
+        self._range = self._transform(self.upper) - self._offset
+
+    def valid(self, value):
+        return math.isfinite(value) and (self._transform is float or value > 0)
+
+    def __call__(self, value):
+        position = (self._transform(value) - self._offset) / self._range * self._size
+        return self._size - position if self._invert else position
+
+def _render_path(xs, ys, x_scale, y_scale):
+    commands = []
+    move = True
+    for x, y in zip(xs, ys):
+        if not (x_scale.valid(x) and y_scale.valid(y)):
+            move = True
+            continue
+        commands.append(f'{"M" if move else "L"}{x_scale(x):.2f},{y_scale(y):.2f}')
+        move = False
+    return ''.join(commands)
+
+def _render_band(lower, upper, x_scale, y_scale):
+    # Same as bandPath in learning_curve.js, the lower bound followed by
+    # the upper bound in reverse
+    points = [
+        f'{x_scale(x):.2f},{y_scale(y):.2f}'
+        for x, y in list(zip(*lower)) + list(zip(*upper))[::-1]
+        if x_scale.valid(x) and y_scale.valid(y)
+    ]
+    return f'M{"L".join(points)}Z' if points else ''
+
+def _render_facet(parts, settings, columns, facet_index, facet_key, line_keys, top, height, draw_x_axis):
+    graph_width = settings['width'] - _facet_width - _margin['left'] - _margin['right']
+    graph_height = height - _margin['top'] - _margin['bottom']
+    axis_width = graph_width - _axis_margin['left'] - _axis_margin['right']
+    axis_height = graph_height - _axis_margin['top'] - _axis_margin['bottom']
+    facet_config = settings['facetConfig'][facet_key]
+
+    # Like learning_curve.js, only the first data key of each line is drawn
+    # and the band of the first data key with a band transform, which are
+    # sent as the `key:lower` and `key:upper` columns
+    line_data = dict()
+    band_data = dict()
+    for key, mapping in settings['mappings'].items():
+        if mapping['facet'] != facet_key:
+            continue
+        if mapping['line'] not in line_data:
+            line_data[mapping['line']] = columns.get(key, ((), ()))
+        transform = mapping.get('transform')
+        if transform is not None and transform['type'] == 'band' and mapping['line'] not in band_data:
+            band_data[mapping['line']] = (
+                columns.get(f'{key}:lower', ((), ())), columns.get(f'{key}:upper', ((), ()))
+            )
+
+    x_scale = _Scale(
+        _compute_limit(settings['xAxisConfig']['limit'], [x for xs, _ in line_data.values() for x in xs]),
+        'linear', axis_width, 6
+    )
+    y_scale = _Scale(
+        _compute_limit(facet_config['limit'], [
+            y for _, ys in list(line_data.values()) + [bound for band in band_data.values() for bound in band]
+            for y in ys
+        ]),
+        facet_config['scale'], axis_height, 3, invert=True
+    )
+
+    parts.append(f'<g transform="translate(0, {top})">')
+    parts.append(f'<g transform="translate({_margin["left"]},{_margin["top"]})">')
+    parts.append(f'<rect class="background" width="{graph_width}" height="{graph_height}"></rect>')
+
+    # Grid
+    parts.append(f'<g class="grid" transform="translate({_axis_margin["left"]},{graph_height})">')
+    for value, major in _grid_ticks(x_scale.ticks, 19):
+        parts.append(
+            f'<g class="tick" transform="translate({x_scale(value):.2f},0)" style="stroke-opacity: {1 if major else 0.5}">'
+            f'<line y2="{-graph_height}"></line></g>'
+        )
+    parts.append('</g>')
+    parts.append(f'<g class="grid" transform="translate(0,{_axis_margin["top"]})">')
+    for value, major in _grid_ticks(y_scale.ticks, 9):
+        if not y_scale.valid(value):
+            continue
+        parts.append(
+            f'<g class="tick" transform="translate(0,{y_scale(value):.2f})" style="stroke-opacity: {1 if major else 0.5}">'
+            f'<line x2="{graph_width}"></line></g>'
+        )
+    parts.append('</g>')
+
+    # Axes
+    if draw_x_axis:
+        parts.append(f'<g class="axis" transform="translate({_axis_margin["left"]},{graph_height})" text-anchor="middle">')
+        for value in x_scale.ticks:
+            parts.append(
+                f'<g class="tick" transform="translate({x_scale(value):.2f},0)">'
+                f'<line y2="6"></line><text y="9" dy="0.71em">{_format_tick(value)}</text></g>'
+            )
+        parts.append('</g>')
+    parts.append(f'<g class="axis" transform="translate(0,{_axis_margin["top"]})" text-anchor="end">')
+    for value in y_scale.ticks:
+        parts.append(
+            f'<g class="tick" transform="translate(0,{y_scale(value):.2f})">'
+            f'<line x2="-6"></line><text x="-9" dy="0.32em">{_format_tick(value)}</text></g>'
+        )
+    parts.append('</g>')
+
+    # Bands, which are drawn below all the lines
+    for line_key in line_keys:
+        if line_key not in band_data:
+            continue
+        parts.append(
+            f'<path class="band" transform="translate({_axis_margin["left"]},{_axis_margin["top"]})" '
+            f'fill="{escape(settings["lineConfig"][line_key]["color"])}" '
+            f'd="{_render_band(*band_data[line_key], x_scale, y_scale)}"></path>'
+        )
+
+    # Lines
+    for line_key in line_keys:
+        xs, ys = line_data[line_key]
+        line_def = settings['lineConfig'][line_key]
+        dash = f' stroke-dasharray="{escape(line_def["dash"])}"' if line_def.get('dash') else ''
+        parts.append(
+            f'<g transform="translate({_axis_margin["left"]},{_axis_margin["top"]})" '
+            f'stroke="{escape(line_def["color"])}"{dash}>'
+            f'<path class="line" d="{_render_path(xs, ys, x_scale, y_scale)}"></path></g>'
+        )
+    parts.append('</g>')
+
+    # Facet label
+    facet_text_id = escape(f'learning-curve-{settings["id"]}-{facet_index}-facet-text')
+    parts.append(
+        f'<g class="facet" transform="translate({_margin["left"] + graph_width}, {_margin["top"]})">'
+        f'<rect class="facet-background" width="{_facet_width}" height="{graph_height}"></rect>'
+        f'<path d="M10,0 V{graph_height}" id="{facet_text_id}"></path>'
+        f'<text><textPath startOffset="50%" xlink:href="#{facet_text_id}" text-anchor="middle">'
+        f'{escape(facet_config["name"])}</textPath></text></g>'
+    )
+    parts.append('</g>')
+
+def _legend_items(line_config):
+    # Same as legendItems in learning_curve.js, without hidden groups
+    line_defs = list(line_config.values())
+    groups = list(dict.fromkeys(line_def['group'] for line_def in line_defs if 'group' in line_def))
+    if len(groups) == 0:
+        return [(line_def['name'], line_def['color'], line_def.get('dash')) for line_def in line_defs]
+
+    dash_items = [
+        (name, '#505050', next(line_def.get('dash') for line_def in line_defs if line_def['name'] == name))
+        for name in dict.fromkeys(line_def['name'] for line_def in line_defs)
+    ]
+    group_items = [
+        (group, next(line_def['color'] for line_def in line_defs if line_def.get('group') == group), None)
+        for group in groups
+    ]
+    return dash_items + group_items
+
+def render_svg(settings, columns):
+    """Renders the plot as a standalone SVG document, without a browser.
+
+    The layout follows `learning_curve.js`, including the bands, the dash
+    patterns, and the legend of grouped lines. As the SVG is static, the
+    groups can't be hidden. The legend text is measured using the Helvetica
+    font metrics, which Arial and Liberation Sans share.
+
+    Arguments:
+        settings: dict - The settings from `create_settings`, with an `id`.
+        columns: dict - Maps each data key to an `(x, values)` tuple, as
+            returned by `ColumnarHistory.columns()`.
+    """
+    width, height = (settings['width'], settings['height'])
+    facet_keys = sorted(set(mapping['facet'] for mapping in settings['mappings'].values()))
+    # Without any mappings, only the x-axis label and the legend are drawn
+    sub_graph_height = (height - _legend_height - _x_label_height - _x_axis_height) / max(1, len(facet_keys))
+
+    css = read_web_asset('learning_curve.css')
+
+    parts = [None, f'<style>{css}</style>']
+
+    for facet_index, facet_key in enumerate(facet_keys):
+        line_keys = sorted(set(
+            mapping['line'] for mapping in settings['mappings'].values() if mapping['facet'] == facet_key
+        ))
+        _render_facet(
+            parts, settings, columns, facet_index, facet_key, line_keys,
+            top=facet_index * sub_graph_height, height=round(sub_graph_height),
+            draw_x_axis=facet_index == len(facet_keys) - 1
+        )
+
+    after_sub_graph_height = height - _legend_height - _x_label_height
+    plot_width = width - _margin['left'] - _margin['right']
+    parts.append(
+        f'<text text-anchor="middle" transform="translate({_margin["left"]}, {after_sub_graph_height})" '
+        f'x="{(plot_width - _facet_width) / 2}">{escape(settings["xAxisConfig"]["name"])}</text>'
+    )
+
+    # Like learning_curve.js, the legend items are placed in centered rows,
+    # and a new row is started when the items don't fit within the plot width
+    rows = [[]]
+    offset = 0
+    for name, color, dash in _legend_items(settings['lineConfig']):
+        item_width = 30 + _text_width(name)
+        if len(rows[-1]) > 0 and offset + item_width > plot_width:
+            rows.append([])
+            offset = 0
+        dash_attr = f' stroke-dasharray="{escape(dash)}"' if dash else ''
+        rows[-1].append((
+            f'<rect width="25" height="25" x="{offset}"></rect>'
+            f'<line x1="{offset + 2}" x2="{offset + 23}" y1="12.5" y2="12.5" stroke="{escape(color)}"{dash_attr}></line>'
+            f'<text x="{offset + 30}" y="19">{escape(name)}</text>',
+            offset + item_width
+        ))
+        offset += item_width + 20
+
+    legend = []
+    for row_index, row in enumerate(rows):
+        if len(row) == 0:
+            continue
+        row_width = row[-1][1]
+        legend.append(
+            f'<g transform="translate({(plot_width - row_width) / 2}, {row_index * 30})">'
+            f'{"".join(item for item, _ in row)}</g>'
+        )
+    parts.append(
+        f'<g class="legned" font-family="{_legend_font}" font-size="{_legend_font_size}" '
+        f'transform="translate({_margin["left"]}, {after_sub_graph_height + _x_label_height})">'
+        f'{"".join(legend)}</g>'
+    )
+
+    # Extend the figure, if the legend needs more than one row
+    total_height = height + (len(rows) - 1) * 30
+    parts[0] = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'class="learning-curve" width="{width}" height="{total_height}" viewBox="0 0 {width} {total_height}" '
+        f'font-family="sans-serif" style="width: {width}px; height: {total_height}px">'
+    )
+    parts.append('</svg>')
+    return ''.join(parts)
+
+def render_html(settings, data, assets_url=None):
+    """Renders the plot as a standalone HTML document.
+
+    The plot is drawn by `learning_curve.js` when the document is opened.
+
+    Arguments:
+        settings: dict - The settings from `create_settings`, with an `id`.
+        data: list - The rows, in the format `window.appendLearningCurve`
+            expects.
+        assets_url: str - Where the web assets are located, relative to the
+            document. The default is to include the web assets in the document.
+    """
+    if assets_url is None:
+        assets = web_assets_html()
+    else:
+        assets = (
+            f'<link href="{escape(assets_url)}/learning_curve.css" rel="stylesheet">'
+            f'<script src="{escape(assets_url)}/d3.bundle.js"></script>'
+            f'<script src="{escape(assets_url)}/learning_curve.js"></script>'
+        )
+
+    # The id comes from the file name, so it may contain any character.
+    # A '</' would end the script element early.
+    def script_json(value):
+        return json.dumps(value).replace('</', '<\\/')
+
+    return (
+        f'<!DOCTYPE html>\n'
+        f'<meta charset="utf-8">\n'
+        f'<title>{escape(settings["xAxisConfig"]["name"])} - lrcurve</title>\n'
+        f'{assets}\n'
+        f'<svg id="{escape(settings["id"])}" class="learning-curve"></svg>\n'
+        f'<script>\n'
+        f'  window.setupLearningCurve({script_json(settings["id"])}, {script_json(settings)});\n'
+        f'  window.appendLearningCurve({script_json(settings["id"])}, {script_json(data)});\n'
+        f'</script>\n'
+    )
+
+def export_history(output_path, history, settings, format='html', assets_url=None, pyramid=None):
+    """Writes a plot of a `ColumnarHistory` to a file.
+
+    The data is decimated to the minimum and maximum point per horizontal
+    pixel, such the file size does not depend on the number of rows.
+
+    Arguments:
+        output_path: str - The file to write.
+        history: ColumnarHistory - The data to plot.
+        settings: dict - The settings from `create_settings`, with an `id`.
+        format: str - Either 'html' or 'svg' (default 'html').
+        assets_url: str - See `render_html`.
+        pyramid: HistoryPyramid - The summaries of the rows before `history`
+            (default None).
+    """
+    if format not in _formats:
+        raise ValueError(f'format must either html or svg, was {format}')
+
+    decimator = MinMaxDecimator(settings['width'])
+    if pyramid is not None:
+        pyramid.feed(decimator)
+    decimator.extend(history)
+    if format == 'svg':
+        content = render_svg(settings, decimator.columns())
+    else:
+        content = render_html(settings, decimator.rows(), assets_url=assets_url)
+
+    with open(output_path, 'w') as fp:
+        fp.write(content)
+
+def export_log(log_path, output_path, format='html', assets_url=None, **kwargs):
+    """Writes a plot of a file written using the `log_path` argument of
+    `PlotLearningCurve`.
+
+    The plot settings stored in the file are used, unless they are
+    overwritten by `kwargs`.
+
+    Arguments:
+        log_path: str - The path of the metric log.
+        output_path: str - The file to write.
+        format: str - Either 'html' or 'svg' (default 'html').
+        assets_url: str - See `render_html`.
+        kwargs: The arguments for `PlotLearningCurve.reconfigure`.
+    """
+    history = ColumnarHistory()
+    config = dict(_reconfigure_defaults)
+    for kind, record in MetricLogReader(log_path).read():
+        if kind == 'settings':
+            config.update(record)
+        elif kind == 'rows':
+            history.extend_sparse(*record)
+    config.update(kwargs)
+
+    settings = {
+        'id': path.splitext(path.basename(output_path))[0],
+        **create_settings(**config)
+    }
+    export_history(output_path, history, settings, format=format, assets_url=assets_url)
+    return output_path
+
+def _export_log_job(job):
+    log_path, output_path, format, assets_url, kwargs = job
+    return export_log(log_path, output_path, format=format, assets_url=assets_url, **kwargs)
+
+def export_logs(log_paths, output_dir, format='html', shared_assets=False, max_workers=None, **kwargs):
+    """Writes a plot of each metric log to `output_dir`, using a process pool.
+
+    Each plot is named after its metric log, with the `.html` or `.svg`
+    extension.
+
+    Example:
+        export_logs(glob.glob('runs/*.lrcurve'), 'reports', format='svg')
+
+    Arguments:
+        log_paths: list - The paths of the metric logs.
+        output_dir: str - The directory to write the plots to.
+        format: str - Either 'html' or 'svg' (default 'html').
+        shared_assets: bool - For the 'html' format, copy the web assets to
+            `output_dir/lrcurve_assets` once, instead of including them in
+            every plot (default False).
+        max_workers: int - The number of processes (default `os.cpu_count()`).
+        kwargs: The arguments for `PlotLearningCurve.reconfigure`.
+
+    Returns:
+        The paths of the written plots.
+    """
+    if format not in _formats:
+        raise ValueError(f'format must either html or svg, was {format}')
+    os.makedirs(output_dir, exist_ok=True)
+
+    assets_url = None
+    if format == 'html' and shared_assets:
+        assets_url = 'lrcurve_assets'
+        os.makedirs(path.join(output_dir, assets_url), exist_ok=True)
+        for filename in ['d3.bundle.js', 'learning_curve.js', 'learning_curve.css']:
+            shutil.copyfile(path.join(web_assets_dir, filename), path.join(output_dir, assets_url, filename))
+
+    jobs = [
+        (
+            log_path,
+            path.join(output_dir, f'{path.splitext(path.basename(log_path))[0]}.{format}'),
+            format, assets_url, kwargs
+        )
+        for log_path in log_paths
+    ]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            _export_log_job, jobs,
+            chunksize=max(1, len(jobs) // (4 * (max_workers or os.cpu_count() or 1)))
+        ))
@@ -0,0 +1,154 @@
+import os
+import math
+import tempfile
+import xml.etree.ElementTree as ET
+from nose.tools import *
+
+from lrcurve import PlotLearningCurve, PlotRuns
+from lrcurve.plot_learning_curve import create_settings
+from lrcurve.static_export import export_logs, render_html, _linear_ticks, _log_ticks, _text_width, _reconfigure_defaults
+
+def display_replacer(display_objects):
+    def display(obj, display_id=None):
+        display_objects.append(obj)
+        return DisplayHandle(display_objects)
+    return display
+
+class DisplayHandle:
+    def __init__(self, display_objects):
+        self.display_objects = display_objects
+
+    def update(self, obj):
+        self.display_objects.append(obj)
+
+def _write_log(log_path, epochs):
+    plot = PlotLearningCurve(display_fn=display_replacer([]), log_path=log_path)
+    for i in range(epochs):
+        plot.append(i, { 'loss': math.exp(-i / 10), 'val_loss': math.exp(-i / 20) })
+    plot.finalize()
+    return plot
+
+def test_nice_ticks():
+    assert_equal(_linear_ticks((0, 0.93), 3), ((0, 1), [0, 0.5, 1]))
+    assert_equal(_log_ticks((0.02, 3), 3), ((0.01, 10), [0.01, 0.1, 1, 10]))
+
+def test_export_svg_and_html():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plot = _write_log(os.path.join(tmpdir, 'run.lrcurve'), 100)
+
+        plot.export(os.path.join(tmpdir, 'run.svg'), format='svg')
+        svg = ET.parse(os.path.join(tmpdir, 'run.svg')).getroot()
+        lines = svg.findall('.//{http://www.w3.org/2000/svg}path[@class="line"]')
+        assert_equal(len(lines), 2)
+        assert_true(lines[0].get('d').startswith('M'))
+
+        plot.export(os.path.join(tmpdir, 'run.html'))
+        with open(os.path.join(tmpdir, 'run.html')) as fp:
+            html = fp.read()
+        assert_true('window.setupLearningCurve' in html)
+        assert_true('window.appendLearningCurve' in html)
+
+def test_text_width():
+    assert_equal(_text_width('MMMM'), 4 * 833 * 14 / 1000)
+    assert_true(_text_width('iiii') < _text_width('WWWW'))
+    assert_equal(_text_width('\u5b66'), 14)
+
+def test_export_svg_legend_is_measured():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        line_config = {
+            'train': { 'name': 'WWWWWWWWWW training loss (WWW)', 'color': '#F8766D' },
+            'validation': { 'name': 'MMMMMMMMMM validation loss', 'color': '#00BFC4' }
+        }
+        plot = PlotLearningCurve(
+            display_fn=display_replacer([]), line_config=line_config, width=900,
+            log_path=os.path.join(tmpdir, 'run.lrcurve')
+        )
+        for i in range(10):
+            plot.append(i, { 'train': math.exp(-i / 10), 'validation': math.exp(-i / 20) })
+        plot.finalize()
+
+        plot.export(os.path.join(tmpdir, 'run.svg'), format='svg')
+        svg = ET.parse(os.path.join(tmpdir, 'run.svg')).getroot()
+        legend = svg.find('.//{http://www.w3.org/2000/svg}g[@class="legned"]')
+        texts = legend.findall('.//{http://www.w3.org/2000/svg}text')
+        assert_equal(len(texts), 2)
+        assert_true(float(texts[1].get('x')) >= float(texts[0].get('x')) + _text_width(texts[0].text))
+        assert_true(all(text.get('textLength') is None for text in texts))
+
+def test_export_svg_legend_rows():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        line_config = {
+            'train': { 'name': 'WWWWWWWWWW training loss (WWW)', 'color': '#F8766D' },
+            'validation': { 'name': 'MMMMMMMMMM validation loss', 'color': '#00BFC4' }
+        }
+        plot = PlotLearningCurve(display_fn=display_replacer([]), line_config=line_config, width=400)
+        plot.export(os.path.join(tmpdir, 'run.svg'), format='svg')
+
+        svg = ET.parse(os.path.join(tmpdir, 'run.svg')).getroot()
+        legend = svg.find('.//{http://www.w3.org/2000/svg}g[@class="legned"]')
+        assert_equal(len(legend.findall('{http://www.w3.org/2000/svg}g')), 2)
+        assert_equal(svg.get('height'), str(plot._settings['height'] + 30))
+
+def test_export_logs():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_paths = [os.path.join(tmpdir, f'run{i}.lrcurve') for i in range(3)]
+        for log_path in log_paths:
+            _write_log(log_path, 10)
+
+        output_dir = os.path.join(tmpdir, 'reports')
+        outputs = export_logs(log_paths, output_dir, shared_assets=True, max_workers=2)
+        assert_equal(outputs, [os.path.join(output_dir, f'run{i}.html') for i in range(3)])
+        assert_true(os.path.exists(os.path.join(output_dir, 'lrcurve_assets', 'd3.bundle.js')))
+        with open(outputs[0]) as fp:
+            assert_true('src="lrcurve_assets/d3.bundle.js"' in fp.read())
+
+@raises(ValueError)
+def test_format_is_unknown():
+    PlotLearningCurve(display_fn=display_replacer([])).export('run.png', format='png')
+
+def test_export_svg_without_mappings():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        PlotRuns(display_fn=display_replacer([]))._plot.export(os.path.join(tmpdir, 'runs.svg'), format='svg')
+        svg = ET.parse(os.path.join(tmpdir, 'runs.svg')).getroot()
+        assert_equal(len(svg.findall('.//{http://www.w3.org/2000/svg}path[@class="line"]')), 0)
+
+def test_export_svg_band():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plot = PlotLearningCurve(display_fn=display_replacer([]), mappings={
+            'loss': { 'line': 'train', 'facet': 'loss', 'transform': { 'type': 'band', 'window': 5 } }
+        }, line_config={
+            'train': { 'name': 'Train', 'color': '#F8766D' }
+        })
+        for i in range(20):
+            plot.append(i, { 'loss': 1 + (i % 3) })
+        plot.export(os.path.join(tmpdir, 'run.svg'), format='svg')
+
+        svg = ET.parse(os.path.join(tmpdir, 'run.svg')).getroot()
+        bands = svg.findall('.//{http://www.w3.org/2000/svg}path[@class="band"]')
+        assert_equal(len(bands), 1)
+        assert_equal(bands[0].get('fill'), '#F8766D')
+        assert_true(bands[0].get('d').startswith('M'))
+        assert_true(bands[0].get('d').endswith('Z'))
+
+def test_export_svg_run_groups():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runs = PlotRuns(display_fn=display_replacer([]))
+        for name in ['lr=0.1', 'lr=0.01']:
+            runs.add_run(name).append(0, { 'loss': 1, 'val_loss': 2 })
+        runs._plot.export(os.path.join(tmpdir, 'runs.svg'), format='svg')
+
+        svg = ET.parse(os.path.join(tmpdir, 'runs.svg')).getroot()
+        legend = svg.find('.//{http://www.w3.org/2000/svg}g[@class="legned"]')
+        texts = legend.findall('.//{http://www.w3.org/2000/svg}text')
+        assert_equal([text.text for text in texts], ['Train', 'Validation', 'lr=0.1', 'lr=0.01'])
+        legend_lines = legend.findall('.//{http://www.w3.org/2000/svg}line')
+        assert_true(legend_lines[1].get('stroke-dasharray') is not None)
+        dashed = svg.findall('.//{http://www.w3.org/2000/svg}g[@stroke-dasharray="6,3"]')
+        assert_equal(len(dashed), 2)
+
+def test_render_html_escapes_id():
+    settings = { 'id': 'run"</script><b>', **create_settings(**_reconfigure_defaults) }
+    html = render_html(settings, [], assets_url='assets')
+    assert_true('</script><b>' not in html)
+    assert_true('id="run&quot;&lt;/script&gt;&lt;b&gt;"' in html)
+    assert_true('window.setupLearningCurve("run\\"<\\/script><b>", ' in html)
@@ -0,0 +1,144 @@
+import math
+from collections import deque
+
+class ExponentialMovingAverage:
+    """The exponential moving average, `alpha * value + (1 - alpha) * previous`.
+    The first value initializes the average."""
+    def __init__(self, alpha):
+        self._alpha = alpha
+        self._average = None
+
+    def update(self, value):
+        if self._average is None:
+            self._average = value
+        else:
+            self._average = self._alpha * value + (1 - self._alpha) * self._average
+        return self._average
+
+class RollingMean:
+    """The mean of the last `window` values."""
+    def __init__(self, window):
+        self._values = deque(maxlen=window)
+        self._total = 0.0
+
+    def update(self, value):
+        if len(self._values) == self._values.maxlen:
+            self._total -= self._values[0]
+        self._values.append(value)
+        self._total += value
+        return self._total / len(self._values)
+
+class RollingBand:
+    """The mean and standard deviation of the last `window` values."""
+    def __init__(self, window):
+        self._values = deque(maxlen=window)
+        self._total = 0.0
+        self._total_squared = 0.0
+
+    def update(self, value):
+        if len(self._values) == self._values.maxlen:
+            removed = self._values[0]
+            self._total -= removed
+            self._total_squared -= removed * removed
+        self._values.append(value)
+        self._total += value
+        self._total_squared += value * value
+
+        count = len(self._values)
+        mean = self._total / count
+        # The running sums can make the variance slightly negative
+        variance = max(0.0, self._total_squared / count - mean * mean)
+        return (mean, math.sqrt(variance))
+
+_transform_types = {
+    'ema': lambda config: ExponentialMovingAverage(config['alpha']),
+    'mean': lambda config: RollingMean(config['window']),
+    'band': lambda config: RollingBand(config['window'])
+}
+
+def validate_transform(mapping_key, transform):
+    if not isinstance(transform, dict):
+        raise ValueError(f'mappings["{mapping_key}"]["transform"] must be a dict')
+    if transform.get('type') not in _transform_types:
+        raise ValueError(f'mappings["{mapping_key}"]["transform"]["type"] must be one of {", ".join(_transform_types)}')
+    if transform['type'] == 'ema':
+        alpha = transform.get('alpha')
+        if not isinstance(alpha, (int, float)) or not 0 < alpha <= 1:
+            raise ValueError(f'mappings["{mapping_key}"]["transform"]["alpha"] must be a number in (0, 1]')
+    else:
+        window = transform.get('window')
+        if not isinstance(window, int) or window <= 0:
+            raise ValueError(f'mappings["{mapping_key}"]["transform"]["window"] must be a positive integer')
+    stride = transform.get('stride', 1)
+    if not isinstance(stride, int) or stride <= 0:
+        raise ValueError(f'mappings["{mapping_key}"]["transform"]["stride"] must be a positive integer')
+
+class _KeyTransform:
+    def __init__(self, config):
+        self.config = config
+        self.aggregator = _transform_types[config['type']](config)
+        self.stride = config.get('stride', 1)
+        self.count = 0
+
+class StreamingTransforms:
+    """Applies the `transform` of each mapping to the appended values.
+
+    Each transform costs O(1) per value. The transformed value replaces the
+    original value of the key, while a band also adds the `f'{key}:lower'`
+    and `f'{key}:upper'` keys, which `learning_curve.js` draws as a shaded
+    area. With a `stride`, only every `stride`-th value is emitted.
+
+    Example:
+        transforms = StreamingTransforms({
+            'loss': { 'line': 'train', 'facet': 'loss',
+                      'transform': { 'type': 'mean', 'window': 100, 'stride': 100 } }
+        })
+        transforms.apply({ 'loss': 0.5 })  # {} until 100 values are seen
+
+    Arguments:
+        mappings: dict - The plot mappings.
+        previous: StreamingTransforms - The state of the transforms with an
+            unchanged configuration is kept from `previous`.
+    """
+    def __init__(self, mappings, previous=None):
+        self._transforms = dict()
+        for key, mapping_def in mappings.items():
+            if 'transform' not in mapping_def:
+                continue
+            if previous is not None and key in previous._transforms and \
+               previous._transforms[key].config == mapping_def['transform']:
+                self._transforms[key] = previous._transforms[key]
+            else:
+                self._transforms[key] = _KeyTransform(dict(mapping_def['transform']))
+
+    def __len__(self):
+        return len(self._transforms)
+
+    def keys(self):
+        """The keys that have a transform."""
+        return self._transforms.keys()
+
+    def apply(self, y):
+        """Returns the transformed values of a row."""
+        transformed = dict()
+        for key, value in y.items():
+            transform = self._transforms.get(key)
+            if transform is None:
+                transformed[key] = value
+                continue
+            if math.isnan(value):
+                continue
+
+            result = transform.aggregator.update(value)
+            transform.count += 1
+            if transform.count % transform.stride != 0:
+                continue
+
+            if isinstance(result, tuple):
+                mean, std = result
+                transformed[key] = mean
+                transformed[f'{key}:lower'] = mean - std
+                transformed[f'{key}:upper'] = mean + std
+            else:
+                transformed[key] = result
+        return transformed
@@ -0,0 +1,40 @@
+from nose.tools import *
+
+from lrcurve.streaming_transforms import StreamingTransforms, validate_transform
+
+def _mappings(transform):
+    return { 'loss': { 'line': 'train', 'facet': 'loss', 'transform': transform } }
+
+def test_ema():
+    transforms = StreamingTransforms(_mappings({ 'type': 'ema', 'alpha': 0.5 }))
+    assert_equal(transforms.apply({ 'loss': 1, 'val_loss': 3 }), { 'loss': 1, 'val_loss': 3 })
+    assert_equal(transforms.apply({ 'loss': 3 }), { 'loss': 2 })
+    assert_equal(transforms.apply({ 'loss': float('nan') }), {})
+
+def test_rolling_mean_with_stride():
+    transforms = StreamingTransforms(_mappings({ 'type': 'mean', 'window': 2, 'stride': 2 }))
+    assert_equal([transforms.apply({ 'loss': value }) for value in [1, 3, 5, 7]], [
+        {}, { 'loss': 2 }, {}, { 'loss': 6 }
+    ])
+
+def test_rolling_band():
+    transforms = StreamingTransforms(_mappings({ 'type': 'band', 'window': 2 }))
+    transforms.apply({ 'loss': 1 })
+    transforms.apply({ 'loss': 3 })
+    assert_equal(transforms.apply({ 'loss': 5 }), {
+        'loss': 4, 'loss:lower': 3, 'loss:upper': 5
+    })
+
+def test_state_is_kept_on_reconfigure():
+    transforms = StreamingTransforms(_mappings({ 'type': 'mean', 'window': 2 }))
+    transforms.apply({ 'loss': 1 })
+    transforms = StreamingTransforms(_mappings({ 'type': 'mean', 'window': 2 }), transforms)
+    assert_equal(transforms.apply({ 'loss': 3 }), { 'loss': 2 })
+
+@raises(ValueError)
+def test_window_is_not_positive():
+    validate_transform('loss', { 'type': 'mean', 'window': 0 })
+
+@raises(ValueError)
+def test_type_is_unknown():
+    validate_transform('loss', { 'type': 'median', 'window': 10 })
@@ -1,18 +1,17 @@
-window.d3 = Object.assign(
-    {},
-    // d3.select
-    // d3.selectAll
-    require('d3-selection'),
-    // .transition()
-    require('d3-transition'),
-    // d3.extent
-    require('d3-array'),
-    // d3.axisBottom
-    // d3.axisLeft
-    require('d3-axis'),
-    // d3.scaleLinear
-    // d3.scaleTime
-    require('d3-scale'),
-    // d3.line
-    require('d3-shape')
-);
+// Only the d3 functions used by learning_curve.js are included, such that
+// scripts/trim_d3_bundle.js can remove the rest from d3.bundle.js.
+const d3Selection = require('d3-selection');
+const d3Array = require('d3-array');
+const d3Axis = require('d3-axis');
+const d3Scale = require('d3-scale');
+// selection.transition()
+require('d3-transition');
+
+window.d3 = {
+    select: d3Selection.select,
+    extent: d3Array.extent,
+    axisBottom: d3Axis.axisBottom,
+    axisLeft: d3Axis.axisLeft,
+    scaleLinear: d3Scale.scaleLinear,
+    scaleLog: d3Scale.scaleLog
+};
@@ -8,6 +8,8 @@
   const legendHeight = 40;
   const xAxisHeight = 30;
   const xLabelHeight = 20;
+  const chunkSize = 512;
+  const initialCapacity = 64;
 
   function unique(items) {
     return Array.from(new Set(items));
@@ -17,14 +19,14 @@
     return Number.isFinite(number) ? number : null;
   }
 
-  function computeLimit(original, data, lineKeys, fn) {
+  // The extents are maintained by LineStorage, so this is O(lines)
+  function computeLimit(original, storages, extentName) {
     let min = Infinity;
     let max = -Infinity;
 
-    for (const lineKey of lineKeys) {
-      const storage = data.get(lineKey);
+    for (const storage of storages) {
       if (storage.length > 0) {
-        const [localMin, localMax] = d3.extent(storage.map(fn));
+        const [localMin, localMax] = storage[extentName];
         min = Math.min(min, localMin);
         max = Math.max(max, localMax);
       }
@@ -36,6 +38,44 @@
     ];
   }
 
+  const typedArrays = {
+    float64: Float64Array,
+    float32: Float32Array
+  };
+
+  function decodeBase64(encoded, TypedArray) {
+    const binary = window.atob(encoded);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i);
+    }
+    return new TypedArray(bytes.buffer);
+  }
+
+  // Decode the binary payload from wire_format.py into typed arrays
+  function decodeColumns({ encoding, columns }) {
+    const decoded = new Map();
+    for (const [key, [x, y]] of Object.entries(columns)) {
+      decoded.set(key, [
+        decodeBase64(x, Float64Array),
+        decodeBase64(y, typedArrays[encoding])
+      ]);
+    }
+    return decoded;
+  }
+
+  // Decompress the payload from wire_format.compress_payload
+  async function decompressPayload({ payload }) {
+    const stream = new Blob([decodeBase64(payload, Uint8Array)])
+      .stream()
+      .pipeThrough(new DecompressionStream('deflate'));
+    return JSON.parse(await new Response(stream).text());
+  }
+
+  function sameDomain(a, b) {
+    return a.length === b.length && a.every((value, i) => value === b[i]);
+  }
+
   function highestMinorMod(majorTickCount, minorTickMax) {
     return Math.floor((minorTickMax - 1) / (majorTickCount - 1));
   }
@@ -53,8 +93,252 @@
     return minorTicks;
   }
 
+  // Converts a SVG stroke-dasharray, such as '6,3', for the canvas
+  function parseDash(dash) {
+    return dash ? dash.split(',').map(Number) : [];
+  }
+
+  // The SVG path of the points in [start, end) of a LineStorage
+  function linePath(storage, start, end, xScale, yScale) {
+    if (end <= start) return null;
+    const { xs, ys } = storage;
+    let path = `M${xScale(xs[start])},${yScale(ys[start])}`;
+    for (let i = start + 1; i < end; i++) {
+      path += `L${xScale(xs[i])},${yScale(ys[i])}`;
+    }
+    return path;
+  }
+
+  // Calls `fn(x, y)` for each point of the area between the lower and upper
+  // bound of a band, the lower bound from `lowerStart` followed by the upper
+  // bound in reverse. The bounds are not required to have the same x values,
+  // as they may be decimated.
+  function forEachBandPoint(band, lowerStart, upperStart, fn) {
+    const { lower, upper } = band;
+    for (let i = lowerStart; i < lower.length; i++) {
+      fn(lower.xs[i], lower.ys[i]);
+    }
+    for (let i = upper.length - 1; i >= upperStart; i--) {
+      fn(upper.xs[i], upper.ys[i]);
+    }
+  }
+
+  function bandPath(band, xScale, yScale) {
+    if (band.lower.length + band.upper.length === 0) return null;
+    const points = [];
+    forEachBandPoint(band, 0, 0, (x, y) => points.push(`${xScale(x)},${yScale(y)}`));
+    return 'M' + points.join('L') + 'Z';
+  }
+
+  // Draws each line as a sequence of SVG path chunks, such that appending
+  // points only requires redrawing the last chunk.
+  class SvgLineRenderer {
+    constructor({ graph, lineKeys, lineConfig, xScale, yScale }) {
+      this.lineKeys = lineKeys;
+      this.xScale = xScale;
+      this.yScale = yScale;
+
+      // The bands are drawn below all the lines
+      this.bandElements = new Map();
+      this.bandDrawn = new Map();
+      for (const lineKey of lineKeys) {
+        const bandElement = graph.append('path')
+            .attr('class', 'band')
+            .attr('transform', `translate(${axisMargin.left},${axisMargin.top})`)
+            .attr('fill', lineConfig[lineKey].color);
+        this.bandElements.set(lineKey, bandElement);
+        this.bandDrawn.set(lineKey, { lower: -1, upper: -1 });
+      }
+
+      this.lineElements = new Map();
+      this.lineChunks = new Map();
+      for (const lineKey of lineKeys) {
+        const lineElement = graph.append('g')
+            .attr('transform', `translate(${axisMargin.left},${axisMargin.top})`)
+            .attr('stroke', lineConfig[lineKey].color)
+            .attr('stroke-dasharray', lineConfig[lineKey].dash || null);
+        this.lineElements.set(lineKey, lineElement);
+        this.lineChunks.set(lineKey, { chunks: [], length: 0, revision: -1 });
+      }
+    }
+
+    _drawLine(lineKey, storage, redraw) {
+      const drawn = this.lineChunks.get(lineKey);
+
+      // If the scales changed, or points were removed, everything must be
+      // redrawn. Otherwise only the new points are drawn.
+      if (redraw || drawn.revision !== storage.revision || drawn.length > storage.length) {
+        this.lineElements.get(lineKey).selectAll('path').remove();
+        drawn.chunks = [];
+        drawn.length = 0;
+        drawn.revision = storage.revision;
+      }
+
+      while (drawn.length < storage.length) {
+        let chunk = drawn.chunks[drawn.chunks.length - 1];
+        if (!chunk || chunk.end - chunk.start >= chunkSize) {
+          // The chunks overlap by one point, to keep the line connected
+          chunk = {
+            start: Math.max(0, drawn.length - 1),
+            end: drawn.length,
+            element: this.lineElements.get(lineKey).append('path')
+              .attr('class', 'line')
+          };
+          drawn.chunks.push(chunk);
+        }
+
+        chunk.end = Math.min(chunk.start + chunkSize, storage.length);
+        chunk.element.attr('d', linePath(storage, chunk.start, chunk.end, this.xScale, this.yScale));
+        drawn.length = chunk.end;
+      }
+    }
+
+    _drawBand(lineKey, band, redraw) {
+      const drawn = this.bandDrawn.get(lineKey);
+      const lower = band ? band.lower.revision * 1e9 + band.lower.length : -1;
+      const upper = band ? band.upper.revision * 1e9 + band.upper.length : -1;
+      if (!redraw && drawn.lower === lower && drawn.upper === upper) return;
+
+      this.bandElements.get(lineKey)
+        .attr('d', band ? bandPath(band, this.xScale, this.yScale) : null);
+      drawn.lower = lower;
+      drawn.upper = upper;
+    }
+
+    draw(data, redraw, bands) {
+      for (const lineKey of this.lineKeys) {
+        this._drawBand(lineKey, bands.get(lineKey), redraw);
+        this._drawLine(lineKey, data.get(lineKey), redraw);
+      }
+    }
+  }
+
+  function createCanvas(graph, graphWidth, graphHeight) {
+    const ratio = window.devicePixelRatio || 1;
+    const canvas = graph.append('foreignObject')
+      .attr('width', graphWidth)
+      .attr('height', graphHeight)
+      .append('xhtml:canvas')
+      .attr('width', Math.round(graphWidth * ratio))
+      .attr('height', Math.round(graphHeight * ratio))
+      .style('width', `${graphWidth}px`)
+      .style('height', `${graphHeight}px`)
+      .style('display', 'block')
+      .node();
+
+    const context = canvas.getContext('2d');
+    context.scale(ratio, ratio);
+    context.translate(axisMargin.left, axisMargin.top);
+    context.lineWidth = 1;
+    return context;
+  }
+
+  function clearCanvas(context) {
+    context.save();
+    context.setTransform(1, 0, 0, 1, 0, 0);
+    context.clearRect(0, 0, context.canvas.width, context.canvas.height);
+    context.restore();
+  }
+
+  // Draws the lines on a <canvas>, placed inside the SVG using a
+  // <foreignObject>, such it is layered between the grid and the legend
+  // like the SVG lines. As the canvas keeps its pixels, only the new
+  // line segments are drawn, unless the scales changed.
+  class CanvasLineRenderer {
+    constructor({ graph, graphWidth, graphHeight, lineKeys, lineConfig, xScale, yScale }) {
+      this.lineKeys = lineKeys;
+      this.lineConfig = lineConfig;
+
+      // The bands are semi-transparent, so each band must be filled as one
+      // path. They are drawn on their own canvas below the lines, such that
+      // refilling them does not require redrawing the lines.
+      this.bandContext = createCanvas(graph, graphWidth, graphHeight);
+      this.context = createCanvas(graph, graphWidth, graphHeight);
+
+      this.xScale = xScale;
+      this.yScale = yScale;
+
+      this.drawn = new Map();
+      this.bandDrawn = new Map();
+      for (const lineKey of lineKeys) {
+        this.drawn.set(lineKey, { length: 0, revision: -1 });
+        this.bandDrawn.set(lineKey, { lower: 0, upper: 0, revision: -1 });
+      }
+    }
+
+    _fillBands(bands, redraw) {
+      let changed = redraw;
+      for (const lineKey of this.lineKeys) {
+        const band = bands.get(lineKey);
+        const drawn = this.bandDrawn.get(lineKey);
+        const revision = band ? band.lower.revision + band.upper.revision : -1;
+        const lower = band ? band.lower.length : 0;
+        const upper = band ? band.upper.length : 0;
+        changed = changed || drawn.revision !== revision || drawn.lower !== lower || drawn.upper !== upper;
+        Object.assign(drawn, { lower, upper, revision });
+      }
+      if (!changed) return;
+
+      clearCanvas(this.bandContext);
+      this.bandContext.globalAlpha = 0.2;
+      for (const lineKey of this.lineKeys) {
+        const band = bands.get(lineKey);
+        if (!band || band.lower.length + band.upper.length === 0) continue;
+
+        this.bandContext.beginPath();
+        forEachBandPoint(band, 0, 0, (x, y) => {
+          this.bandContext.lineTo(this.xScale(x), this.yScale(y));
+        });
+        this.bandContext.closePath();
+        this.bandContext.fillStyle = this.lineConfig[lineKey].color;
+        this.bandContext.fill();
+      }
+    }
+
+    draw(data, redraw, bands) {
+      this._fillBands(bands, redraw);
+
+      // Clearing the canvas affects all lines, so if one line must be
+      // redrawn, all lines are redrawn.
+      for (const lineKey of this.lineKeys) {
+        const storage = data.get(lineKey);
+        const drawn = this.drawn.get(lineKey);
+        redraw = redraw || drawn.revision !== storage.revision || drawn.length > storage.length;
+      }
+
+      if (redraw) {
+        clearCanvas(this.context);
+        for (const lineKey of this.lineKeys) {
+          const drawn = this.drawn.get(lineKey);
+          drawn.length = 0;
+          drawn.revision = data.get(lineKey).revision;
+        }
+      }
+
+      for (const lineKey of this.lineKeys) {
+        const storage = data.get(lineKey);
+        const drawn = this.drawn.get(lineKey);
+        if (drawn.length < storage.length) {
+          // Start from the last drawn point, to keep the line connected
+          const { xs, ys } = storage;
+          const start = Math.max(0, drawn.length - 1);
+          this.context.beginPath();
+          this.context.moveTo(this.xScale(xs[start]), this.yScale(ys[start]));
+          for (let i = start + 1; i < storage.length; i++) {
+            this.context.lineTo(this.xScale(xs[i]), this.yScale(ys[i]));
+          }
+          this.context.strokeStyle = this.lineConfig[lineKey].color;
+          this.context.setLineDash(parseDash(this.lineConfig[lineKey].dash));
+          this.context.stroke();
+          drawn.length = storage.length;
+        }
+      }
+    }
+  }
+
   class SubGraph {
-    constructor({ container, id, index, height, width, drawXAxis, lineKeys, lineConfig, facetLabel, yscale, ylim, xlim }) {
+    constructor({ container, id, index, height, width, drawXAxis, lineKeys, lineConfig, facetLabel, yscale, ylim, xlim, renderer,
+                  zoom = null, onZoom = () => {} }) {
       this.container = container;
 
       this.graphWidth = width - facetWidth - margin.left - margin.right;
@@ -67,6 +351,7 @@
       this.dynamicXlim = this.xlim.includes(null);
       this.ylim = ylim;
       this.dynamicYlim = this.ylim.includes(null);
+      this.zoomXlim = zoom;
 
       this.lineKeys = lineKeys;
       this.lineConfig = lineConfig;
@@ -110,8 +395,11 @@
         .range([this.axisHeight, 0]);
 
       // compute tick marks
-      this._updateXscale(this.xlim);
-      this._updateYscale(this.ylim);
+      this._updateXscale(this.zoomXlim || this.xlim, true);
+      this._updateYscale(this.ylim, true);
+      this.xDomainChanged = this.dynamicXlim || this.zoomXlim !== null;
+      this.yDomainChanged = this.dynamicYlim;
+      this.dataChanged = false;
 
       // create x-grid
       this.xGrid = d3.axisBottom(this.xScale)
@@ -148,31 +436,89 @@
       if (!this.dynamicYlim) this._drawYaxis();
       if (!this.dynamicXlim) this._drawXaxis();
 
-      // Define drawer functions and line elements
-      this.lineDrawers = new Map();
-      this.lineElements = new Map();
-      const self = this;
-      for (const lineKey of this.lineKeys) {
-        // create drawer function
-        const lineDrawer = d3.line()
-            .x((d) => self.xScale(d.x))
-            .y((d) => this.yScale(d.y));
-        this.lineDrawers.set(lineKey, lineDrawer);
-
-        // create line element
-        const lineElement = this.graph.append('path')
-            .attr('class', 'line')
-            .attr('transform', `translate(${axisMargin.left},${axisMargin.top})`)
-            .attr('stroke', lineConfig[lineKey].color);
-        this.lineElements.set(lineKey, lineElement);
-      }
+      // Create the line renderer. The lines are clipped to the graph, as
+      // they extend beyond the x-axis when zoomed.
+      this.graph.append('clipPath')
+        .attr('id', `learning-curve-${id}-${index}-clip`)
+        .append('rect')
+        .attr('width', this.graphWidth)
+        .attr('height', this.graphHeight);
+      const LineRenderer = renderer === 'canvas' ? CanvasLineRenderer : SvgLineRenderer;
+      this.lineRenderer = new LineRenderer({
+        graph: this.graph.append('g')
+          .attr('clip-path', `url(#learning-curve-${id}-${index}-clip)`),
+        graphWidth: this.graphWidth,
+        graphHeight: this.graphHeight,
+        lineKeys: this.lineKeys,
+        lineConfig: this.lineConfig,
+        xScale: this.xScale,
+        yScale: this.yScale
+      });
+
+      // Dragging selects a x-range to zoom, and a double click resets it
+      this.selection = this.graph.append('rect')
+        .classed('zoom-selection', true)
+        .attr('height', this.graphHeight)
+        .style('display', 'none');
+      this._enableZoom(onZoom);
     }
 
-    _updateXscale(xlim) {
+    _pointerX(event) {
+      const rect = this.background.node().getBoundingClientRect();
+      const x = (event.clientX - rect.left) * this.graphWidth / rect.width;
+      return Math.min(Math.max(x, 0), this.graphWidth);
+    }
+
+    _enableZoom(onZoom) {
+      const node = this.graph.node();
+      let start = null;
+
+      node.addEventListener('mousedown', (event) => {
+        start = this._pointerX(event);
+        event.preventDefault();
+      });
+      node.addEventListener('mousemove', (event) => {
+        if (start === null) return;
+        const end = this._pointerX(event);
+        this.selection
+          .style('display', null)
+          .attr('x', Math.min(start, end))
+          .attr('width', Math.abs(end - start));
+      });
+
+      const finish = (event) => {
+        if (start === null) return;
+        const end = this._pointerX(event);
+        this.selection.style('display', 'none');
+        // Short drags are most likely clicks
+        if (Math.abs(end - start) >= 5) {
+          onZoom([Math.min(start, end), Math.max(start, end)]
+            .map((x) => this.xScale.invert(x - axisMargin.left)));
+        }
+        start = null;
+      };
+      node.addEventListener('mouseup', finish);
+      node.addEventListener('mouseleave', finish);
+      node.addEventListener('dblclick', () => onZoom(null));
+    }
+
+    setZoom(xlim) {
+      this.zoomXlim = xlim;
+    }
+
+    setDrawXAxis(drawXAxis) {
+      this.xAxisElement.classed('hide-axis', !drawXAxis);
+    }
+
+    _updateXscale(xlim, force = false) {
+      const previousDomain = this.xScale.domain();
       this.xScale.domain(xlim).nice(6);
+      if (!force && sameDomain(previousDomain, this.xScale.domain())) return false;
+
       this.xTicks = this.xScale.ticks(6);
       this.xTicksMod = highestMinorMod(this.xTicks.length, 19);
       this.xTicksGrid = createGridTicks(this.xTicks, this.xTicksMod);
+      return true;
     }
 
     _drawXaxis() {
@@ -190,11 +536,15 @@
       );
     }
 
-    _updateYscale(ylim) {
+    _updateYscale(ylim, force = false) {
+      const previousDomain = this.yScale.domain();
       this.yScale.domain(ylim).nice(3);
+      if (!force && sameDomain(previousDomain, this.yScale.domain())) return false;
+
       this.yTicks = this.yScale.ticks(3);
       this.yTicksMod = highestMinorMod(this.yTicks.length, 9);
       this.yTicksGrid = createGridTicks(this.yTicks, this.yTicksMod);
+      return true;
     }
 
     _drawYaxis() {
@@ -211,85 +561,165 @@
       );
     }
 
-    setData (data) {
+    setData (data, bands) {
+      // Switching between the data and the zoomed detail requires a redraw
+      if (this.data !== undefined && this.data !== data) {
+        this.dataChanged = true;
+      }
+      this.data = data;
+      this.bands = bands;
+      const storages = this.lineKeys.map((lineKey) => data.get(lineKey));
+
       // Compute x-axis limit
-      if (this.dynamicXlim) {
-        const xlim = computeLimit(this.xlim, data, this.lineKeys, (d) => d.x);
-        if (xlim[0] !== this.xlim[0] || xlim[1] !== this.xlim[1]) {
-          this._updateXscale(xlim);
-        }
+      let xlim = this.xlim;
+      if (this.zoomXlim !== null) {
+        xlim = this.zoomXlim;
+      } else if (this.dynamicXlim) {
+        xlim = computeLimit(this.xlim, storages, 'xExtent');
+      }
+      if (this._updateXscale(xlim)) {
+        this.xDomainChanged = true;
       }
 
       // Update y-axis limit
       if (this.dynamicYlim) {
-        const ylim = computeLimit(this.ylim, data, this.lineKeys, (d) => d.y);
-        if (ylim[0] !== this.ylim[0] || ylim[1] !== this.ylim[1]) {
-          this._updateYscale(ylim);
+        const ylim = computeLimit(this.ylim, storages.concat(
+          Array.from(bands.values()).flatMap(({ lower, upper }) => [lower, upper])
+        ), 'yExtent');
+        if (this._updateYscale(ylim)) {
+          this.yDomainChanged = true;
         }
       }
-
-      // Update line data
-      for (let lineKey of this.lineKeys) {
-        this.lineElements.get(lineKey).data([
-          data.get(lineKey)
-        ]);
-      }
     }
 
     draw() {
-      if (this.dynamicXlim) this._drawXaxis();
-      if (this.dynamicYlim) this._drawYaxis();
+      if (this.xDomainChanged) this._drawXaxis();
+      if (this.yDomainChanged) this._drawYaxis();
 
       // update lines
-      for (let lineKey of this.lineKeys) {
-        this.lineElements.get(lineKey)
-          .attr('d', this.lineDrawers.get(lineKey));
-      }
+      this.lineRenderer.draw(
+        this.data, this.xDomainChanged || this.yDomainChanged || this.dataChanged, this.bands
+      );
+
+      this.xDomainChanged = false;
+      this.yDomainChanged = false;
+      this.dataChanged = false;
+    }
+  }
+
+  // The legend items. If the lines are grouped, e.g. by run, there is
+  // an item per group which toggles the visibility of the group, and an
+  // item per line name showing the dash pattern.
+  function legendItems(lineConfig, hiddenGroups) {
+    const lineDefs = Object.values(lineConfig);
+    const groups = unique(lineDefs.map(({ group }) => group).filter((group) => group !== undefined));
+    if (groups.length === 0) {
+      return lineDefs.map(({ name, color, dash }) => ({ name, color, dash }));
     }
+
+    const groupItems = groups.map((group) => ({
+      name: group,
+      color: lineDefs.find((lineDef) => lineDef.group === group).color,
+      group: group,
+      hidden: hiddenGroups.has(group)
+    }));
+    const dashItems = unique(lineDefs.map(({ name }) => name)).map((name) => ({
+      name: name,
+      color: '#505050',
+      dash: lineDefs.find((lineDef) => lineDef.name === name).dash
+    }));
+    return dashItems.concat(groupItems);
   }
 
   class LearningCurvePlot {
-    constructor({ id, height, width, mappings, facetConfig, lineConfig, xAxisConfig }) {
+    constructor(settings, { hiddenGroups = new Set(), onToggleGroup = () => {}, onZoom = () => {} } = {}) {
+      this._hiddenGroups = hiddenGroups;
+      this._onToggleGroup = onToggleGroup;
+      this._onZoom = onZoom;
+      this._zoom = null;
+      this._subGraphCount = 0;
+      this._subGraphHeight = null;
+
+      this._container = d3.select(document.getElementById(settings.id))
+        .classed('learning-curve', true)
+        .attr('xmlns:xlink', 'http://www.w3.org/1999/xlink');
+      this._facets = new Map();
+      this._xLabel = this._container.append('text')
+        .attr('text-anchor', 'middle');
+      this._legend = this._container
+        .append('g')
+        .classed('legned', true);
+
+      this.update(settings, null);
+    }
+
+    // Updates the figure to the new settings. The SubGraphs of the
+    // `changedFacets` are recreated, while the other SubGraphs are only moved
+    // and keep their drawn lines. If `changedFacets` is null, or the facet
+    // height changed, all SubGraphs are recreated.
+    update({ id, height, width, mappings, facetConfig, lineConfig, xAxisConfig, renderer }, changedFacets) {
       this.facetKeys = unique(Object.values(mappings).map(({line, facet}) => facet)).sort();
 
       const innerHeight = height - legendHeight - xLabelHeight - xAxisHeight;
       const subGraphHeight = innerHeight / this.facetKeys.length;
+      const resize = subGraphHeight !== this._subGraphHeight;
+      this._subGraphHeight = subGraphHeight;
+
+      this._container
+        .style('height', `${height}px`)
+        .style('width', `${width}px`)
+        .attr('height', height)
+        .attr('width', width);
+
+      // Remove the SubGraphs that needs to be recreated
+      for (const [facetKey, subGraph] of Array.from(this._facets.entries())) {
+        if (resize || changedFacets === null || changedFacets.has(facetKey) ||
+            !this.facetKeys.includes(facetKey)) {
+          subGraph.container.remove();
+          this._facets.delete(facetKey);
+        }
+      }
 
-      this._container = d3.select(document.getElementById(id))
-      .classed('learning-curve', true)
-      .style('height', `${height}px`)
-      .style('width', `${width}px`)
-      .attr('height', height)
-      .attr('width', width)
-      .attr('xmlns:xlink', 'http://www.w3.org/1999/xlink');
-
-      // Create a SubGraph for each facet
-      this._facets = new Map();
+      // Create a SubGraph for each new facet, and move the existing ones
       for (let facetIndex = 0; facetIndex < this.facetKeys.length; facetIndex++) {
         const facetKey = this.facetKeys[facetIndex];
+        const transform = `translate(0, ${facetIndex * subGraphHeight})`;
+        const drawXAxis = facetIndex == this.facetKeys.length - 1;
+
+        if (this._facets.has(facetKey)) {
+          const subGraph = this._facets.get(facetKey);
+          subGraph.container.attr('transform', transform);
+          subGraph.setDrawXAxis(drawXAxis);
+          continue;
+        }
+
         const lineKeys = unique(
             Object.values(mappings)
             .filter(({facet, line}) => facet === facetKey)
             .map(({facet, line}) => line)
+            .filter((line) => !this._hiddenGroups.has(lineConfig[line].group))
         ).sort();
         this._facets.set(
           facetKey,
           new SubGraph({
-            container: this._container.append('g')
-              .attr('transform', `translate(0, ${facetIndex * subGraphHeight})`),
+            container: this._container.insert('g', () => this._xLabel.node())
+              .attr('transform', transform),
             id: id,
-            index: facetIndex,
+            index: this._subGraphCount++,
             height: Math.round(subGraphHeight),
             width: width,
 
-            drawXAxis: facetIndex == this.facetKeys.length - 1,
+            drawXAxis: drawXAxis,
 
             lineKeys: lineKeys,
             lineConfig: lineConfig,
             facetLabel: facetConfig[facetKey].name,
             yscale: facetConfig[facetKey].scale,
             ylim: facetConfig[facetKey].limit,
-            xlim: xAxisConfig.limit
+            xlim: xAxisConfig.limit,
+            renderer: renderer || 'svg',
+            zoom: this._zoom,
+            onZoom: this._onZoom
           })
         );
       }
@@ -299,51 +729,85 @@
       const xAxisWidth = plotWidth - facetWidth;
 
       // Draw x-axis label
-      this._xLabel = this._container.append('text')
-        .attr('text-anchor', 'middle')
+      this._xLabel
         .attr('transform', `translate(${margin.left}, ${afterSubGraphHeight})`)
         .attr('x', xAxisWidth / 2)
         .text(xAxisConfig.name);
 
       // Draw legends
-      this._legend = this._container
-        .append('g')
-        .classed('legned', true)
-        .attr('transform', `translate(${margin.left}, ${afterSubGraphHeight + xLabelHeight})`);
-      this._legendOfsset = this._legend.append('g');
+      this._legend
+        .attr('transform', `translate(${margin.left}, ${afterSubGraphHeight + xLabelHeight})`)
+        .selectAll('*').remove();
 
+      // The items are placed in centered rows, a new row is started when
+      // the items don't fit within the plot width.
+      const rows = [[]];
       let currentOffset = 0;
-      for (const {name, color} of Object.values(lineConfig)) {
+      for (const {name, color, dash, group, hidden} of legendItems(lineConfig, this._hiddenGroups)) {
+        const item = this._legend.append('g')
+          .classed('legend-group', group !== undefined)
+          .style('opacity', hidden ? 0.4 : null);
+        if (group !== undefined) {
+          item.on('click', () => this._onToggleGroup(group));
+        }
+
         // Draw rect with line inside [-]
-        this._legendOfsset.append('rect')
+        item.append('rect')
           .attr('width', 25)
-          .attr('height', 25)
-          .attr('x', currentOffset);
-        this._legendOfsset.append('line')
-          .attr('x1', currentOffset + 2)
-          .attr('x2', currentOffset + 25 - 2)
+          .attr('height', 25);
+        item.append('line')
+          .attr('x1', 2)
+          .attr('x2', 25 - 2)
           .attr('y1', 25/2)
           .attr('y2', 25/2)
-          .attr('stroke', color);
-        currentOffset += 30;
+          .attr('stroke', color)
+          .attr('stroke-dasharray', dash || null);
 
         // Draw text
-        const textNode = this._legendOfsset.append('text')
-          .attr('x', currentOffset)
+        const textNode = item.append('text')
+          .attr('x', 30)
           .attr('y', 19)
           .text(name);
-        const textWidth = textNode.node().getComputedTextLength();
-        currentOffset += textWidth + 20;
+        const itemWidth = 30 + textNode.node().getComputedTextLength();
+
+        let row = rows[rows.length - 1];
+        if (row.length > 0 && currentOffset + itemWidth > plotWidth) {
+          row = [];
+          rows.push(row);
+          currentOffset = 0;
+        }
+        row.push({ item, offset: currentOffset, width: itemWidth });
+        currentOffset += itemWidth + 20;
+      }
+
+      for (let rowIndex = 0; rowIndex < rows.length; rowIndex++) {
+        const row = rows[rowIndex];
+        if (row.length === 0) continue;
+        const last = row[row.length - 1];
+        const rowWidth = last.offset + last.width;
+        for (const { item, offset } of row) {
+          item.attr('transform', `translate(${(plotWidth - rowWidth) / 2 + offset}, ${rowIndex * 30})`);
+        }
       }
-      currentOffset -= 20;
 
-      this._legendOfsset
-        .attr('transform', `translate(${(plotWidth - currentOffset) / 2}, 0)`);
+      // Extend the figure, if the legend needs more than one row
+      const totalHeight = height + (rows.length - 1) * 30;
+      this._container
+        .style('height', `${totalHeight}px`)
+        .attr('height', totalHeight);
+    }
+
+    // Sets the x-range of all facets, or resets it if `range` is null
+    setZoom(range) {
+      this._zoom = range;
+      for (const subGraph of this._facets.values()) {
+        subGraph.setZoom(range);
+      }
     }
 
     setData(data) {
       for (let facetKey of this.facetKeys) {
-        this._facets.get(facetKey).setData(data.get(facetKey));
+        this._facets.get(facetKey).setData(data.get(facetKey), data.getBands(facetKey));
       }
     }
 
@@ -352,9 +816,95 @@
         this._facets.get(facetKey).draw();
       }
     }
+  }
 
-    remove() {
-      this._container.selectAll("*").remove();
+  // Class to store the points of a line, and maintain the extents of the
+  // points as they are appended. The points are stored in growable
+  // Float64Array columns, such appending does not allocate an object per
+  // point. The revision is incremented when points are removed, such the
+  // line drawers know to redraw everything.
+  class LineStorage {
+    constructor() {
+      this.xs = new Float64Array(initialCapacity);
+      this.ys = new Float64Array(initialCapacity);
+      this.length = 0;
+      this.revision = 0;
+      this._resetExtent();
+    }
+
+    _reserve(length) {
+      if (length <= this.xs.length) return;
+
+      let capacity = this.xs.length;
+      while (capacity < length) capacity *= 2;
+      const xs = new Float64Array(capacity);
+      const ys = new Float64Array(capacity);
+      xs.set(this.xs.subarray(0, this.length));
+      ys.set(this.ys.subarray(0, this.length));
+      this.xs = xs;
+      this.ys = ys;
+    }
+
+    _resetExtent() {
+      this.xExtent = [Infinity, -Infinity];
+      this.yExtent = [Infinity, -Infinity];
+    }
+
+    _updateExtent(start, end) {
+      // NaN values are ignored, like d3.extent does
+      let [xMin, xMax] = this.xExtent;
+      let [yMin, yMax] = this.yExtent;
+      for (let i = start; i < end; i++) {
+        const x = this.xs[i];
+        const y = this.ys[i];
+        if (x < xMin) xMin = x;
+        if (x > xMax) xMax = x;
+        if (y < yMin) yMin = y;
+        if (y > yMax) yMax = y;
+      }
+      this.xExtent[0] = xMin;
+      this.xExtent[1] = xMax;
+      this.yExtent[0] = yMin;
+      this.yExtent[1] = yMax;
+    }
+
+    push(x, y) {
+      this._reserve(this.length + 1);
+      this.xs[this.length] = x;
+      this.ys[this.length] = y;
+      this.length += 1;
+      this._updateExtent(this.length - 1, this.length);
+    }
+
+    // Appends typed arrays (or arrays) of x and y values
+    pushColumns(xs, ys) {
+      const start = this.length;
+      this._reserve(start + xs.length);
+      this.xs.set(xs, start);
+      this.ys.set(ys, start);
+      this.length += xs.length;
+      this._updateExtent(start, this.length);
+    }
+
+    // Remove all points where x is at least `fromX`. The points are assumed
+    // to be ordered by x.
+    truncate(fromX) {
+      const length = this.length;
+      while (this.length > 0 && this.xs[this.length - 1] >= fromX) {
+        this.length -= 1;
+      }
+
+      if (this.length !== length) {
+        this.revision += 1;
+        this._resetExtent();
+        this._updateExtent(0, this.length);
+      }
+    }
+
+    clear() {
+      this.length = 0;
+      this.revision += 1;
+      this._resetExtent();
     }
   }
 
@@ -362,12 +912,31 @@
   class LearningCurveData {
     constructor(settings) {
       this.index = new Map();
+      this.bandIndex = new Map();
       this.data = new Map();
       this.updateSettings(settings);
     }
 
+    // A band transform sends the bounds as the `${key}:lower` and
+    // `${key}:upper` keys, see streaming_transforms.py. The settings are
+    // validated such only one key of each line has a band.
+    _addBand(key, line, facet) {
+      if (!this.bandIndex.has(facet)) {
+        this.bandIndex.set(facet, new Map());
+      }
+      if (!this.bandIndex.get(facet).has(line)) {
+        const band = { lower: new LineStorage(), upper: new LineStorage() };
+        this.bandIndex.get(facet).set(line, band);
+        this.data.set(`${key}:lower`, band.lower);
+        this.data.set(`${key}:upper`, band.upper);
+      }
+    }
+
     updateSettings (settings) {
-      for (const [key, {line, facet}] of Object.entries(settings.mappings)) {
+      for (const [key, {line, facet, transform}] of Object.entries(settings.mappings)) {
+        if (transform && transform.type === 'band') {
+          this._addBand(key, line, facet);
+        }
         if (this.data.has(key)) {
           continue;
         }
@@ -376,7 +945,7 @@
           this.index.set(facet, new Map());
         }
         if (!this.index.get(facet).has(line)) {
-          const storage = [];
+          const storage = new LineStorage();
           this.index.get(facet).set(line, storage);
           this.data.set(key, storage);
         }
@@ -384,12 +953,10 @@
     }
 
     append([x, y]) {
-      for (const [key, storage] of this.data.entries()) {
-        if (Object.prototype.hasOwnProperty.call(y, key)) {
-          storage.push({
-            x: x,
-            y: y[key]
-          })
+      for (const key in y) {
+        const storage = this.data.get(key);
+        if (storage !== undefined) {
+          storage.push(x, y[key]);
         }
       }
     }
@@ -400,33 +967,155 @@
       }
     }
 
+    // Appends the columns from decodeColumns, each directly into the
+    // typed arrays of its line
+    appendColumns(columns) {
+      for (const [key, [xs, ys]] of columns.entries()) {
+        const storage = this.data.get(key);
+        if (storage !== undefined) {
+          storage.pushColumns(xs, ys);
+        }
+      }
+    }
+
+    truncate(fromX) {
+      for (const storage of this.data.values()) {
+        storage.truncate(fromX);
+      }
+    }
+
+    clear() {
+      for (const storage of this.data.values()) {
+        storage.clear();
+      }
+    }
+
     get(facet) {
       return this.index.get(facet);
     }
+
+    getBands(facet) {
+      return this.bandIndex.get(facet) || new Map();
+    }
   }
 
   class LearningCurveDrawScheduler {
-    constructor(settings) {
+    constructor(settings, comm = null) {
       this.waitingForDrawing = false;
-      this.graph = new LearningCurvePlot(settings);
+      this.settings = settings;
+      this.comm = comm;
+      this.hiddenGroups = new Set();
+      this.zoomRange = null;
+      this.detail = null;
+      this.detailRequest = 0;
+      this.graph = this._createPlot(settings);
       this.data = new LearningCurveData(settings);
     }
 
+    _createPlot(settings) {
+      return new LearningCurvePlot(settings, {
+        hiddenGroups: this.hiddenGroups,
+        onToggleGroup: this.toggleGroup.bind(this),
+        onZoom: this.zoom.bind(this)
+      });
+    }
+
+    // If the points are decimated by the kernel, the zoomed range is drawn
+    // using the decimated points until the detail is fetched over the comm.
+    zoom(range) {
+      this.zoomRange = range;
+      this.detail = null;
+      this.detailRequest += 1;
+      this.graph.setZoom(range);
+
+      const element = document.getElementById(this.settings.id);
+      if (range !== null && this.comm !== null && !element.finalized) {
+        this.comm.send({
+          event: 'fetch',
+          id: this.settings.id,
+          request: this.detailRequest,
+          range: range,
+          points: this.settings.width
+        });
+      }
+      this.draw();
+    }
+
+    setDetail(request, data) {
+      if (request !== this.detailRequest) return;
+
+      this.detail = new LearningCurveData(this.settings);
+      if (Array.isArray(data)) {
+        this.detail.appendAll(data);
+      } else {
+        this.detail.appendColumns(decodeColumns(data));
+      }
+      this.draw();
+    }
+
+    // Hidden groups are only filtered on the client, by recreating the
+    // figure without their lines.
+    toggleGroup(group) {
+      if (this.hiddenGroups.has(group)) {
+        this.hiddenGroups.delete(group);
+      } else {
+        this.hiddenGroups.add(group);
+      }
+      this.updateSettings(this.settings);
+    }
+
     updateSettings(settings) {
-      this.graph.remove();
-      this.graph = new LearningCurvePlot(settings);
+      this.settings = settings;
+      this.detail = null;
+      this.data.updateSettings(settings);
+      this.graph.update(settings, null);
+      this.draw();
+    }
+
+    // Applies the changes from plot_learning_curve.settings_delta. Only the
+    // facets with new or changed lines are recreated, and the data already
+    // stored is kept as is.
+    applyChanges({ height, mappings = {}, lineConfig = {}, facetConfig = {} }) {
+      const settings = Object.assign({}, this.settings, {
+        height: height === undefined ? this.settings.height : height,
+        mappings: Object.assign({}, this.settings.mappings, mappings),
+        lineConfig: Object.assign({}, this.settings.lineConfig, lineConfig),
+        facetConfig: Object.assign({}, this.settings.facetConfig, facetConfig)
+      });
+
+      const changedFacets = new Set(Object.keys(facetConfig));
+      for (const [key, { line, facet }] of Object.entries(settings.mappings)) {
+        if (Object.prototype.hasOwnProperty.call(mappings, key) ||
+            Object.prototype.hasOwnProperty.call(lineConfig, line)) {
+          changedFacets.add(facet);
+        }
+      }
+
+      this.settings = settings;
+      this.detail = null;
       this.data.updateSettings(settings);
+      this.graph.update(settings, changedFacets);
       this.draw();
     }
 
     draw() {
       this.waitingForDrawing = false;
-      this.graph.setData(this.data);
+      this.graph.setData(this.detail === null ? this.data : this.detail);
       this.graph.draw();
     }
 
-    appendAllAndUpdate(data) {
-      this.data.appendAll(data);
+    appendAllAndUpdate(data, options) {
+      if (options && options.reset) {
+        this.data.clear();
+      } else if (options && Number.isFinite(options.truncate)) {
+        this.data.truncate(options.truncate);
+      }
+
+      if (Array.isArray(data)) {
+        this.data.appendAll(data);
+      } else {
+        this.data.appendColumns(decodeColumns(data));
+      }
 
       if (!this.waitingForDrawing) {
         this.waitingForDrawing = true;
@@ -435,15 +1124,90 @@
     }
   }
 
-  window.setupLearningCurve = function (id, settings) {
-    if (document.getElementById(id).instance) {
-      document.getElementById(id).instance.updateSettings(settings);
+  // Once the live figure is finalized, the data is also stored in a <script>
+  // tag, which should only have an effect when the notebook is reopened.
+  function setupLearningCurve(id, settings, comm = null) {
+    const element = document.getElementById(id);
+    if (element.finalized) return;
+
+    if (element.instance) {
+      element.instance.updateSettings(settings);
+      if (comm !== null) element.instance.comm = comm;
     } else {
-      document.getElementById(id).instance = new LearningCurveDrawScheduler(settings);
+      element.instance = new LearningCurveDrawScheduler(settings, comm);
     }
-  };
+  }
 
-  window.appendLearningCurve = function (id, data) {
-    document.getElementById(id).instance.appendAllAndUpdate(data);
-  };
+  function reconfigureLearningCurve(id, changes) {
+    const element = document.getElementById(id);
+    if (element.finalized || !element.instance) return;
+
+    element.instance.applyChanges(changes);
+  }
+
+  function detailLearningCurve(id, request, data) {
+    const element = document.getElementById(id);
+    if (element.finalized || !element.instance) return;
+
+    element.instance.setDetail(request, data);
+  }
+
+  function appendLearningCurve(id, data, options) {
+    const element = document.getElementById(id);
+    if (element.finalized) return;
+
+    if (data && data.compression) {
+      decompressPayload(data).then(
+        (decompressed) => element.instance.appendAllAndUpdate(decompressed, options)
+      );
+    } else {
+      element.instance.appendAllAndUpdate(data, options);
+    }
+  }
+
+  window.setupLearningCurve = setupLearningCurve;
+  window.reconfigureLearningCurve = reconfigureLearningCurve;
+  window.appendLearningCurve = appendLearningCurve;
+
+  // Draw the finalized outputs that were rendered before the assets loaded
+  for (const run of (window.lrcurveQueue || []).splice(0)) {
+    run();
+  }
+
+  // Handle the updates from comm_transport.py, and acknowledge them such
+  // the kernel knows when the frontend is ready for more.
+  function handleCommMessage(comm, { method, id, seq, settings, changes, request, data, options }) {
+    try {
+      if (method === 'setup') {
+        setupLearningCurve(id, settings, comm);
+      } else if (method === 'reconfigure') {
+        reconfigureLearningCurve(id, changes);
+      } else if (method === 'detail') {
+        detailLearningCurve(id, request, data);
+      } else if (method === 'append') {
+        appendLearningCurve(id, data, options);
+      }
+    } finally {
+      comm.send({ event: 'ack', seq: seq });
+    }
+  }
+
+  // Jupyter Notebook
+  if (window.Jupyter && window.Jupyter.notebook && window.Jupyter.notebook.kernel) {
+    window.Jupyter.notebook.kernel.comm_manager.register_target('lrcurve', function (comm) {
+      comm.on_msg((msg) => handleCommMessage(comm, msg.content.data));
+      comm.send({ event: 'ready' });
+    });
+  }
+
+  // Google Colab
+  if (window.google && window.google.colab && window.google.colab.kernel &&
+      window.google.colab.kernel.comms) {
+    window.google.colab.kernel.comms.registerTarget('lrcurve', async function (comm) {
+      comm.send({ event: 'ready' });
+      for await (const message of comm.messages) {
+        handleCommMessage(comm, message.data);
+      }
+    });
+  }
 })();
@@ -0,0 +1,83 @@
+import sys
+import json
+import zlib
+import base64
+from array import array
+
+encodings = {
+    'json': None,
+    'float64': 'd',
+    'float32': 'f'
+}
+
+def validate_encoding(encoding):
+    if encoding not in encodings:
+        raise ValueError(f'encoding must be one of {", ".join(encodings)}, was {encoding}')
+
+def _encode_buffer(values, typecode):
+    buffer = array(typecode, values)
+    # JavaScript typed arrays use the platform byte order, which in practice
+    # is always little endian.
+    if sys.byteorder == 'big':
+        buffer.byteswap()
+    return base64.b64encode(buffer.tobytes()).decode('ascii')
+
+def encode_columns(columns, encoding):
+    """Encodes a dict mapping each key to an `(x, values)` tuple of buffers,
+    as base64 encoded typed arrays.
+
+    The x values are always encoded as float64, such that large step counts
+    are represented exactly. The y values are encoded using `encoding`,
+    which is either `float64` or `float32`.
+
+    The result is a JSON serializable dict, that `window.appendLearningCurve`
+    decodes directly into a `Float64Array` or `Float32Array`.
+    """
+    return {
+        'encoding': encoding,
+        'columns': {
+            key: [_encode_buffer(xs, 'd'), _encode_buffer(ys, encodings[encoding])]
+            for key, (xs, ys) in columns.items()
+        }
+    }
+
+def compress_payload(data):
+    """Compresses a JSON serializable payload using zlib, and encodes it
+    using base64.
+
+    The result is a JSON serializable dict, that `window.appendLearningCurve`
+    decompresses using a `DecompressionStream`.
+    """
+    compressed = zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'), 9)
+    return {
+        'compression': 'zlib',
+        'payload': base64.b64encode(compressed).decode('ascii')
+    }
+
+def estimate_json_size(data, sample_size=64):
+    """Estimates the length of `json.dumps(data)`, without encoding all of it.
+
+    Dicts, strings and short lists are measured exactly, assuming the strings
+    need no escaping. Lists with more than `sample_size` items are measured
+    from evenly spaced samples, such that the cost doesn't depend on the
+    number of rows.
+    """
+    if isinstance(data, str):
+        return len(data) + 2
+    if isinstance(data, dict):
+        return 2 + 2 * max(0, len(data) - 1) + sum(
+            estimate_json_size(str(key)) + 2 + estimate_json_size(value, sample_size)
+            for key, value in data.items()
+        )
+    if isinstance(data, (list, tuple)):
+        count = len(data)
+        if count > sample_size:
+            sampled = sum(
+                estimate_json_size(data[index * count // sample_size], sample_size)
+                for index in range(sample_size)
+            )
+            items = round(sampled * count / sample_size)
+        else:
+            items = sum(estimate_json_size(item, sample_size) for item in data)
+        return 2 + 2 * max(0, count - 1) + items
+    return len(json.dumps(data))
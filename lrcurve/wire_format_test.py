@@ -0,0 +1,52 @@
+import zlib
+import json
+import base64
+from array import array
+from nose.tools import *
+
+from lrcurve.wire_format import encode_columns, validate_encoding, compress_payload, estimate_json_size
+
+def decode_buffer(encoded, typecode):
+    return array(typecode, base64.b64decode(encoded)).tolist()
+
+def test_encode_float64():
+    payload = encode_columns({
+        'loss': (array('d', [0, 1, 2]), array('d', [0.1, 0.2, 0.3]))
+    }, 'float64')
+
+    assert_equal(payload['encoding'], 'float64')
+    x, y = payload['columns']['loss']
+    assert_equal(decode_buffer(x, 'd'), [0, 1, 2])
+    assert_equal(decode_buffer(y, 'd'), [0.1, 0.2, 0.3])
+
+def test_encode_float32():
+    payload = encode_columns({
+        'loss': (array('d', [0, 1]), array('d', [0.5, 0.25]))
+    }, 'float32')
+
+    x, y = payload['columns']['loss']
+    assert_equal(decode_buffer(x, 'd'), [0, 1])
+    assert_equal(decode_buffer(y, 'f'), [0.5, 0.25])
+
+def test_compress_payload():
+    payload = compress_payload([[0, { 'loss': 1 }]])
+
+    assert_equal(payload['compression'], 'zlib')
+    decompressed = zlib.decompress(base64.b64decode(payload['payload']))
+    assert_equal(json.loads(decompressed), [[0, { 'loss': 1 }]])
+
+@raises(ValueError)
+def test_unknown_encoding():
+    validate_encoding('float16')
+
+def test_estimate_json_size_exact_for_small_data():
+    data = {'encoding': 'float64', 'columns': {'loss': ['AAAA', 'AAAB']}}
+    assert_equal(estimate_json_size(data), len(json.dumps(data)))
+    rows = [[0, {'loss': 0.5, 'acc': None}], [1, {'loss': 0.25}]]
+    assert_equal(estimate_json_size(rows), len(json.dumps(rows)))
+
+def test_estimate_json_size_samples_long_lists():
+    rows = [[i, {'loss': 0.5}] for i in range(10000)]
+    estimate = estimate_json_size(rows, sample_size=16)
+    actual = len(json.dumps(rows))
+    assert_true(abs(estimate - actual) < actual * 0.05)
@@ -0,0 +1,291 @@
+// Removes the unused parts of the d3 modules from the browserify bundle of
+// lrcurve/web_assets/d3.js. The bundle is read from stdin, and the trimmed
+// bundle is written to stdout.
+//
+// The d3 modules are UMD builds, which browserify includes as a whole. Each
+// module is rewritten to only contain the exports that are used, starting
+// from the entry module, and the top-level declarations they reference.
+// Top-level statements that are not declarations, such as the ones adding
+// methods to d3.selection, are always kept. Declarations are assumed to be
+// free of side effects, which the d3 modules guarantee.
+const esprima = require('esprima');
+
+function readStdin() {
+  return new Promise((resolve) => {
+    const chunks = [];
+    process.stdin.on('data', (chunk) => chunks.push(chunk));
+    process.stdin.on('end', () => resolve(Buffer.concat(chunks).toString('utf8')));
+  });
+}
+
+function isRequire(node) {
+  return node && node.type === 'CallExpression' &&
+    node.callee.type === 'Identifier' && node.callee.name === 'require' &&
+    node.arguments.length === 1 && node.arguments[0].type === 'Literal';
+}
+
+// Collects the identifiers a node references. Local variables that shadow
+// a top-level declaration are also counted, which only keeps more code.
+// Members of the dependencies are collected separately.
+function collectReferences(node, dependencies, refs, used) {
+  if (node === null || typeof node !== 'object') return;
+  if (Array.isArray(node)) {
+    for (const child of node) collectReferences(child, dependencies, refs, used);
+    return;
+  }
+
+  switch (node.type) {
+    case 'Identifier':
+      refs.add(node.name);
+      if (dependencies.has(node.name)) {
+        used.set(node.name, null);
+      }
+      return;
+    case 'MemberExpression':
+      if (!node.computed && node.object.type === 'Identifier' &&
+          dependencies.has(node.object.name)) {
+        const members = used.has(node.object.name) ? used.get(node.object.name) : new Set();
+        if (members !== null) {
+          members.add(node.property.name);
+        }
+        used.set(node.object.name, members);
+        return;
+      }
+      collectReferences(node.object, dependencies, refs, used);
+      if (node.computed) collectReferences(node.property, dependencies, refs, used);
+      return;
+    case 'Property':
+    case 'MethodDefinition':
+      if (node.computed) collectReferences(node.key, dependencies, refs, used);
+      collectReferences(node.value, dependencies, refs, used);
+      return;
+    case 'LabeledStatement':
+      collectReferences(node.body, dependencies, refs, used);
+      return;
+    case 'BreakStatement':
+    case 'ContinueStatement':
+      return;
+  }
+
+  for (const key of Object.keys(node)) {
+    if (key === 'type' || key === 'range') continue;
+    collectReferences(node[key], dependencies, refs, used);
+  }
+}
+
+// Splits the top-level statements into declarations, exports, and other
+// statements. Variable declarations are split into one per declarator.
+function parseStatements(source, statements, dependencies) {
+  const parts = [];
+  for (const statement of statements) {
+    const part = { declares: [], exports: null, always: false, refs: new Set(), used: new Map() };
+    if (statement.type === 'FunctionDeclaration' || statement.type === 'ClassDeclaration') {
+      part.declares = [statement.id.name];
+      part.code = source.slice(...statement.range);
+      collectReferences(statement, dependencies, part.refs, part.used);
+    } else if (statement.type === 'VariableDeclaration') {
+      for (const declarator of statement.declarations) {
+        const declaration = {
+          declares: [declarator.id.name], exports: null, always: false,
+          refs: new Set(), used: new Map(),
+          code: `${statement.kind} ${source.slice(...declarator.range)};`
+        };
+        collectReferences(declarator.init, dependencies, declaration.refs, declaration.used);
+        parts.push(declaration);
+      }
+      continue;
+    } else if (statement.type === 'ExpressionStatement' &&
+               statement.expression.type === 'AssignmentExpression' &&
+               statement.expression.left.type === 'MemberExpression' &&
+               !statement.expression.left.computed &&
+               statement.expression.left.object.type === 'Identifier' &&
+               statement.expression.left.object.name === 'exports') {
+      part.exports = statement.expression.left.property.name;
+      part.code = source.slice(...statement.range);
+      collectReferences(statement.expression.right, dependencies, part.refs, part.used);
+    } else {
+      part.always = true;
+      part.code = source.slice(...statement.range);
+      collectReferences(statement, dependencies, part.refs, part.used);
+    }
+    parts.push(part);
+  }
+  return parts;
+}
+
+function parseModule(source, id, fn, deps) {
+  const body = fn.body.body;
+  const umd = body.length === 1 && body[0].type === 'ExpressionStatement' &&
+    body[0].expression.type === 'CallExpression' &&
+    body[0].expression.arguments.length === 2 &&
+    body[0].expression.arguments[1].type === 'FunctionExpression';
+
+  // Maps the local name of each dependency to the module name
+  const dependencies = new Map();
+  let statements = body;
+  let header = '';
+  if (umd) {
+    const factory = body[0].expression.arguments[1];
+    let factoryCall = null;
+    collectCalls(body[0].expression.callee, (call) => {
+      if (factoryCall === null && call.callee.type === 'Identifier' &&
+          call.callee.name === 'factory' && call.arguments.length === factory.params.length) {
+        factoryCall = call;
+      }
+    });
+    factory.params.slice(1).forEach((param, index) => {
+      dependencies.set(param.name, factoryCall.arguments[index + 1].arguments[0].value);
+    });
+    statements = factory.body.body;
+    header = source.slice(fn.body.range[0] + 1, body[0].range[0]).trim();
+  } else {
+    for (const statement of body) {
+      if (statement.type !== 'VariableDeclaration') continue;
+      for (const declarator of statement.declarations) {
+        if (isRequire(declarator.init)) {
+          dependencies.set(declarator.id.name, declarator.init.arguments[0].value);
+        }
+      }
+    }
+  }
+
+  const parts = parseStatements(source, statements, dependencies);
+  if (!umd) {
+    // The entry module is kept as is
+    for (const part of parts) part.always = true;
+  }
+  const code = source.slice(fn.body.range[0] + 1, fn.body.range[1] - 1);
+  return { id, umd, header, code, deps, dependencies, parts, sideEffects: requiredBySideEffect(body) };
+}
+
+function collectCalls(node, callback) {
+  if (node === null || typeof node !== 'object') return;
+  if (Array.isArray(node)) {
+    for (const child of node) collectCalls(child, callback);
+    return;
+  }
+  if (node.type === 'CallExpression') callback(node);
+  for (const key of Object.keys(node)) {
+    if (key === 'type' || key === 'range') continue;
+    collectCalls(node[key], callback);
+  }
+}
+
+function requiredBySideEffect(body) {
+  // `require('d3-transition');` statements, used for their side effects
+  return body
+    .filter((statement) => statement.type === 'ExpressionStatement' && isRequire(statement.expression))
+    .map((statement) => statement.expression.arguments[0].value);
+}
+
+// Returns the parts of a module that are needed for the given exports,
+// where null means all exports.
+function neededParts(module, exports) {
+  const reachable = new Set();
+  const kept = new Set();
+  const keep = (part) => {
+    if (kept.has(part)) return false;
+    kept.add(part);
+    for (const ref of part.refs) reachable.add(ref);
+    return true;
+  };
+
+  for (const part of module.parts) {
+    if (part.always || (part.exports !== null && (exports === null || exports.has(part.exports)))) {
+      keep(part);
+    }
+  }
+  let changed = true;
+  while (changed) {
+    changed = false;
+    for (const part of module.parts) {
+      if (part.declares.some((name) => reachable.has(name)) && keep(part)) {
+        changed = true;
+      }
+    }
+  }
+  return module.parts.filter((part) => kept.has(part));
+}
+
+function mergeExports(current, added) {
+  if (current === null || added === null) return null;
+  return new Set([...current, ...added]);
+}
+
+function sameExports(a, b) {
+  if (a === null || b === null) return a === b;
+  return a.size === b.size && [...a].every((name) => b.has(name));
+}
+
+function trim(source) {
+  const program = esprima.parseScript(source, { range: true });
+  const call = program.body[0].expression;
+  const [modulesNode, , entriesNode] = call.arguments;
+
+  const modules = new Map();
+  for (const property of modulesNode.properties) {
+    const [fn, depsNode] = property.value.elements;
+    const deps = new Map(depsNode.properties.map((dep) => [dep.key.value, dep.value.value]));
+    const id = property.key.value;
+    modules.set(id, parseModule(source, id, fn, deps));
+  }
+
+  // Propagate the used exports from the entry modules, until nothing changes
+  const needed = new Map(entriesNode.elements.map((entry) => [entry.value, new Set()]));
+  let changed = true;
+  while (changed) {
+    changed = false;
+    for (const [id, exports] of [...needed]) {
+      const module = modules.get(id);
+      const uses = new Map(module.sideEffects.map((name) => [module.deps.get(name), new Set()]));
+      for (const part of neededParts(module, exports)) {
+        for (const [local, members] of part.used) {
+          const dep = module.deps.get(module.dependencies.get(local));
+          uses.set(dep, uses.has(dep) ? mergeExports(uses.get(dep), members) : members);
+        }
+      }
+      for (const [dep, members] of uses) {
+        const merged = needed.has(dep) ? mergeExports(needed.get(dep), members) : members;
+        if (!needed.has(dep) || !sameExports(needed.get(dep), merged)) {
+          needed.set(dep, merged);
+          changed = true;
+        }
+      }
+    }
+  }
+
+  const prelude = source.slice(0, modulesNode.range[0]);
+  const entries = source.slice(entriesNode.range[0], entriesNode.range[1]);
+  const output = [];
+  for (const [id, module] of modules) {
+    if (!needed.has(id)) continue;
+    if (!module.umd) {
+      const depsCode = JSON.stringify(Object.fromEntries([...module.deps].sort()));
+      output.push(`${id}:[function(require,module,exports){${module.code}},${depsCode}]`);
+      continue;
+    }
+
+    const parts = neededParts(module, needed.get(id));
+    const lines = [];
+    const deps = new Map();
+    lines.push(module.header, '\'use strict\';');
+    const locals = new Set(parts.flatMap((part) => [...part.used.keys()]));
+    for (const [local, name] of module.dependencies) {
+      if (!locals.has(local)) continue;
+      deps.set(name, module.deps.get(name));
+      lines.push(`var ${local} = require('${name}');`);
+    }
+    for (const name of module.sideEffects) {
+      deps.set(name, module.deps.get(name));
+    }
+    for (const part of parts) {
+      if (part.code === '\'use strict\';') continue;
+      lines.push(part.code);
+    }
+    const depsCode = JSON.stringify(Object.fromEntries([...deps].sort()));
+    output.push(`${id}:[function(require,module,exports){\n${lines.join('\n')}\n\n},${depsCode}]`);
+  }
+  return `${prelude}{${output.join(',')}},{},${entries});\n`;
+}
+
+readStdin().then((source) => process.stdout.write(trim(source)));